@@ -29,7 +29,7 @@ from decimal import Decimal
 from eth_tester.exceptions import TransactionFailed as TestTransactionFailed
 from eth_utils import to_canonical_address, to_checksum_address
 from twisted.logger import Logger
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from web3 import Web3
 from web3.exceptions import ValidationError
 
@@ -66,6 +66,7 @@ from nucypher.blockchain.eth.multisig import Authorization, Proposal
 from nucypher.blockchain.eth.registry import BaseContractRegistry, IndividualAllocationRegistry
 from nucypher.blockchain.eth.signers import KeystoreSigner, Signer, Web3Signer
 from nucypher.blockchain.eth.token import NU, Stake, StakeList, WorkTracker
+from nucypher.blockchain.eth.transactions import PendingTransaction, TransactionPipeline
 from nucypher.blockchain.eth.utils import (
     calculate_period_duration,
     datetime_at_period,
@@ -438,6 +439,35 @@ class ContractAdministrator(NucypherTokenActor):
             click.confirm("Continue with the allocations process?", abort=True)
 
         batch_deposit_receipts, failed = dict(), False
+
+        # Batches are independent of each other, so when nobody needs to review them one by one,
+        # they are broadcast back to back and their receipts collected at the end.
+        pipeline, submitted_batches = None, list()
+        if not interactive:
+            pipeline = TransactionPipeline(blockchain=BlockchainInterfaceFactory.get_interface(),
+                                           sender_address=self.deployer_address)
+
+        def record_batch(deposited_stakers: List[str], receipt: dict, bar) -> None:
+            number_of_deposits = len(deposited_stakers)
+            if emitter:
+                emitter.echo(f"\nDeployed allocations for {number_of_deposits} stakers:")
+                for staker in deposited_stakers:
+                    emitter.echo(f"\t{staker}")
+                emitter.echo()
+                bar._last_line = None
+                bar.render_progress()
+
+            bar.update(number_of_deposits)
+
+            if emitter:
+                emitter.echo()
+                paint_receipt_summary(emitter=emitter,
+                                      receipt=receipt,
+                                      chain_name=chain_name,
+                                      transaction_type=f'batch_deposit_{number_of_deposits}_stakers')
+
+            batch_deposit_receipts.update({staker: {'batch_deposit': receipt} for staker in deposited_stakers})
+
         with click.progressbar(length=len(allocator.allocations),
                                label="Allocation progress",
                                show_eta=False) as bar:
@@ -448,41 +478,44 @@ class ContractAdministrator(NucypherTokenActor):
 
                 try:
                     deposited_stakers, receipt = allocator.deposit_next_batch(sender_address=self.deployer_address,
-                                                                              gas_limit=gas_limit)
-                except (TestTransactionFailed, ValidationError, ValueError):  # TODO: 1950
+                                                                              gas_limit=gas_limit,
+                                                                              pipeline=pipeline)
+                except (TestTransactionFailed, ValidationError, ValueError,  # TODO: 1950
+                        TransactionPipeline.PipelineStalled):  # The batches already broadcast are still waited for below
                     if emitter:
                         emitter.echo(f"\nFailed to deploy next batch. These addresses weren't funded:", color="yellow")
                         for staker in allocator.pending_deposits:
                             emitter.echo(f"\t{staker}", color="yellow")
                         emitter.echo(f"\nThe failure is caused by the following exception:")
-
-                    for line in traceback.format_exception(*sys.exc_info()):
-                        emitter.echo(line, color='red')
+                        for line in traceback.format_exception(*sys.exc_info()):
+                            emitter.echo(line, color='red')
                     failed = True
                 else:
-                    number_of_deposits = len(deposited_stakers)
-                    if emitter:
-                        emitter.echo(f"\nDeployed allocations for {number_of_deposits} stakers:")
-                        for staker in deposited_stakers:
-                            emitter.echo(f"\t{staker}")
-                        emitter.echo()
-                        bar._last_line = None
-                        bar.render_progress()
+                    if pipeline:
+                        submitted_batches.append((deposited_stakers, receipt))
+                        continue
 
-                    bar.update(number_of_deposits)
-
-                    if emitter:
-                        emitter.echo()
-                        paint_receipt_summary(emitter=emitter,
-                                              receipt=receipt,
-                                              chain_name=chain_name,
-                                              transaction_type=f'batch_deposit_{number_of_deposits}_stakers')
-
-                    batch_deposit_receipts.update({staker: {'batch_deposit': receipt} for staker in deposited_stakers})
+                    record_batch(deposited_stakers=deposited_stakers, receipt=receipt, bar=bar)
 
                     if interactive:
                         click.pause(info=f"\nPress any key to continue with next batch of allocations")
 
+            if pipeline:
+                try:
+                    pipeline.wait()
+                except TransactionPipeline.TransactionsFailed as error:
+                    if emitter:
+                        emitter.echo(f"\n{error}", color='red')
+                for deposited_stakers, pending_transaction in submitted_batches:
+                    if pending_transaction.receipt is not None:
+                        record_batch(deposited_stakers=deposited_stakers, receipt=pending_transaction.receipt, bar=bar)
+                        continue
+                    allocator.deposited.difference_update(deposited_stakers)
+                    if emitter:
+                        emitter.echo(f"\nFailed to deploy batch. These addresses weren't funded:", color="yellow")
+                        for staker in deposited_stakers:
+                            emitter.echo(f"\t{staker}", color="yellow")
+
         return batch_deposit_receipts
 
     def save_deployment_receipts(self, receipts: dict, filename_prefix: str = 'deployment') -> str:
@@ -606,8 +639,14 @@ class Allocator:
 
     def deposit_next_batch(self,
                            sender_address: str,
-                           gas_limit: int = None) -> Tuple[List[str], dict]:
-
+                           gas_limit: int = None,
+                           pipeline: TransactionPipeline = None
+                           ) -> Tuple[List[str], Union[dict, PendingTransaction]]:
+        """
+        Deposits the largest batch of pending allocations that fits in a single transaction.
+        If a pipeline is given, the batch is submitted through it instead of waiting for the receipt,
+        and the returned PendingTransaction will hold the receipt once it is mined.
+        """
         pending_stakers = self.pending_deposits
 
         self.log.debug(f"Constructing next batch. "
@@ -645,7 +684,8 @@ class Allocator:
         batch_parameters = self.staking_agent.construct_batch_deposit_parameters(deposits=last_good_batch)
         receipt = self.staking_agent.batch_deposit(*batch_parameters,
                                                    sender_address=sender_address,
-                                                   gas_limit=gas_limit)
+                                                   gas_limit=gas_limit,
+                                                   pipeline=pipeline)
 
         deposited_stakers = list(last_good_batch.keys())
         self.deposited.update(deposited_stakers)
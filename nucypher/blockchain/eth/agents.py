@@ -16,6 +16,10 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import random
+from bisect import bisect_right
+from functools import partial
+from itertools import accumulate
+from threading import Lock
 
 import math
 import sys
@@ -30,10 +34,12 @@ from eth_typing.evm import ChecksumAddress
 from eth_utils.address import to_checksum_address
 from hexbytes.main import HexBytes
 from twisted.logger import Logger  # type: ignore
-from typing import Dict, Iterable, List, Tuple, Type, Union, Any, Optional, cast
+from typing import Dict, Iterable, List, Set, Tuple, Type, Union, Any, Optional, cast
 from web3.contract import Contract, ContractFunction
 from web3.types import Wei, Timestamp, TxReceipt, TxParams, Nonce
 
+from nucypher.blockchain.eth.batch import BatchedContractReader
+from nucypher.blockchain.eth.cache import ContractReadCache
 from nucypher.blockchain.eth.constants import (
     ADJUDICATOR_CONTRACT_NAME,
     DISPATCHER_CONTRACT_NAME,
@@ -52,6 +58,7 @@ from nucypher.blockchain.eth.decorators import contract_api, validate_checksum_a
 from nucypher.blockchain.eth.events import ContractEvents
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory, VersionedContract
 from nucypher.blockchain.eth.registry import AllocationRegistry, BaseContractRegistry
+from nucypher.blockchain.eth.transactions import PendingTransaction, TransactionPipeline
 from nucypher.blockchain.eth.utils import epoch_to_period
 from nucypher.crypto.api import sha256_digest
 from nucypher.types import (
@@ -83,6 +90,9 @@ class EthereumContractAgent:
     DEFAULT_TRANSACTION_GAS_LIMITS: Dict[str, Optional[Wei]]
     DEFAULT_TRANSACTION_GAS_LIMITS = {'default': None}
 
+    # Opt-in cache for the results of contract calls; See `enable_read_cache`
+    read_cache: Optional[ContractReadCache] = None
+
     class ContractNotDeployed(Exception):
         """Raised when attempting to access a contract that is not deployed on the current network."""
 
@@ -113,6 +123,7 @@ class EthereumContractAgent:
 
         self.__contract = contract
         self.events = ContractEvents(contract)
+        self.batch_reader = BatchedContractReader(blockchain=self.blockchain)
         if not transaction_gas:
             transaction_gas = EthereumContractAgent.DEFAULT_TRANSACTION_GAS_LIMITS['default']
         self.transaction_gas = transaction_gas
@@ -123,6 +134,19 @@ class EthereumContractAgent:
                                                                         self.blockchain.provider_uri,
                                                                         self.registry))
 
+    def enable_read_cache(self, read_cache: Optional[ContractReadCache] = None, **options) -> ContractReadCache:
+        """
+        Caches the results of this agent's contract calls until a new block is seen.
+        The same cache can be shared by several agents.
+        """
+        if read_cache is None:
+            read_cache = ContractReadCache(blockchain=self.blockchain, **options)
+        self.read_cache = read_cache
+        return read_cache
+
+    def disable_read_cache(self) -> None:
+        self.read_cache = None
+
     def __repr__(self) -> str:
         class_name = self.__class__.__name__
         r = "{}(registry={}, contract={})"
@@ -212,6 +236,64 @@ class NucypherTokenAgent(EthereumContractAgent):
         return approve_and_call_receipt
 
 
+class StakeDistribution:
+    """
+    The locked tokens of a set of stakers, laid out in a line as a cumulative sum
+    so that stake-weighted points can be resolved to stakers with a binary search.
+    """
+
+    def __init__(self, stakers_map: Dict[ChecksumAddress, NuNits]):
+        self.stakers = list(stakers_map)
+        self.cumulative_stakes = list(accumulate(stakers_map.values()))
+        self.total_stake = self.cumulative_stakes[-1] if self.cumulative_stakes else 0
+
+    def __len__(self) -> int:
+        return len(self.stakers)
+
+    def staker_at(self, point: int) -> ChecksumAddress:
+        """Returns the staker whose stake contains `point`, which must be in [0, total_stake)."""
+        return self.stakers[bisect_right(self.cumulative_stakes, point)]
+
+    def draw(self, quantity: int, rng: random.Random) -> Set[ChecksumAddress]:
+        """Draws `quantity` stake-weighted points, returning the distinct stakers they land on."""
+        return {self.staker_at(rng.randrange(self.total_stake)) for _ in range(quantity)}
+
+
+class LockedTokensProjection:
+    """
+    The tokens that active stakers will have locked in each of the next `horizon` periods,
+    built from a single snapshot of their substakes.  Each substake adds its value over the
+    interval of periods it covers, and a running sum over the interval boundaries yields
+    the whole time series at once.
+    """
+
+    def __init__(self, current_period: Period, substakes: Iterable[SubStakeInfo], horizon: int):
+        if horizon < 0:
+            raise ValueError(f"Horizon must not be negative, got {horizon}")
+        self.current_period = current_period
+        self.horizon = horizon
+
+        deltas = [0] * (horizon + 2)
+        for first_period, last_period, locked_value in substakes:
+            start = max(0, first_period - current_period)
+            end = min(horizon, last_period - current_period)
+            if start <= end:
+                deltas[start] += locked_value
+                deltas[end + 1] -= locked_value
+        self.__locked_tokens = list(accumulate(deltas[:-1]))
+
+    def locked_tokens(self, periods: int) -> NuNits:
+        """Returns the tokens locked `periods` periods after the current one, like `get_all_locked_tokens`."""
+        if not 0 <= periods <= self.horizon:
+            raise ValueError(f"Periods must be between 0 and {self.horizon}, got {periods}")
+        return NuNits(self.__locked_tokens[periods])
+
+    def time_series(self, start: int = 1, end: Optional[int] = None) -> Dict[int, NuNits]:
+        """Maps each number of periods in [start, end] to the tokens locked by then."""
+        end = self.horizon if end is None else end
+        return {periods: self.locked_tokens(periods) for periods in range(start, end + 1)}
+
+
 class StakingEscrowAgent(EthereumContractAgent):
 
     contract_name: str = STAKING_ESCROW_CONTRACT_NAME
@@ -229,6 +311,12 @@ class StakingEscrowAgent(EthereumContractAgent):
     class NotEnoughStakers(Exception):
         """Raised when the are not enough stakers available to complete an operation"""
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__stake_distributions = dict()  # type: Dict[int, StakeDistribution]
+        self.__stake_distributions_period = None  # type: Optional[int]
+        self.__stake_distributions_lock = Lock()
+
     #
     # Staker Network Status
     #
@@ -247,7 +335,7 @@ class StakingEscrowAgent(EthereumContractAgent):
     def get_stakers(self) -> List[ChecksumAddress]:
         """Returns a list of stakers"""
         num_stakers: int = self.get_staker_population()
-        stakers: List[ChecksumAddress] = [self.contract.functions.stakers(i).call() for i in range(num_stakers)]
+        stakers: List[ChecksumAddress] = self.batch_reader.call(self.contract.functions.stakers(i) for i in range(num_stakers))
         return stakers
 
     @contract_api(CONTRACT_CALL)
@@ -259,15 +347,15 @@ class StakingEscrowAgent(EthereumContractAgent):
         The third contains stakers that have missed commitments before current period
         """
 
-        num_stakers: int = self.get_staker_population()
+        stakers: List[ChecksumAddress] = self.get_stakers()
         current_period: Period = self.get_current_period()
         active_stakers: List[ChecksumAddress] = list()
         pending_stakers: List[ChecksumAddress] = list()
         missing_stakers: List[ChecksumAddress] = list()
 
-        for i in range(num_stakers):
-            staker = self.contract.functions.stakers(i).call()
-            last_committed_period = self.get_last_committed_period(staker)
+        last_committed_periods: List[int] = self.batch_reader.call(self.contract.functions.getLastCommittedPeriod(staker)
+                                                                   for staker in stakers)
+        for staker, last_committed_period in zip(stakers, last_committed_periods):
             if last_committed_period == current_period + 1:
                 active_stakers.append(staker)
             elif last_committed_period == current_period:
@@ -318,6 +406,36 @@ class StakingEscrowAgent(EthereumContractAgent):
         all_locked_tokens, _stakers = self.get_all_active_stakers(periods=periods, pagination_size=pagination_size)
         return all_locked_tokens
 
+    @contract_api(CONTRACT_CALL)
+    def get_locked_tokens_projection(self, periods: int) -> LockedTokensProjection:
+        """
+        Returns the locked tokens of active stakers for each of the next `periods` periods,
+        reading every substake once (all at the same block) instead of scanning all stakers per period.
+        """
+        if not periods > 0:
+            raise ValueError("Period must be > 0")
+
+        functions = self.contract.functions
+        block_number = self.blockchain.client.block_number
+        read = partial(self.batch_reader.call, block_identifier=block_number)
+
+        current_period, num_stakers = read([functions.getCurrentPeriod(), functions.getStakersLength()])
+        stakers = read(functions.stakers(index) for index in range(num_stakers))
+
+        # Same criteria as getActiveStakers: only stakers committed to the current period count.
+        infos = read(functions.stakerInfo(staker) for staker in stakers)
+        active_stakers = [staker for staker, info in zip(stakers, infos)
+                          if current_period in (info[1], info[2])]  # current and next committed periods
+
+        lengths = read(functions.getSubStakesLength(staker) for staker in active_stakers)
+        indices = [(staker, index) for staker, length in zip(active_stakers, lengths) for index in range(length)]
+        raw_substakes = read(functions.getSubStakeInfo(staker, index) for staker, index in indices)
+        last_periods = read(functions.getLastPeriodOfSubStake(staker, index) for staker, index in indices)
+
+        substakes = (SubStakeInfo(first_period, last_period, locked_value)
+                     for (first_period, *_others, locked_value), last_period in zip(raw_substakes, last_periods))
+        return LockedTokensProjection(current_period=current_period, substakes=substakes, horizon=periods)
+
     #
     # StakingEscrow Contract API
     #
@@ -435,8 +553,9 @@ class StakingEscrowAgent(EthereumContractAgent):
                       lock_periods: List[PeriodDelta],
                       sender_address: ChecksumAddress,
                       dry_run: bool = False,
-                      gas_limit: Optional[Wei] = None
-                      ) -> Union[TxReceipt, Wei]:
+                      gas_limit: Optional[Wei] = None,
+                      pipeline: Optional[TransactionPipeline] = None
+                      ) -> Union[TxReceipt, Wei, PendingTransaction]:
 
         min_gas_batch_deposit: Wei = Wei(250_000)  # TODO: move elsewhere?
         if gas_limit and gas_limit < min_gas_batch_deposit:
@@ -451,6 +570,8 @@ class StakingEscrowAgent(EthereumContractAgent):
             if gas_limit and estimated_gas > gas_limit:
                 raise ValueError(f"Estimated gas for transaction exceeds gas limit {gas_limit}")
             return estimated_gas
+        elif pipeline:
+            return pipeline.submit(contract_function=contract_function, transaction_gas_limit=gas_limit)
         else:
             receipt = self.blockchain.send_transaction(contract_function=contract_function,
                                                        sender_address=sender_address,
@@ -676,11 +797,10 @@ class StakingEscrowAgent(EthereumContractAgent):
         Returns an iterator of all staker addresses via cumulative sum, on-network.
         Staker addresses are returned in the order in which they registered with the StakingEscrow contract's ledger
         """
-        for index in range(self.get_staker_population()):
-            staker_address: ChecksumAddress = self.contract.functions.stakers(index).call()
+        for staker_address in self.get_stakers():
             yield staker_address
 
-    @contract_api(CONTRACT_CALL)
+    @contract_api(CONTRACT_CALL, cacheable=False)  # Random
     def sample(self,
                quantity: int,
                duration: int,
@@ -711,38 +831,71 @@ class StakingEscrowAgent(EthereumContractAgent):
         Only stakers which made a commitment to the current period (in the previous period) are used.
         """
 
-        system_random = random.SystemRandom()
-        n_tokens, stakers_map = self.get_all_active_stakers(periods=duration, pagination_size=pagination_size)
-        if n_tokens == 0:
+        distribution = self.get_stake_distribution(duration=duration, pagination_size=pagination_size)
+        return self._sample_from_distribution(distribution=distribution,
+                                              duration=duration,
+                                              quantity=quantity,
+                                              additional_ursulas=additional_ursulas,
+                                              attempts=attempts)
+
+    def sample_many(self,
+                    quantities: Iterable[int],
+                    duration: int,
+                    additional_ursulas: float = 1.5,
+                    attempts: int = 5,
+                    pagination_size: Optional[int] = None
+                    ) -> List[List[ChecksumAddress]]:
+        """
+        Like `sample`, but selects stakers for several policies (one per entry in `quantities`)
+        out of a single look at the stake distribution.
+        """
+        distribution = self.get_stake_distribution(duration=duration, pagination_size=pagination_size)
+        return [self._sample_from_distribution(distribution=distribution,
+                                               duration=duration,
+                                               quantity=quantity,
+                                               additional_ursulas=additional_ursulas,
+                                               attempts=attempts)
+                for quantity in quantities]
+
+    def get_stake_distribution(self, duration: int, pagination_size: Optional[int] = None) -> StakeDistribution:
+        """
+        Returns the distribution of tokens locked for at least `duration` periods by active stakers.
+        Since only stakers who committed to the current period are active, distributions
+        are kept until the period changes.
+        """
+        current_period = self.get_current_period()
+        with self.__stake_distributions_lock:
+            if self.__stake_distributions_period != current_period:
+                self.__stake_distributions.clear()
+                self.__stake_distributions_period = current_period
+            try:
+                return self.__stake_distributions[duration]
+            except KeyError:
+                pass
+
+        _n_tokens, stakers_map = self.get_all_active_stakers(periods=duration, pagination_size=pagination_size)
+        distribution = StakeDistribution(stakers_map)
+        with self.__stake_distributions_lock:
+            if self.__stake_distributions_period == current_period:
+                self.__stake_distributions[duration] = distribution
+        return distribution
+
+    def _sample_from_distribution(self,
+                                  distribution: StakeDistribution,
+                                  duration: int,
+                                  quantity: int,
+                                  additional_ursulas: float,
+                                  attempts: int
+                                  ) -> List[ChecksumAddress]:
+        if distribution.total_stake == 0:
             raise self.NotEnoughStakers('There are no locked tokens for duration {}.'.format(duration))
 
+        system_random = random.SystemRandom()
         sample_size = quantity
         for _ in range(attempts):
             sample_size = math.ceil(sample_size * additional_ursulas)
-            points = sorted(system_random.randrange(n_tokens) for _ in range(sample_size))
-            self.log.debug(f"Sampling {sample_size} stakers with random points: {points}")
-
-            addresses = set()
-            stakers = list(stakers_map.items())
-
-            point_index = 0
-            sum_of_locked_tokens = 0
-            staker_index = 0
-            stakers_len = len(stakers)
-            while staker_index < stakers_len and point_index < sample_size:
-                current_staker = stakers[staker_index][0]
-                staker_tokens = stakers[staker_index][1]
-                next_sum_value = sum_of_locked_tokens + staker_tokens
-
-                point = points[point_index]
-                if sum_of_locked_tokens <= point < next_sum_value:
-                    addresses.add(to_checksum_address(current_staker))
-                    point_index += 1
-                else:
-                    staker_index += 1
-                    sum_of_locked_tokens = next_sum_value
-
-            self.log.debug(f"Sampled {len(addresses)} stakers: {list(addresses)}")
+            addresses = distribution.draw(quantity=sample_size, rng=system_random)
+            self.log.debug(f"Sampled {len(addresses)} stakers with {sample_size} random points: {list(addresses)}")
             if len(addresses) >= quantity:
                 return system_random.sample(addresses, quantity)
 
@@ -1388,7 +1541,7 @@ class WorkLockAgent(EthereumContractAgent):
     def get_bidders(self) -> List[ChecksumAddress]:
         """Returns a list of bidders"""
         num_bidders: int = self.get_bidders_population()
-        bidders: List[ChecksumAddress] = [self.contract.functions.bidders(i).call() for i in range(num_bidders)]
+        bidders: List[ChecksumAddress] = self.batch_reader.call(self.contract.functions.bidders(i) for i in range(num_bidders))
         return bidders
 
     @contract_api(CONTRACT_CALL)
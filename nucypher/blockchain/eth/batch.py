@@ -0,0 +1,116 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+import requests
+from eth_typing import BlockNumber
+from hexbytes import HexBytes
+from twisted.logger import Logger
+from typing import Any, Iterable, List, Optional
+from web3 import HTTPProvider
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import ContractFunction
+from web3.exceptions import BadFunctionCallOutput
+
+from nucypher.blockchain.eth.interfaces import BlockchainInterface
+
+
+class BatchedContractReader:
+    """
+    Reads the results of many contract function calls at once, all against the same block.
+
+    Over HTTP, calls are sent as JSON-RPC batches of `chunk_size` eth_calls, with up to `concurrency`
+    batches in flight at a time.  Other providers don't support batches, so calls are made one by one.
+    """
+
+    DEFAULT_CHUNK_SIZE = 100
+    DEFAULT_CONCURRENCY = 4
+
+    class BatchRequestFailed(RuntimeError):
+        """Raised when a JSON-RPC batch request is answered with something other than a batch of results."""
+
+    def __init__(self,
+                 blockchain: BlockchainInterface,
+                 chunk_size: Optional[int] = None,
+                 concurrency: Optional[int] = None):
+        self.log = Logger(self.__class__.__name__)
+        self.blockchain = blockchain
+        self.chunk_size = chunk_size or self.DEFAULT_CHUNK_SIZE
+        self.concurrency = concurrency or self.DEFAULT_CONCURRENCY
+
+    def call(self,
+             contract_functions: Iterable[ContractFunction],
+             block_identifier: Optional[BlockNumber] = None
+             ) -> List[Any]:
+        """Returns the results of calling each of `contract_functions`, in order."""
+        contract_functions = list(contract_functions)
+        if not contract_functions:
+            return list()
+
+        if block_identifier is None:
+            block_identifier = self.blockchain.client.block_number
+
+        provider = self.blockchain.provider
+        if not isinstance(provider, HTTPProvider):
+            return [function.call(block_identifier=block_identifier) for function in contract_functions]
+
+        chunks = [contract_functions[i:i + self.chunk_size] for i in range(0, len(contract_functions), self.chunk_size)]
+        self.log.debug(f"Reading {len(contract_functions)} contract calls in {len(chunks)} batches at block {block_identifier}")
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(chunks))) as executor:
+            results = executor.map(lambda chunk: self._call_batch(provider, chunk, block_identifier), chunks)
+            return list(chain.from_iterable(results))
+
+    def _call_batch(self,
+                    provider: HTTPProvider,
+                    contract_functions: List[ContractFunction],
+                    block_identifier: BlockNumber
+                    ) -> List[Any]:
+        batch = [{'jsonrpc': '2.0',
+                  'id': request_id,
+                  'method': 'eth_call',
+                  'params': [{'to': function.address, 'data': function._encode_transaction_data()},
+                             hex(block_identifier)]}
+                 for request_id, function in enumerate(contract_functions)]
+
+        response = requests.post(provider.endpoint_uri, json=batch, **dict(provider.get_request_kwargs()))
+        response.raise_for_status()
+        responses = response.json()
+        if not isinstance(responses, list) or len(responses) != len(batch):
+            raise self.BatchRequestFailed(f"Unexpected response to a batch of {len(batch)} calls: {responses}")
+
+        results = list()
+        for function, rpc_response in zip(contract_functions, sorted(responses, key=lambda r: r['id'])):
+            if 'error' in rpc_response:
+                raise ValueError(rpc_response['error'])  # Like web3 does
+            results.append(self._decode_result(function, HexBytes(rpc_response['result'])))
+        return results
+
+    @staticmethod
+    def _decode_result(function: ContractFunction, return_data: HexBytes) -> Any:
+        """Decodes an eth_call result the way ContractFunction.call does."""
+        output_types = get_abi_output_types(function.abi)
+        if output_types and not return_data:
+            raise BadFunctionCallOutput(f"Could not decode the output of {function.fn_name} at {function.address}")
+        output_data = function.web3.codec.decode_abi(output_types, return_data)
+        normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+        if len(normalized_data) == 1:
+            return normalized_data[0]
+        return normalized_data
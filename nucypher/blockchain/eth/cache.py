@@ -0,0 +1,104 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import time
+from collections import OrderedDict
+from threading import Lock
+
+from typing import Any, Callable, Hashable
+
+from nucypher.blockchain.eth.interfaces import BlockchainInterface
+
+
+class ContractReadCache:
+    """
+    A bounded cache for the results of contract calls, valid for a single block.
+
+    The latest block number is polled at most every `block_poll_interval` seconds;
+    when a new block is seen, everything cached so far is dropped.  Entries also expire
+    after `ttl` seconds, and the least recently used ones are evicted beyond `max_entries`.
+
+    Cached values are shared by every caller, so they must not be modified.
+    """
+
+    DEFAULT_MAX_ENTRIES = 1024
+    DEFAULT_TTL = 15  # seconds, about one mainnet block
+    DEFAULT_BLOCK_POLL_INTERVAL = 1  # seconds
+
+    def __init__(self,
+                 blockchain: BlockchainInterface,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: float = DEFAULT_TTL,
+                 block_poll_interval: float = DEFAULT_BLOCK_POLL_INTERVAL):
+        self.blockchain = blockchain
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.block_poll_interval = block_poll_interval
+
+        self.hits = 0
+        self.misses = 0
+        self.block_number = None
+        self._last_block_poll = None
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+
+    def _check_block(self, now: float) -> None:
+        if self._last_block_poll is not None and now - self._last_block_poll < self.block_poll_interval:
+            return
+        block_number = self.blockchain.client.block_number
+        with self.__lock:
+            self._last_block_poll = now
+            if block_number != self.block_number:
+                self.__entries.clear()
+                self.block_number = block_number
+
+    def get_or_call(self, key: Hashable, call: Callable[[], Any]) -> Any:
+        """Returns the cached result for `key` in the latest block, calling `call` to get it if needed."""
+        now = time.monotonic()
+        self._check_block(now=now)
+
+        with self.__lock:
+            try:
+                cached_at, value = self.__entries[key]
+            except KeyError:
+                pass
+            else:
+                if now - cached_at < self.ttl:
+                    self.__entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self.__entries[key]
+            self.misses += 1
+            block_number = self.block_number
+
+        value = call()
+
+        with self.__lock:
+            if self.block_number == block_number:  # Don't cache results from a block that's been superseded
+                self.__entries[key] = (now, value)
+                self.__entries.move_to_end(key)
+                while len(self.__entries) > self.max_entries:
+                    self.__entries.popitem(last=False)
+        return value
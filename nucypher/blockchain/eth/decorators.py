@@ -135,7 +135,7 @@ def save_receipt(actor_method) -> Callable:
 COLLECT_CONTRACT_API = True
 
 
-def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTERFACE) -> Callable:
+def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTERFACE, cacheable: bool = True) -> Callable:
     """Decorator factory for contract API markers"""
 
     def decorator(agent_method: Callable) -> Callable[..., ContractReturnValue]:
@@ -146,10 +146,45 @@ def contract_api(interface: Optional[ContractInterfaces] = UNKNOWN_CONTRACT_INTE
         If `COLLECT_CONTRACT_API` is True when running tests,
         all marked methods will be collected for automatic mocking
         and integration with pytest fixtures.
+
+        If the agent has a `read_cache`, the results of `cacheable` contract calls
+        are cached in it, and it is cleared after transactions.
         """
         if COLLECT_CONTRACT_API:
             agent_method.contract_api = interface
+        returns_generator = inspect.isgeneratorfunction(agent_method)
         agent_method = validate_checksum_address(func=agent_method)
+        if interface is CONTRACT_CALL and cacheable and not returns_generator:
+            agent_method = _cache_contract_reads(agent_method)
+        elif interface is TRANSACTION:
+            agent_method = _clear_contract_reads(agent_method)
         return agent_method
 
     return decorator
+
+
+def _cache_contract_reads(agent_method: Callable) -> Callable:
+    @functools.wraps(agent_method)
+    def wrapped(agent, *args, **kwargs):
+        read_cache = getattr(agent, 'read_cache', None)
+        if read_cache is None:
+            return agent_method(agent, *args, **kwargs)
+        key = (agent.contract_address, agent_method.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:  # Unhashable arguments; don't bother
+            return agent_method(agent, *args, **kwargs)
+        return read_cache.get_or_call(key, lambda: agent_method(agent, *args, **kwargs))
+    return wrapped
+
+
+def _clear_contract_reads(agent_method: Callable) -> Callable:
+    @functools.wraps(agent_method)
+    def wrapped(agent, *args, **kwargs):
+        try:
+            return agent_method(agent, *args, **kwargs)
+        finally:
+            read_cache = getattr(agent, 'read_cache', None)
+            if read_cache is not None:
+                read_cache.clear()
+    return wrapped
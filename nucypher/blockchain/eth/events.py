@@ -14,6 +14,15 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import json
+import sqlite3
+from threading import Lock
+
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
+from twisted.logger import Logger
+from typing import Any, Iterable, Iterator, Optional, Tuple
+from web3._utils.events import get_event_data
 from web3.contract import Contract
 
 from nucypher.blockchain.eth.interfaces import BlockchainInterfaceFactory
@@ -77,3 +86,205 @@ class ContractEvents:
     def __iter__(self):
         for event_name in self.names:
             yield self[event_name]
+
+
+class IndexedEventRecord:
+    """An event read back from an EventIndex."""
+
+    def __init__(self, contract_name: str, event_name: str, block_number: int, transaction_hash: str, args: dict):
+        self.contract_name = contract_name
+        self.event_name = event_name
+        self.block_number = block_number
+        self.transaction_hash = transaction_hash
+        self.args = args
+
+    def __repr__(self):
+        pairs_to_show = dict(self.args.items())
+        pairs_to_show['block_number'] = self.block_number
+        event_str = ", ".join(f"{k}: {v}" for k, v in pairs_to_show.items())
+        r = f"({self.__class__.__name__}) {event_str}"
+        return r
+
+
+class EventIndex:
+    """
+    A local SQLite index of decoded contract events.
+
+    `sync` tails each contract's logs from where it last left off (or from the genesis block)
+    up to the latest block, minus `confirmations`, and the indexed events can then be queried
+    by contract, event name, block range and argument values without going back to the chain.
+
+    Events and checkpoints are kept per chain ID, contract address and contract name, so an index
+    file reused on another network, or after a contract is redeployed, starts that contract afresh.
+    Blocks within `confirmations` of the head are left for a later sync, so that a reorg there
+    doesn't leave orphaned events behind.
+    """
+
+    DEFAULT_FILENAME = 'events.sqlite'
+    DEFAULT_BLOCK_CHUNK_SIZE = 10_000
+    DEFAULT_CONFIRMATIONS = 12
+
+    _SCHEMA_VERSION = 1
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY,
+            chain_id INTEGER NOT NULL,
+            contract_address TEXT NOT NULL,
+            contract_name TEXT NOT NULL,
+            event_name TEXT NOT NULL,
+            block_number INTEGER NOT NULL,
+            transaction_hash TEXT NOT NULL,
+            log_index INTEGER NOT NULL,
+            args TEXT NOT NULL,
+            UNIQUE (chain_id, transaction_hash, log_index)
+        );
+        CREATE INDEX IF NOT EXISTS events_by_name
+            ON events (chain_id, contract_address, contract_name, event_name, block_number);
+        CREATE TABLE IF NOT EXISTS event_args (
+            event_id INTEGER NOT NULL REFERENCES events (id),
+            name TEXT NOT NULL,
+            value TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS event_args_by_value ON event_args (name, value, event_id);
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            chain_id INTEGER NOT NULL,
+            contract_address TEXT NOT NULL,
+            contract_name TEXT NOT NULL,
+            block_number INTEGER NOT NULL,
+            PRIMARY KEY (chain_id, contract_address, contract_name)
+        );
+    """
+
+    def __init__(self,
+                 filepath: str = ':memory:',
+                 confirmations: int = DEFAULT_CONFIRMATIONS,
+                 block_chunk_size: int = DEFAULT_BLOCK_CHUNK_SIZE):
+        self.log = Logger(self.__class__.__name__)
+        self.filepath = filepath
+        self.confirmations = confirmations
+        self.block_chunk_size = block_chunk_size
+        self.__db = sqlite3.connect(filepath, check_same_thread=False)
+        self.__create_schema()
+        self.__lock = Lock()
+
+    def __create_schema(self) -> None:
+        schema_version, = self.__db.execute("PRAGMA user_version").fetchone()
+        if schema_version != self._SCHEMA_VERSION:
+            # The index only caches what's on chain; an index in an older layout is rebuilt from scratch.
+            with self.__db:
+                self.__db.executescript("DROP TABLE IF EXISTS event_args; "
+                                        "DROP TABLE IF EXISTS events; "
+                                        "DROP TABLE IF EXISTS checkpoints;")
+        self.__db.executescript(self._SCHEMA)
+        self.__db.execute(f"PRAGMA user_version = {self._SCHEMA_VERSION}")
+
+    def close(self) -> None:
+        self.__db.close()
+
+    @staticmethod
+    def _serialize_value(value: Any) -> Any:
+        if isinstance(value, bytes):
+            return HexBytes(value).hex()
+        if isinstance(value, (list, tuple)):
+            return [EventIndex._serialize_value(v) for v in value]
+        return value
+
+    @staticmethod
+    def _contract_key(agent: 'EthereumContractAgent') -> Tuple[int, str, str]:
+        return agent.blockchain.client.chain_id, agent.contract_address, agent.contract_name
+
+    def checkpoint(self, agent: 'EthereumContractAgent') -> Optional[int]:
+        """Returns the last block indexed for the agent's contract, if any."""
+        with self.__lock:
+            row = self.__db.execute("SELECT block_number FROM checkpoints "
+                                    "WHERE chain_id = ? AND contract_address = ? AND contract_name = ?",
+                                    self._contract_key(agent)).fetchone()
+        return row[0] if row else None
+
+    def sync(self, agents: Iterable['EthereumContractAgent'], to_block: Optional[int] = None) -> int:
+        """Indexes all new events emitted by the agents' contracts. Returns the number of events indexed."""
+        indexed = 0
+        for agent in agents:
+            blockchain = agent.blockchain
+            latest_block = blockchain.client.block_number - self.confirmations
+            if to_block is not None:
+                latest_block = min(to_block, latest_block)
+
+            contract_key = self._contract_key(agent)
+            contract_name = agent.contract_name
+            checkpoint = self.checkpoint(agent)
+            from_block = 0 if checkpoint is None else checkpoint + 1
+            events_by_topic = {event_abi_to_log_topic(abi): abi for abi in agent.contract.abi if abi['type'] == 'event'}
+
+            while from_block <= latest_block:
+                chunk_end = min(from_block + self.block_chunk_size - 1, latest_block)
+                logs = blockchain.client.w3.eth.getLogs({'address': agent.contract_address,
+                                                         'fromBlock': from_block,
+                                                         'toBlock': chunk_end})
+                events = list()
+                for log in logs:
+                    if not log['topics']:
+                        continue
+                    event_abi = events_by_topic.get(bytes(log['topics'][0]))
+                    if event_abi is None:
+                        continue
+                    events.append(get_event_data(blockchain.client.w3.codec, event_abi, log))
+                self._insert(contract_key=contract_key, events=events, checkpoint=chunk_end)
+                self.log.debug(f"Indexed {len(events)} {contract_name} events in blocks {from_block}-{chunk_end}")
+                indexed += len(events)
+                from_block = chunk_end + 1
+        return indexed
+
+    def _insert(self, contract_key: Tuple[int, str, str], events: Iterable[dict], checkpoint: int) -> None:
+        with self.__lock, self.__db:
+            for event in events:
+                args = {name: self._serialize_value(value) for name, value in event['args'].items()}
+                cursor = self.__db.execute(
+                    "INSERT OR IGNORE INTO events (chain_id, contract_address, contract_name, event_name, "
+                    "block_number, transaction_hash, log_index, args) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (*contract_key, event['event'], event['blockNumber'], event['transactionHash'].hex(),
+                     event['logIndex'], json.dumps(args)))
+                if not cursor.rowcount:
+                    continue  # Already indexed
+                self.__db.executemany("INSERT INTO event_args (event_id, name, value) VALUES (?, ?, ?)",
+                                      ((cursor.lastrowid, name, json.dumps(value))
+                                       for name, value in args.items()))
+            self.__db.execute("INSERT OR REPLACE INTO checkpoints (chain_id, contract_address, contract_name, block_number) "
+                              "VALUES (?, ?, ?, ?)",
+                              (*contract_key, checkpoint))
+
+    def query(self,
+              agent: 'EthereumContractAgent',
+              event_name: Optional[str] = None,
+              from_block: Optional[int] = None,
+              to_block: Optional[int] = None,
+              **argument_filters) -> Iterator[IndexedEventRecord]:
+        """
+        Yields the indexed events of the agent's contract in the order they were emitted,
+        filtered by name, block range and argument values.
+        """
+        clauses = ["chain_id = ?", "contract_address = ?", "contract_name = ?"]
+        parameters = list(self._contract_key(agent))
+        if event_name is not None:
+            clauses.append("event_name = ?")
+            parameters.append(event_name)
+        if from_block is not None:
+            clauses.append("block_number >= ?")
+            parameters.append(from_block)
+        if to_block is not None:
+            clauses.append("block_number <= ?")
+            parameters.append(to_block)
+        for name, value in argument_filters.items():
+            clauses.append("id IN (SELECT event_id FROM event_args WHERE name = ? AND value = ?)")
+            parameters.extend((name, json.dumps(self._serialize_value(value))))
+
+        with self.__lock:
+            rows = self.__db.execute(f"SELECT contract_name, event_name, block_number, transaction_hash, args FROM events "
+                                     f"WHERE {' AND '.join(clauses)} ORDER BY block_number, log_index",
+                                     parameters).fetchall()
+        for contract_name, event_name, block_number, transaction_hash, args in rows:
+            yield IndexedEventRecord(contract_name=contract_name,
+                                     event_name=event_name,
+                                     block_number=block_number,
+                                     transaction_hash=transaction_hash,
+                                     args=json.loads(args))
@@ -34,6 +34,7 @@ from constant_sorrow.constants import (
 from eth_tester import EthereumTester
 from eth_tester.exceptions import TransactionFailed as TestTransactionFailed
 from eth_utils import to_checksum_address
+from hexbytes import HexBytes
 from twisted.logger import Logger
 from typing import Callable, List, NamedTuple, Tuple, Union
 from urllib.parse import urlparse
@@ -227,6 +228,7 @@ class BlockchainInterface:
         self.transacting_power = READ_ONLY_INTERFACE
         self.is_light = light
         self.gas_strategy = self.get_gas_strategy(gas_strategy)
+        self.__contracts = dict()  # Contract objects built from registry records, see get_contract_by_name
 
     def __repr__(self):
         r = '{name}({uri})'.format(name=self.__class__.__name__, uri=self.provider_uri)
@@ -299,6 +301,7 @@ class BlockchainInterface:
         try:
             self.w3 = self.Web3(provider=self._provider)
             self.client = EthereumClient.from_w3(w3=self.w3)
+            self.__contracts.clear()
         except requests.ConnectionError:  # RPC
             raise self.ConnectionFailed(f'Connection Failed - {str(self.provider_uri)} - is RPC enabled?')
         except FileNotFoundError:         # IPC File Protocol
@@ -469,14 +472,17 @@ class BlockchainInterface:
                           sender_address: str,
                           payload: dict = None,
                           transaction_gas_limit: int = None,
+                          nonce: int = None
                           ) -> dict:
 
         #
         # Build Payload
         #
 
+        if nonce is None:
+            nonce = self.client.w3.eth.getTransactionCount(sender_address, 'pending')
         base_payload = {'chainId': int(self.client.chain_id),
-                        'nonce': self.client.w3.eth.getTransactionCount(sender_address, 'pending'),
+                        'nonce': nonce,
                         'from': sender_address,
                         'gasPrice': self.client.gas_price}
 
@@ -507,6 +513,26 @@ class BlockchainInterface:
                                        confirmations: int = 0
                                        ) -> dict:
 
+        txhash = self.broadcast_transaction(transaction_dict=transaction_dict, transaction_name=transaction_name)
+
+        #
+        # Receipt
+        #
+
+        try:  # TODO: Handle block confirmation exceptions
+            receipt = self.client.wait_for_receipt(txhash, timeout=self.TIMEOUT, confirmations=confirmations)
+        except TimeExhausted:
+            # TODO: #1504 - Handle transaction timeout
+            raise
+        else:
+            self.log.debug(f"[RECEIPT-{transaction_name}] | txhash: {receipt['transactionHash'].hex()}")
+
+        self.verify_receipt(txhash=txhash, receipt=receipt)
+        return receipt
+
+    def broadcast_transaction(self, transaction_dict, transaction_name: str = "") -> HexBytes:
+        """Signs and broadcasts a transaction, returning its hash without waiting for it to be mined."""
+
         #
         # Setup
         #
@@ -541,22 +567,10 @@ class BlockchainInterface:
             txhash = self.client.send_raw_transaction(signed_raw_transaction)  # <--- BROADCAST
         except (TestTransactionFailed, ValueError) as error:
             raise  # TODO: Unify with Transaction failed handling
+        return txhash
 
-        #
-        # Receipt
-        #
-
-        try:  # TODO: Handle block confirmation exceptions
-            receipt = self.client.wait_for_receipt(txhash, timeout=self.TIMEOUT, confirmations=confirmations)
-        except TimeExhausted:
-            # TODO: #1504 - Handle transaction timeout
-            raise
-        else:
-            self.log.debug(f"[RECEIPT-{transaction_name}] | txhash: {receipt['transactionHash'].hex()}")
-
-        #
-        # Confirmations
-        #
+    def verify_receipt(self, txhash, receipt: dict) -> None:
+        """Raises InterfaceError if the receipt shows that the transaction failed."""
 
         # Primary check
         transaction_status = receipt.get('status', UNKNOWN_TX_STATUS)
@@ -574,8 +588,6 @@ class BlockchainInterface:
                 raise self.InterfaceError(f"Transaction consumed 100% of transaction gas."
                                           f"Full receipt: \n {pprint.pformat(receipt, indent=2)}")
 
-        return receipt
-
     def get_blocktime(self):
         return self.client.get_blocktime()
 
@@ -679,11 +691,17 @@ class BlockchainInterface:
 
             _contract_name, selected_version, selected_address, selected_abi = target_contract_records[enrollment_version]
 
-        # Create the contract from selected sources
-        unified_contract = self.client.w3.eth.contract(abi=selected_abi,
-                                                       address=selected_address,
-                                                       version=selected_version,
-                                                       ContractFactoryClass=self._contract_factory)
+        # Create the contract from selected sources, unless it's been done before with the same registry.
+        # Proxy targets are always read from the chain, so upgrades and rollbacks are still followed.
+        contract_key = (registry.id, contract_name, selected_version, selected_address)
+        try:
+            unified_contract = self.__contracts[contract_key]
+        except KeyError:
+            unified_contract = self.client.w3.eth.contract(abi=selected_abi,
+                                                           address=selected_address,
+                                                           version=selected_version,
+                                                           ContractFactoryClass=self._contract_factory)
+            self.__contracts[contract_key] = unified_contract
 
         return unified_contract
 
@@ -14,7 +14,9 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+import copy
 import json
+from collections import defaultdict
 from json import JSONDecodeError
 from os.path import abspath, dirname
 
@@ -26,7 +28,7 @@ import tempfile
 from abc import ABC, abstractmethod
 from constant_sorrow.constants import NO_REGISTRY_SOURCE, REGISTRY_COMMITTED
 from twisted.logger import Logger
-from typing import Dict, Iterator, List, Tuple, Type, Union
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Tuple, Type, Union
 
 from nucypher.blockchain.eth.constants import PREALLOCATION_ESCROW_CONTRACT_NAME
 from nucypher.blockchain.eth.networks import NetworksInventory
@@ -225,6 +227,7 @@ class BaseContractRegistry(ABC):
     def __init__(self, source=NO_REGISTRY_SOURCE, *args, **kwargs):
         self.__source = source
         self.log = Logger("registry")
+        self.__cache = None  # (cache key, {name: value derived from the registry contents})
 
     def __eq__(self, other) -> bool:
         if self is other:
@@ -238,11 +241,36 @@ class BaseContractRegistry(ABC):
     @property
     def id(self) -> str:
         """Returns a hexstr of the registry contents."""
-        blake = hashlib.blake2b()
-        blake.update(self.__class__.__name__.encode())
-        blake.update(json.dumps(self.read()).encode())
-        digest = blake.digest().hex()
-        return digest
+        def registry_id() -> str:
+            blake = hashlib.blake2b()
+            blake.update(self.__class__.__name__.encode())
+            blake.update(json.dumps(self.read()).encode())
+            digest = blake.digest().hex()
+            return digest
+        return self._cached('id', registry_id)
+
+    def _cache_key(self) -> Optional[Hashable]:
+        """
+        Identifies the current contents of the registry, so that whatever is derived from them
+        (parsed data, indexes, id) can be reused until they change.  None disables caching.
+        """
+        return None
+
+    def _cached(self, name: str, compute: Callable[[], Any]) -> Any:
+        cache_key = self._cache_key()
+        if cache_key is None:
+            return compute()
+        if self.__cache is None or self.__cache[0] != cache_key:
+            self.__cache = (cache_key, dict())
+        cached_values = self.__cache[1]
+        try:
+            return cached_values[name]
+        except KeyError:
+            value = cached_values[name] = compute()
+            return value
+
+    def _invalidate_cache(self) -> None:
+        self.__cache = None
 
     @abstractmethod
     def _destroy(self) -> None:
@@ -308,34 +336,41 @@ class BaseContractRegistry(ABC):
         self.write(registry_data)
         self.log.info("Enrolled {}:{}:{} into registry.".format(contract_name, contract_version, contract_address))
 
-    def search(self, contract_name: str = None, contract_version: str = None, contract_address: str = None) -> tuple:
-        """
-        Searches the registry for a contract with the provided name or address
-        and returns the contracts component data.
-        """
-        if not (bool(contract_name) ^ bool(contract_address)):
-            raise ValueError("Pass contract_name or contract_address, not both.")
-        if bool(contract_version) and not bool(contract_name):
-            raise ValueError("Pass contract_version together with contract_name.")
-
-        contracts = list()
-        registry_data = self.read()
-
+    def __index(self) -> Tuple[Dict[str, List[tuple]], Dict[str, List[tuple]]]:
+        """Indexes the registry's (name, version, address, abi) records by name and by address, in enrollment order."""
+        records_by_name, records_by_address = defaultdict(list), defaultdict(list)
         try:
-            for contract in registry_data:
+            for contract in self.read():
                 if len(contract) == 3:
                     name, address, abi = contract
                     version = None
                 else:
                     name, version, address, abi = contract
-                if contract_name == name and \
-                        (contract_version is None or version == contract_version) or \
-                        contract_address == address:
-                    contracts.append((name, version, address, abi))
+                record = (name, version, address, abi)
+                records_by_name[name].append(record)
+                records_by_address[address].append(record)
         except ValueError:
             message = "Missing or corrupted registry data"
             self.log.critical(message)
             raise self.InvalidRegistry(message)
+        return dict(records_by_name), dict(records_by_address)
+
+    def search(self, contract_name: str = None, contract_version: str = None, contract_address: str = None) -> tuple:
+        """
+        Searches the registry for a contract with the provided name or address
+        and returns the contracts component data.
+        """
+        if not (bool(contract_name) ^ bool(contract_address)):
+            raise ValueError("Pass contract_name or contract_address, not both.")
+        if bool(contract_version) and not bool(contract_name):
+            raise ValueError("Pass contract_version together with contract_name.")
+
+        records_by_name, records_by_address = self._cached('index', self.__index)
+        if contract_name:
+            contracts = [record for record in records_by_name.get(contract_name, ())
+                         if contract_version is None or record[1] == contract_version]
+        else:
+            contracts = list(records_by_address.get(contract_address, ()))
 
         if not contracts:
             raise self.UnknownContract(contract_name)
@@ -370,6 +405,13 @@ class LocalContractRegistry(BaseContractRegistry):
         self.__filepath = filepath
         return True
 
+    def _cache_key(self) -> Optional[Hashable]:
+        try:
+            stat = os.stat(self.filepath)
+        except OSError:
+            return None
+        return self.filepath, stat.st_mtime_ns, stat.st_size
+
     def read(self) -> Union[list, dict]:
         """
         Reads the registry file and parses the JSON and returns a list.
@@ -377,7 +419,12 @@ class LocalContractRegistry(BaseContractRegistry):
         If you are modifying or updating the registry file, you _must_ call
         this function first to get the current state to append to the dict or
         modify it because _write_registry_file overwrites the file.
+
+        The file is only parsed again when it changes; a (shallow) copy of its contents is returned.
         """
+        return copy.copy(self._cached('data', self.__read_file))
+
+    def __read_file(self) -> Union[list, dict]:
         try:
             with open(self.filepath, 'r') as registry_file:
                 self.log.debug("Reading from registry: filepath {}".format(self.filepath))
@@ -412,6 +459,7 @@ class LocalContractRegistry(BaseContractRegistry):
             registry_file.seek(0)
             registry_file.write(json.dumps(registry_data))
             registry_file.truncate()
+        self._invalidate_cache()
 
     def _destroy(self) -> None:
         os.remove(self.filepath)
@@ -458,18 +506,27 @@ class InMemoryContractRegistry(BaseContractRegistry):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__registry_data = None
+        self.__writes = 0
         self.filepath = "::memory::"
 
     def clear(self):
         self.__registry_data = None
+        self.__writes += 1
 
     def _swap_registry(self, filepath: str) -> bool:
         raise NotImplementedError
 
     def write(self, registry_data: list) -> None:
         self.__registry_data = json.dumps(registry_data)
+        self.__writes += 1
+
+    def _cache_key(self) -> Optional[Hashable]:
+        return self.__writes
 
     def read(self) -> list:
+        return copy.copy(self._cached('data', self.__read_data))
+
+    def __read_data(self) -> list:
         try:
             registry_data = json.loads(self.__registry_data)
         except TypeError:
@@ -496,6 +553,7 @@ class InMemoryContractRegistry(BaseContractRegistry):
 
     def _destroy(self) -> None:
         self.__registry_data = dict()
+        self.__writes += 1
 
 
 class AllocationRegistry(LocalContractRegistry):
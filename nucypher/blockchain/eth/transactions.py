@@ -0,0 +1,260 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+import time
+
+from eth_typing import ChecksumAddress
+from hexbytes import HexBytes
+from twisted.logger import Logger
+from typing import List, Optional, Union
+from web3.contract import ContractConstructor, ContractFunction
+from web3.exceptions import TimeExhausted, TransactionNotFound
+
+from nucypher.blockchain.eth.interfaces import BlockchainInterface
+from nucypher.blockchain.eth.utils import get_transaction_name
+
+
+class PendingTransaction:
+    """A transaction submitted through a TransactionPipeline, along with every hash broadcast for its nonce."""
+
+    def __init__(self, name: str, transaction_dict: dict, txhash: HexBytes):
+        self.name = name
+        self.transaction_dict = transaction_dict
+        self.txhashes = [txhash]
+        self.submitted_at = self.broadcast_at = time.monotonic()
+        self.replacements = 0
+        self.receipt = None
+        self.error = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name}, nonce={self.nonce}, txhash={self.txhash.hex()})"
+
+    @property
+    def nonce(self) -> int:
+        return self.transaction_dict['nonce']
+
+    @property
+    def txhash(self) -> HexBytes:
+        return self.txhashes[-1]
+
+    @property
+    def done(self) -> bool:
+        return self.receipt is not None or self.error is not None
+
+
+class TransactionPipeline:
+    """
+    Broadcasts many transactions from a single sender without waiting for each one to be mined.
+
+    Nonces are tracked locally, starting from the sender's pending transaction count, so that
+    transactions can be signed and broadcast back to back while their receipts are polled for
+    together.  Transactions that are not mined within `replacement_timeout` seconds are replaced
+    by re-broadcasting the same nonce at a higher gas price.
+
+    Once a transaction times out, its nonce is a gap that no later transaction can be mined past,
+    so the pipeline refuses further submissions; the transactions already in flight are still waited for.
+
+    Only transactions that do not depend on each other's effects on contract state should share
+    a pipeline, since gas is estimated before any of the preceding transactions are mined.
+    A pipeline is meant to be driven by a single thread.
+    """
+
+    DEFAULT_MAX_PENDING = 16
+    DEFAULT_REPLACEMENT_TIMEOUT = 180  # seconds
+    DEFAULT_GAS_PRICE_BUMP = 1.125     # Nodes only accept replacements paying at least 10% more
+    DEFAULT_MAX_REPLACEMENTS = 3
+    DEFAULT_POLL_INTERVAL = 2          # seconds
+
+    class TransactionsFailed(RuntimeError):
+        def __init__(self, failed: List[PendingTransaction]):
+            self.failed = failed
+            summary = ', '.join(f"{transaction.name} (nonce {transaction.nonce}): {transaction.error}"
+                                for transaction in failed)
+            super().__init__(f"{len(failed)} pipelined transaction(s) failed: {summary}")
+
+    class PipelineStalled(RuntimeError):
+        """Raised when submitting to a pipeline in which a transaction has timed out, leaving a nonce gap."""
+
+    def __init__(self,
+                 blockchain: BlockchainInterface,
+                 sender_address: ChecksumAddress,
+                 confirmations: int = 0,
+                 max_pending: int = DEFAULT_MAX_PENDING,
+                 replacement_timeout: int = DEFAULT_REPLACEMENT_TIMEOUT,
+                 gas_price_bump: float = DEFAULT_GAS_PRICE_BUMP,
+                 max_replacements: int = DEFAULT_MAX_REPLACEMENTS,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 timeout: float = BlockchainInterface.TIMEOUT):
+
+        if max_pending < 1:
+            raise ValueError(f"max_pending must be at least 1, got {max_pending}")
+        if gas_price_bump <= 1:
+            raise ValueError(f"gas_price_bump must be greater than 1, got {gas_price_bump}")
+
+        self.log = Logger(self.__class__.__name__)
+        self.blockchain = blockchain
+        self.sender_address = sender_address
+        self.confirmations = confirmations
+        self.max_pending = max_pending
+        self.replacement_timeout = replacement_timeout
+        self.gas_price_bump = gas_price_bump
+        self.max_replacements = max_replacements
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+
+        self.__next_nonce = None
+        self.__stalled_at = None
+        self.__pending = list()
+        self.__transactions = list()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.wait()
+
+    @property
+    def pending(self) -> List[PendingTransaction]:
+        return list(self.__pending)
+
+    @property
+    def transactions(self) -> List[PendingTransaction]:
+        return list(self.__transactions)
+
+    def submit(self,
+               contract_function: Union[ContractFunction, ContractConstructor],
+               payload: dict = None,
+               transaction_gas_limit: Optional[int] = None
+               ) -> PendingTransaction:
+        """
+        Builds, signs and broadcasts a transaction with the next local nonce, and returns immediately
+        unless `max_pending` transactions are already in flight.
+        Raises PipelineStalled if any transaction has timed out, since nothing after it can be mined.
+        """
+        self.__check_not_stalled()
+        while len(self.__pending) >= self.max_pending:
+            self.poll()
+            self.__check_not_stalled()
+            if len(self.__pending) >= self.max_pending:
+                time.sleep(self.poll_interval)
+
+        if self.__next_nonce is None:
+            self.__next_nonce = self.blockchain.client.w3.eth.getTransactionCount(self.sender_address, 'pending')
+
+        transaction_dict = self.blockchain.build_transaction(contract_function=contract_function,
+                                                             sender_address=self.sender_address,
+                                                             payload=payload,
+                                                             transaction_gas_limit=transaction_gas_limit,
+                                                             nonce=self.__next_nonce)
+        name = get_transaction_name(contract_function=contract_function)
+        txhash = self.blockchain.broadcast_transaction(transaction_dict=transaction_dict, transaction_name=name)
+
+        # Only consume the nonce once the transaction is out, so that a failed build leaves no gap.
+        self.__next_nonce += 1
+        transaction = PendingTransaction(name=name, transaction_dict=transaction_dict, txhash=txhash)
+        self.__pending.append(transaction)
+        self.__transactions.append(transaction)
+        self.log.debug(f"Submitted {transaction}")
+        return transaction
+
+    def poll(self) -> None:
+        """Checks once on every transaction in flight, replacing those that seem to be stuck."""
+        if not self.__pending:
+            return
+        block_number = self.blockchain.client.block_number
+        now = time.monotonic()
+        still_pending = list()
+        for transaction in self.__pending:
+            receipt = self.__get_receipt(transaction)
+
+            if receipt is None:
+                if now - transaction.submitted_at > self.timeout:
+                    transaction.error = TimeExhausted(f"{transaction} was not mined after {self.timeout} seconds")
+                    if self.__stalled_at is None or transaction.nonce < self.__stalled_at:
+                        self.__stalled_at = transaction.nonce
+                    continue
+                if now - transaction.broadcast_at > self.replacement_timeout:
+                    self.__replace(transaction)
+                still_pending.append(transaction)
+                continue
+
+            if block_number - receipt['blockNumber'] < self.confirmations:
+                still_pending.append(transaction)
+                continue
+
+            try:
+                self.blockchain.verify_receipt(txhash=receipt['transactionHash'], receipt=receipt)
+            except BlockchainInterface.InterfaceError as error:
+                transaction.error = error
+            else:
+                transaction.receipt = receipt
+                self.log.debug(f"[RECEIPT-{transaction.name}] | txhash: {receipt['transactionHash'].hex()}")
+
+        self.__pending = still_pending
+
+    def wait(self) -> List[dict]:
+        """
+        Blocks until every submitted transaction is mined (and confirmed), returning their receipts
+        in submission order.  Raises TransactionsFailed if any of them failed or timed out.
+        """
+        while self.__pending:
+            self.poll()
+            if self.__pending:
+                time.sleep(self.poll_interval)
+
+        failed = [transaction for transaction in self.__transactions if transaction.error is not None]
+        if failed:
+            raise self.TransactionsFailed(failed=failed)
+        return [transaction.receipt for transaction in self.__transactions]
+
+    def __check_not_stalled(self) -> None:
+        if self.__stalled_at is not None:
+            raise self.PipelineStalled(f"Nonce {self.__stalled_at} of {self.sender_address} timed out; "
+                                       f"no later transaction can be mined until it is filled")
+
+    def __get_receipt(self, transaction: PendingTransaction) -> Optional[dict]:
+        # Any of the hashes broadcast for this nonce may be the one that gets mined.
+        for txhash in reversed(transaction.txhashes):
+            try:
+                receipt = self.blockchain.client.w3.eth.getTransactionReceipt(txhash)
+            except TransactionNotFound:
+                continue
+            if receipt is not None:
+                return receipt
+        return None
+
+    def __replace(self, transaction: PendingTransaction) -> None:
+        if transaction.replacements >= self.max_replacements:
+            return
+        transaction_dict = dict(transaction.transaction_dict)
+        bumped_price = int(transaction_dict['gasPrice'] * self.gas_price_bump)
+        transaction_dict['gasPrice'] = max(bumped_price, self.blockchain.client.gas_price)
+        try:
+            txhash = self.blockchain.broadcast_transaction(transaction_dict=transaction_dict,
+                                                           transaction_name=f'{transaction.name} (replacement)')
+        except ValueError as error:
+            # Most likely a previous broadcast was mined in the meantime ("nonce too low").
+            self.log.info(f"Could not replace {transaction}: {error}")
+            return
+        transaction.transaction_dict = transaction_dict
+        transaction.txhashes.append(txhash)
+        transaction.broadcast_at = time.monotonic()
+        transaction.replacements += 1
+        self.log.info(f"Replaced stuck transaction with {transaction} at gas price {transaction_dict['gasPrice']}")
@@ -17,7 +17,7 @@
 
 import functools
 import maya
-from typing import Union
+from typing import List, Union
 from umbral.keys import UmbralPublicKey
 
 from nucypher.characters.control.specifications import alice, bob, enrico
@@ -205,7 +205,7 @@ class BobInterface(CharacterPublicInterface):
         """
         Character control endpoint for re-encrypting and decrypting policy data.
         """
-        from nucypher.characters.lawful import Enrico
+        from nucypher.characters.lawful import Enrico, Ursula
 
         policy_encrypting_key = UmbralPublicKey.from_bytes(policy_encrypting_key)
         alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key)
@@ -218,12 +218,21 @@ class BobInterface(CharacterPublicInterface):
 
         self.character.join_policy(label=label, alice_verifying_key=alice_verifying_key)
 
-
-        plaintexts = self.character.retrieve(message_kit,
-                                             enrico=enrico,
-                                             alice_verifying_key=alice_verifying_key,
-                                             label=label,
-                                             treasure_map=treasure_map)
+        retrieve = functools.partial(self.character.retrieve,
+                                     message_kit,
+                                     enrico=enrico,
+                                     alice_verifying_key=alice_verifying_key,
+                                     label=label,
+                                     treasure_map=treasure_map)
+        try:
+            plaintexts = retrieve()
+        except Ursula.NotEnoughUrsulas:
+            if treasure_map is not None:
+                raise
+            # The cached TreasureMap may be stale, e.g. if Alice revoked and then granted the same label again.
+            self.character.forget_treasure_map(alice_verifying_key=alice_verifying_key, label=label)
+            self.character.join_policy(label=label, alice_verifying_key=alice_verifying_key)
+            plaintexts = retrieve()
 
         response_data = {'cleartexts': plaintexts}
         return response_data
@@ -250,3 +259,16 @@ class EnricoInterface(CharacterPublicInterface):
         message_kit, signature = self.character.encrypt_message(plaintext=plaintext)
         response_data = {'message_kit': message_kit, 'signature': signature}
         return response_data
+
+    @attach_schema(enrico.EncryptMessages)
+    def encrypt_messages(self, plaintexts: List[bytes]):
+        """
+        Character control endpoint for encrypting a batch of messages for a policy and
+        receiving their messagekits (and signatures), in the same order.
+        """
+        message_kits, signatures = list(), list()
+        for message_kit, signature in self.character.encrypt_messages(plaintexts=plaintexts):
+            message_kits.append(message_kit)
+            signatures.append(signature)
+        response_data = {'message_kits': message_kits, 'signatures': signatures}
+        return response_data
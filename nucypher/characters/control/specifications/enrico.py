@@ -65,3 +65,23 @@ class EncryptMessage(BaseSchema):
     # output
     message_kit = fields.UmbralMessageKit(dump_only=True)
     signature = fields.UmbralSignature(dump_only=True)
+
+
+class EncryptMessages(BaseSchema):
+
+    # input
+    messages = fields.List(fields.Cleartext(), load_only=True, required=True)
+
+    policy_encrypting_key = fields.Key(
+        required=False,
+        load_only=True,
+        click=options.option_policy_encrypting_key()
+    )
+
+    @post_load()
+    def format_method_arguments(self, data, **kwargs):
+        return {"plaintexts": [bytes(message, encoding='utf-8') for message in data['messages']]}
+
+    # output
+    message_kits = fields.List(fields.UmbralMessageKit(), dump_only=True)
+    signatures = fields.List(fields.UmbralSignature(), dump_only=True)
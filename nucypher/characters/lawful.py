@@ -18,19 +18,20 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import json
 from base64 import b64decode, b64encode
 from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from random import shuffle
 
 import maya
 import time
 from bytestring_splitter import BytestringKwargifier, BytestringSplitter, BytestringSplittingError, \
-    VariableLengthBytestring
+    VARIABLE_HEADER_LENGTH, VariableLengthBytestring
 from constant_sorrow import constants
 from constant_sorrow.constants import INCLUDED_IN_BYTESTRING, PUBLIC_ONLY, STRANGER_ALICE
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.asymmetric.ec import EllipticCurve
 from cryptography.hazmat.primitives.serialization import Encoding
 from cryptography.x509 import Certificate, NameOID, load_pem_x509_certificate
-from datetime import datetime
+from datetime import datetime, timedelta
 from eth_utils import to_checksum_address
 from flask import Response, request
 from functools import partial
@@ -39,7 +40,7 @@ from sqlalchemy.exc import OperationalError
 from twisted.internet import reactor, stdio, threads
 from twisted.internet.task import LoopingCall
 from twisted.logger import Logger
-from typing import Dict, Iterable, List, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
 from umbral import pre
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
@@ -64,9 +65,12 @@ from nucypher.cli.processes import UrsulaCommandProtocol
 from nucypher.config.storages import ForgetfulNodeStorage, NodeStorage
 from nucypher.crypto.api import encrypt_and_sign, keccak_digest
 from nucypher.crypto.constants import PUBLIC_ADDRESS_LENGTH, PUBLIC_KEY_LENGTH
+from nucypher.crypto.encryption import EncryptionExecutor
 from nucypher.crypto.kits import UmbralMessageKit
 from nucypher.crypto.powers import DecryptingPower, DelegatingPower, PowerUpError, SigningPower, TransactingPower
+from nucypher.crypto.reencryption import ReencryptionExecutor
 from nucypher.crypto.signing import InvalidSignature
+from nucypher.datastore.datastore import TreasureMapStore, make_datastore
 from nucypher.datastore.keypairs import HostingKeypair
 from nucypher.datastore.threading import ThreadedSession
 from nucypher.network.exceptions import NodeSeemsToBeDown
@@ -443,18 +447,35 @@ class Bob(Character):
         def __init__(self, evidence: List):
             self.evidence = evidence
 
-    def __init__(self, controller: bool = True, *args, **kwargs) -> None:
+    def __init__(self,
+                 controller: bool = True,
+                 retained_cfrags_path: str = None,
+                 work_order_history_ttl: float = None,
+                 treasure_map_db_filepath: str = None,
+                 treasure_map_ttl: float = None,
+                 *args, **kwargs) -> None:
         Character.__init__(self, known_node_class=Ursula, *args, **kwargs)
 
         if controller:
             self.make_cli_controller()
 
-        from nucypher.policy.collections import WorkOrderHistory  # Need a bigger strategy to avoid circulars.
-        self._completed_work_orders = WorkOrderHistory()
+        from nucypher.policy.collections import RetainedCFragStorage, WorkOrderHistory  # Need a bigger strategy to avoid circulars.
+        cfrag_storage = None
+        if retained_cfrags_path:
+            cfrag_storage = RetainedCFragStorage(path=retained_cfrags_path, ttl=work_order_history_ttl)
+        self._completed_work_orders = WorkOrderHistory(ttl=work_order_history_ttl, storage=cfrag_storage, bob=self)
 
         self.log = Logger(self.__class__.__name__)
         self.log.info(self.banner)
 
+        # Persistent TreasureMap cache, consulted before asking the network
+        self._treasure_map_store = None
+        if treasure_map_db_filepath:
+            datastore = make_datastore(db_filepath=treasure_map_db_filepath)
+            ttl = timedelta(seconds=treasure_map_ttl) if treasure_map_ttl is not None else None
+            self._treasure_map_store = TreasureMapStore(datastore=datastore, ttl=ttl)
+            self._warm_treasure_maps()
+
     def _pick_treasure_map(self, treasure_map=None, map_id=None):
         if treasure_map is None:
             if map_id:
@@ -532,6 +553,10 @@ class Bob(Character):
     def get_treasure_map(self, alice_verifying_key, label):
         _hrac, map_id = self.construct_hrac_and_map_id(verifying_key=alice_verifying_key, label=label)
 
+        treasure_map = self._get_cached_treasure_map(map_id=map_id, alice_verifying_key=alice_verifying_key)
+        if treasure_map is not None:
+            return treasure_map
+
         if not self.known_nodes and not self._learning_task.running:
             # Quick sanity check - if we don't know of *any* Ursulas, and we have no
             # plans to learn about any more, than this function will surely fail.
@@ -548,7 +573,88 @@ class Bob(Character):
             raise  # TODO: Maybe do something here?  NRN
         else:
             self.treasure_maps[map_id] = treasure_map
+            if self._treasure_map_store is not None:
+                self._treasure_map_store[bytes.fromhex(map_id)] = treasure_map
+
+        return treasure_map
+
+    def forget_treasure_map(self, alice_verifying_key, label) -> None:
+        """
+        Drops a TreasureMap from the cache, e.g. after Alice granted the same label again,
+        so that the next lookup fetches it from the network.
+        """
+        _hrac, map_id = self.construct_hrac_and_map_id(verifying_key=alice_verifying_key, label=label)
+        self.treasure_maps.pop(map_id, None)
+        if self._treasure_map_store is not None:
+            try:
+                del self._treasure_map_store[bytes.fromhex(map_id)]
+            except KeyError:
+                pass
+
+    def _get_cached_treasure_map(self, map_id: str, alice_verifying_key) -> Optional['TreasureMap']:
+        """
+        Returns the TreasureMap with this ID from the persistent cache, or None if it isn't there (or has expired).
+        """
+        if self._treasure_map_store is None:
+            return None
+
+        try:
+            map_bytes = self._treasure_map_store.get_bytes(bytes.fromhex(map_id), now=datetime.now())
+        except KeyError:
+            self.treasure_maps.pop(map_id, None)
+            return None
+
+        try:
+            return self.treasure_maps[map_id]  # Already oriented
+        except KeyError:
+            pass
+
+        alice = Alice.from_public_keys(verifying_key=alice_verifying_key)
+        try:
+            treasure_map = self._orient_cached_treasure_map(map_id=bytes.fromhex(map_id),
+                                                            map_bytes=map_bytes,
+                                                            alice=alice)
+        except self._unusable_cached_map_errors() as e:
+            self.log.warn(f"Dropping cached TreasureMap {map_id}: {e}")
+            del self._treasure_map_store[bytes.fromhex(map_id)]
+            return None
+        self.treasure_maps[map_id] = treasure_map
+        return treasure_map
+
+    def _warm_treasure_maps(self) -> None:
+        """
+        Decrypts every unexpired TreasureMap in the persistent cache ahead of time.
+        """
+        for map_id, map_bytes in self._treasure_map_store.unexpired(now=datetime.now()).items():
+            try:
+                treasure_map = self._orient_cached_treasure_map(map_id=map_id, map_bytes=map_bytes)
+            except self._unusable_cached_map_errors() as e:
+                self.log.warn(f"Dropping cached TreasureMap {map_id.hex()}: {e}")
+                del self._treasure_map_store[map_id]
+                continue
+            self.treasure_maps[map_id.hex()] = treasure_map
+
+    @staticmethod
+    def _unusable_cached_map_errors() -> tuple:
+        """What a cached TreasureMap which can no longer be split, verified or decrypted raises."""
+        from nucypher.policy.collections import TreasureMap
+        return (BytestringSplittingError,
+                TreasureMap.InvalidSignature,
+                TreasureMap.IsDisorienting,
+                TreasureMap.MismatchedID,
+                pre.GenericUmbralError)
 
+    def _orient_cached_treasure_map(self, map_id: bytes, map_bytes: bytes, alice: 'Alice' = None) -> 'TreasureMap':
+        """
+        Rebuilds and decrypts a TreasureMap from the persistent cache, checking that it is the one stored under `map_id`.
+        """
+        from nucypher.policy.collections import TreasureMap
+        treasure_map = TreasureMap.from_bytes(map_bytes)
+        if treasure_map.public_id() != map_id.hex():
+            raise TreasureMap.MismatchedID(f"TreasureMap stored as {map_id.hex()} is {treasure_map.public_id()}.")
+        if alice is None:
+            alice = Alice.from_public_keys(verifying_key=treasure_map._verifying_key)
+        treasure_map.orient(self.make_compass_for_alice(alice))
         return treasure_map
 
     def make_compass_for_alice(self, alice):
@@ -567,9 +673,12 @@ class Bob(Character):
         """
         Iterate through the nodes we know, asking for the TreasureMap.
         Return the first one who has it.
+
+        Nodes are asked in the same rendezvous order that Alice uses to pick where to publish the map,
+        so the ones most likely to have it are asked first.
         """
         from nucypher.policy.collections import TreasureMap
-        for node in self.known_nodes.shuffled():
+        for node in self.known_nodes.rendezvous_ranking(bytes.fromhex(map_id)):
             try:
                 response = network_middleware.get_treasure_map_from_node(node=node, map_id=map_id)
             except NodeSeemsToBeDown:
@@ -664,11 +773,122 @@ class Bob(Character):
                 "This WorkOrder is already complete; if you want Ursula to perform additional service, make a new WorkOrder.")
 
         cfrags_and_signatures = self.network_middleware.reencrypt(work_order)
+        return self._complete_work_order(work_order, cfrags_and_signatures, retain_cfrags=retain_cfrags)
+
+    def _complete_work_order(self, work_order, cfrags_and_signatures, retain_cfrags=False):
         cfrags = work_order.complete(cfrags_and_signatures)
         self._completed_work_orders.save_work_order(work_order, as_replete=retain_cfrags)
-
         return cfrags
 
+    def get_reencrypted_cfrags_in_batch(self, work_orders, retain_cfrags=False):
+        """
+        Like get_reencrypted_cfrags, but for several WorkOrders destined to the same Ursula,
+        which are sent to her in a single request.
+
+        Returns a list with the CFrags of each WorkOrder, or None for the ones she couldn't complete.
+        """
+        for work_order in work_orders:
+            if work_order.completed:
+                raise TypeError(
+                    "This WorkOrder is already complete; if you want Ursula to perform additional service, make a new WorkOrder.")
+
+        all_cfrags = list()
+        results = self.network_middleware.reencrypt_batch(work_orders)
+        for work_order, cfrags_and_signatures in zip(work_orders, results):
+            if cfrags_and_signatures is None:
+                all_cfrags.append(None)
+                continue
+            cfrags = self._complete_work_order(work_order, cfrags_and_signatures, retain_cfrags=retain_cfrags)
+            all_cfrags.append(cfrags)
+
+        return all_cfrags
+
+    def _attach_cfrags_from_work_order(self, work_order, capsules_to_activate: set, m: int) -> List:
+        """
+        Attaches the CFrags of a completed WorkOrder to their Capsules, and stops tracking
+        the Capsules which now have m of them.  Returns evidence for any incorrect CFrags.
+        """
+        grievances = []
+        for capsule, pre_task in work_order.tasks.items():
+            try:
+                capsule.attach_cfrag(pre_task.cfrag)
+            except UmbralCorrectnessError:
+                task = work_order.tasks[0]
+                # TODO: WARNING - This block is untested.
+                from nucypher.policy.collections import IndisputableEvidence
+                evidence = IndisputableEvidence(task=task, work_order=work_order)
+                # I got a lot of problems with you people ...
+                grievances.append(evidence)
+
+            if len(capsule) >= m:
+                capsules_to_activate.discard(capsule)
+        return grievances
+
+    def _get_reencrypted_cfrags_concurrently(self,
+                                             work_orders: Iterable,
+                                             capsules_to_activate: set,
+                                             m: int,
+                                             retain_cfrags: bool = False,
+                                             hedge: int = 0) -> List:
+        """
+        Sends WorkOrders to as many Ursulas at once as are needed to activate every Capsule in
+        capsules_to_activate, plus `hedge` extra ones in case some of them are slow or down.
+        CFrags are attached as they arrive; WorkOrders still outstanding once all the Capsules are
+        activated are cancelled, or ignored if they're already on the wire.
+
+        Returns evidence for any incorrect CFrags.
+        """
+        work_orders = iter(work_orders)
+        grievances = []
+        pending = dict()
+
+        # Capsules with enough CFrags attached from precedent WorkOrders don't need any more.
+        capsules_to_activate.difference_update([capsule for capsule in capsules_to_activate if len(capsule) >= m])
+
+        def work_orders_needed():
+            if not capsules_to_activate:
+                return 0
+            return m - min(len(capsule) for capsule in capsules_to_activate) + hedge
+
+        def dispatch_work_orders(executor):
+            while len(pending) < work_orders_needed():
+                work_order = next(work_orders, None)
+                if work_order is None:
+                    break
+                pending[executor.submit(self.network_middleware.reencrypt, work_order)] = work_order
+
+        executor = ThreadPoolExecutor(max_workers=max(work_orders_needed(), 1))
+        try:
+            dispatch_work_orders(executor)
+            while capsules_to_activate and pending:
+                done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    work_order = pending.pop(future)
+                    try:
+                        cfrags_and_signatures = future.result()
+                    except NodeSeemsToBeDown:
+                        self.log.info(f"Ursula ({work_order.ursula}) seems to be down while trying to complete WorkOrder: {work_order}")
+                        continue
+                    except self.network_middleware.NotFound:
+                        self.log.warn(f"Ursula ({work_order.ursula}) claims not to have the KFrag to complete WorkOrder: {work_order}.  Has accessed been revoked?")
+                        continue
+
+                    # Only the network round trip happens off-thread; CFrags are checked and attached here.
+                    self._complete_work_order(work_order, cfrags_and_signatures, retain_cfrags=retain_cfrags)
+                    grievances.extend(self._attach_cfrags_from_work_order(work_order, capsules_to_activate, m))
+                    if not capsules_to_activate:
+                        break
+                dispatch_work_orders(executor)
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        if capsules_to_activate:
+            raise Ursula.NotEnoughUrsulas(
+                "Unable to reach m Ursulas.  See the logs for which Ursulas are down or noncompliant.")
+        return grievances
+
     def join_policy(self, label, alice_verifying_key, node_list=None, block=False):
         if node_list:
             self._node_ids_to_learn_about_immediately.update(node_list)
@@ -684,7 +904,9 @@ class Bob(Character):
                  use_attached_cfrags: bool = False,
                  use_precedent_work_orders: bool = False,
                  policy_encrypting_key: UmbralPublicKey = None,
-                 treasure_map: Union['TreasureMap', bytes] = None):
+                 treasure_map: Union['TreasureMap', bytes] = None,
+                 concurrent: bool = False,
+                 hedge: int = 0):
 
         # Try our best to get an UmbralPublicKey from input
         alice_verifying_key = UmbralPublicKey.from_bytes(bytes(alice_verifying_key))
@@ -769,58 +991,56 @@ class Bob(Character):
             # TODO Optimization: Block here (or maybe even later) until map is done being followed (instead of blocking above). #1114
             the_airing_of_grievances = []
 
-            for work_order in new_work_orders.values():
-                for capsule in work_order.tasks:
-                    work_order_is_useful = False
-                    if len(capsule) >= m:
-                        capsules_to_activate.discard(capsule)
-                    else:
-                        work_order_is_useful = True
-                        break
+            if concurrent:
+                # Ask several Ursulas at once; latency is then that of the m-th fastest one, not the sum.
+                the_airing_of_grievances = self._get_reencrypted_cfrags_concurrently(work_orders=new_work_orders.values(),
+                                                                                     capsules_to_activate=capsules_to_activate,
+                                                                                     m=m,
+                                                                                     retain_cfrags=retain_cfrags,
+                                                                                     hedge=hedge)
+            else:
+                for work_order in new_work_orders.values():
 
-                # If all the capsules are now activated, we can stop here.
-                if not capsules_to_activate:
-                    break
+                    for capsule in work_order.tasks:
+                        work_order_is_useful = False
+                        if len(capsule) >= m:
+                            capsules_to_activate.discard(capsule)
+                        else:
+                            work_order_is_useful = True
+                            break
 
-                if not work_order_is_useful:
-                    # None of the Capsules for this particular WorkOrder need to be activated.  Move on to the next one.
-                    continue
+                    # If all the capsules are now activated, we can stop here.
+                    if not capsules_to_activate:
+                        break
 
-                # We don't have enough CFrags yet.  Let's get another one from a WorkOrder.
-                try:
-                    self.get_reencrypted_cfrags(work_order, retain_cfrags=retain_cfrags)
-                except NodeSeemsToBeDown as e:
-                    # TODO: What to do here?  Ursula isn't supposed to be down.  NRN
-                    self.log.info(f"Ursula ({work_order.ursula}) seems to be down while trying to complete WorkOrder: {work_order}")
-                    continue
-                except self.network_middleware.NotFound:
-                    # This Ursula claims not to have a matching KFrag.  Maybe this has been revoked?
-                    # TODO: What's the thing to do here?  Do we want to track these Ursulas in some way in case they're lying?  567
-                    self.log.warn(f"Ursula ({work_order.ursula}) claims not to have the KFrag to complete WorkOrder: {work_order}.  Has accessed been revoked?")
-                    continue
-                except self.network_middleware.UnexpectedResponse:
-                    raise # TODO: Handle this
+                    if not work_order_is_useful:
+                        # None of the Capsules for this particular WorkOrder need to be activated.  Move on to the next one.
+                        continue
 
-                for capsule, pre_task in work_order.tasks.items():
+                    # We don't have enough CFrags yet.  Let's get another one from a WorkOrder.
                     try:
-                        capsule.attach_cfrag(pre_task.cfrag)
-                    except UmbralCorrectnessError:
-                        task = work_order.tasks[0]
-                        # TODO: WARNING - This block is untested.
-                        from nucypher.policy.collections import IndisputableEvidence
-                        evidence = IndisputableEvidence(task=task, work_order=work_order)
-                        # I got a lot of problems with you people ...
-                        the_airing_of_grievances.append(evidence)
-
-                    if len(capsule) >= m:
-                        capsules_to_activate.discard(capsule)
-
-                # If all the capsules are now activated, we can stop here.
-                if not capsules_to_activate:
-                    break
-            else:
-                raise Ursula.NotEnoughUrsulas(
-                    "Unable to reach m Ursulas.  See the logs for which Ursulas are down or noncompliant.")
+                        self.get_reencrypted_cfrags(work_order, retain_cfrags=retain_cfrags)
+                    except NodeSeemsToBeDown as e:
+                        # TODO: What to do here?  Ursula isn't supposed to be down.  NRN
+                        self.log.info(f"Ursula ({work_order.ursula}) seems to be down while trying to complete WorkOrder: {work_order}")
+                        continue
+                    except self.network_middleware.NotFound:
+                        # This Ursula claims not to have a matching KFrag.  Maybe this has been revoked?
+                        # TODO: What's the thing to do here?  Do we want to track these Ursulas in some way in case they're lying?  567
+                        self.log.warn(f"Ursula ({work_order.ursula}) claims not to have the KFrag to complete WorkOrder: {work_order}.  Has accessed been revoked?")
+                        continue
+                    except self.network_middleware.UnexpectedResponse:
+                        raise # TODO: Handle this
+
+                    grievances = self._attach_cfrags_from_work_order(work_order, capsules_to_activate, m)
+                    the_airing_of_grievances.extend(grievances)
+
+                    # If all the capsules are now activated, we can stop here.
+                    if not capsules_to_activate:
+                        break
+                else:
+                    raise Ursula.NotEnoughUrsulas(
+                        "Unable to reach m Ursulas.  See the logs for which Ursulas are down or noncompliant.")
 
             if the_airing_of_grievances:
                 # ... and now you're gonna hear about it!
@@ -893,6 +1113,7 @@ class Ursula(Teacher, Character, Worker):
     _default_crypto_powerups = [SigningPower, DecryptingPower]
 
     _pruning_interval = 60  # seconds
+    _timestamp_length = 4  # bytes
 
     class NotEnoughUrsulas(Learner.NotEnoughTeachers, StakingEscrowAgent.NotEnoughStakers):
         """
@@ -917,6 +1138,8 @@ class Ursula(Teacher, Character, Worker):
                  timestamp=None,
                  availability_check: bool = True,
                  prune_datastore: bool = True,
+                 parallel_reencryption: bool = False,
+                 reencryption_processes: int = None,
 
                  # Blockchain
                  decentralized_identity_evidence: bytes = constants.NOT_SIGNED,
@@ -980,6 +1203,11 @@ class Ursula(Teacher, Character, Worker):
             self._prune_datastore = prune_datastore
             self._arrangement_pruning_task = LoopingCall(f=self.__prune_arrangements)
 
+            # Re-encryption (in-thread unless asked to use a process pool, started here rather than on a request thread)
+            self._reencryption_executor = None
+            if parallel_reencryption:
+                self._reencryption_executor = ReencryptionExecutor(max_workers=reencryption_processes)
+
         #
         # Ursula the Decentralized Worker (Self)
         #
@@ -1025,6 +1253,9 @@ class Ursula(Teacher, Character, Worker):
                     serving_domains=domains,
                 )
 
+                # Persistent, bounded TreasureMap storage
+                self.treasure_maps = TreasureMapStore(datastore=datastore)
+
                 # TLSHostingPower (Ephemeral Powers and Private Keys)
                 tls_hosting_keypair = HostingKeypair(curve=tls_curve, host=rest_host,
                                                      checksum_address=self.checksum_address)
@@ -1084,7 +1315,7 @@ class Ursula(Teacher, Character, Worker):
             self.log.debug(message)
 
     def __prune_arrangements(self) -> None:
-        """Deletes all expired arrangements and kfrags in the datastore."""
+        """Deletes all expired arrangements, kfrags and treasure maps in the datastore."""
         now = datetime.fromtimestamp(self._arrangement_pruning_task.clock.seconds())
         try:
             result = self.datastore.del_expired_policy_arrangements(now=now)
@@ -1094,6 +1325,14 @@ class Ursula(Teacher, Character, Worker):
             if result > 0:
                 self.log.debug(f"Pruned {result} policy arrangements.")
 
+        try:
+            result = self.treasure_maps.prune(now=now)
+        except OperationalError:
+            self.log.warn(f"Failed to prune treasure maps; DB session rolled back.")
+        else:
+            if result > 0:
+                self.log.debug(f"Pruned {result} treasure maps.")
+
     def run(self,
             emitter: StdoutEmitter = None,
             hendrix: bool = True,
@@ -1185,6 +1424,8 @@ class Ursula(Teacher, Character, Worker):
             self.work_tracker.stop()
         if self._arrangement_pruning_task.running:
             self._arrangement_pruning_task.stop()
+        if self._reencryption_executor:
+            self._reencryption_executor.shutdown(wait=False)
         if halt_reactor:
             reactor.stop()
 
@@ -1358,7 +1599,7 @@ class Ursula(Teacher, Character, Worker):
             _partial_receiver=NodeSprout,
             public_address=PUBLIC_ADDRESS_LENGTH,
             domains=VariableLengthBytestring,  # TODO:  Multiple domains?  NRN
-            timestamp=(int, 4, {'byteorder': 'big'}),
+            timestamp=(int, cls._timestamp_length, {'byteorder': 'big'}),
             interface_signature=Signature,
             decentralized_identity_evidence=VariableLengthBytestring,
             verifying_key=(UmbralPublicKey, PUBLIC_KEY_LENGTH),
@@ -1426,22 +1667,63 @@ class Ursula(Teacher, Character, Worker):
                                       **processed_objects)
         return ursula
 
+    @classmethod
+    def _split_node_payload(cls, ursulas_as_bytes: bytes) -> Iterable[Tuple[int, memoryview]]:
+        """
+        Walks a payload of VariableLengthBytestring-framed nodes without copying it,
+        yielding each node's version along with a view of the rest of its bytes.
+        """
+        version_length = len(cls.version_splitter)
+        payload = memoryview(ursulas_as_bytes)
+        cursor = 0
+        while cursor < len(payload):
+            node_length = int.from_bytes(payload[cursor:cursor + VARIABLE_HEADER_LENGTH], "big")
+            cursor += VARIABLE_HEADER_LENGTH
+            end_of_node = cursor + node_length
+            if end_of_node > len(payload) or node_length < version_length:
+                raise BytestringSplittingError(f"Malformed node payload: {node_length} bytes claimed at position "
+                                               f"{cursor}, {len(payload) - cursor} available.")
+            version = int.from_bytes(payload[cursor:cursor + version_length], "big")
+            yield version, payload[cursor + version_length:end_of_node]
+            cursor = end_of_node
+
+    @classmethod
+    def _peek_address_and_timestamp(cls, node_bytes: memoryview) -> Tuple[bytes, int]:
+        """
+        Reads the canonical address and timestamp epoch of a node without splitting the rest of it.
+        The offsets follow the layout of internal_splitter: address, domains, then timestamp.
+        """
+        domains_start = PUBLIC_ADDRESS_LENGTH
+        domains_length = int.from_bytes(node_bytes[domains_start:domains_start + VARIABLE_HEADER_LENGTH], "big")
+        timestamp_start = domains_start + VARIABLE_HEADER_LENGTH + domains_length
+        if len(node_bytes) < timestamp_start + cls._timestamp_length:
+            raise BytestringSplittingError(f"Malformed node header: {len(node_bytes)} bytes is too short "
+                                           f"for an address, domains, and timestamp.")
+        timestamp = int.from_bytes(node_bytes[timestamp_start:timestamp_start + cls._timestamp_length], "big")
+        return bytes(node_bytes[:PUBLIC_ADDRESS_LENGTH]), timestamp
+
     @classmethod
     def batch_from_bytes(cls,
                          ursulas_as_bytes: Iterable[bytes],
                          registry: BaseContractRegistry = None,
                          fail_fast: bool = False,
+                         skip: Callable[[bytes, int], bool] = None,
                          ) -> List['Ursula']:
-
-        node_splitter = BytestringSplitter(VariableLengthBytestring)
-        nodes_vbytes = node_splitter.repeat(ursulas_as_bytes)
-        version_splitter = BytestringSplitter((int, 2, {"byteorder": "big"}))
-        versions_and_node_bytes = [version_splitter(n, return_remainder=True) for n in nodes_vbytes]
+        """
+        If skip is passed, it is called with the canonical address and timestamp epoch of each node
+        before a sprout is made for it; nodes for which it returns True are left out.
+        """
 
         sprouts = []
-        for version, node_bytes in versions_and_node_bytes:
+        for version, node_bytes in cls._split_node_payload(ursulas_as_bytes):
+            # Nodes to be skipped cost only a look at their header...
+            if skip and version == cls.LEARNER_VERSION:
+                if skip(*cls._peek_address_and_timestamp(node_bytes)):
+                    continue
+            # ...the others are copied out of the payload, so that their sprouts don't keep all of it alive,
+            # and split (without instantiating anything) so that a malformed node is turned away right here.
             try:
-                sprout = cls.from_bytes(node_bytes,
+                sprout = cls.from_bytes(bytes(node_bytes),
                                         version=version,
                                         registry=registry)
             except Ursula.IsFromTheFuture as e:
@@ -1506,20 +1788,30 @@ class Ursula(Teacher, Character, Worker):
 
     def _reencrypt(self, kfrag: KFrag, work_order: 'WorkOrder', alice_verifying_key: UmbralPublicKey):
 
-        # Prepare a bytestring for concatenating re-encrypted
-        # capsule data for each work order task.
-        cfrag_byte_stream = bytes()
+        # Ursula signs on top of Bob's signature of each task.
+        # Now both are committed to the same task.  See #259.
+        capsules_and_metadata = list()
         for task in work_order.tasks:
-            # Ursula signs on top of Bob's signature of each task.
-            # Now both are committed to the same task.  See #259.
             reencryption_metadata = bytes(self.stamp(bytes(task.signature)))
+            capsules_and_metadata.append((task.capsule, reencryption_metadata))
 
-            # Ursula sets Alice's verifying key for capsule correctness verification.
-            capsule = task.capsule
-            capsule.set_correctness_keys(verifying=alice_verifying_key)
+        # Then re-encrypts the fragments, either here or on the process pool.
+        if self._reencryption_executor:
+            cfrags = self._reencryption_executor.reencrypt(kfrag=kfrag,
+                                                           capsules_and_metadata=capsules_and_metadata,
+                                                           alice_verifying_key=alice_verifying_key)
+        else:
+            cfrags = list()
+            for capsule, reencryption_metadata in capsules_and_metadata:
+                # Ursula sets Alice's verifying key for capsule correctness verification.
+                capsule.set_correctness_keys(verifying=alice_verifying_key)
+                cfrag = pre.reencrypt(kfrag, capsule, metadata=reencryption_metadata)  # <--- pyUmbral
+                cfrags.append(cfrag)
 
-            # Then re-encrypts the fragment.
-            cfrag = pre.reencrypt(kfrag, capsule, metadata=reencryption_metadata)  # <--- pyUmbral
+        # Prepare a bytestring for concatenating re-encrypted
+        # capsule data for each work order task.
+        cfrag_byte_stream = bytes()
+        for (capsule, _metadata), cfrag in zip(capsules_and_metadata, cfrags):
             self.log.info(f"Re-encrypted capsule {capsule} -> made {cfrag}.")
 
             # Next, Ursula signs to commit to her results.
@@ -1537,9 +1829,19 @@ class Enrico(Character):
     _interface_class = EnricoInterface
     _default_crypto_powerups = [SigningPower]
 
-    def __init__(self, policy_encrypting_key=None, controller: bool = True, *args, **kwargs):
+    def __init__(self,
+                 policy_encrypting_key=None,
+                 controller: bool = True,
+                 parallel_encryption: bool = False,
+                 encryption_processes: int = None,
+                 *args, **kwargs):
         self._policy_pubkey = policy_encrypting_key
 
+        # Batch encryption (in-thread unless asked to use a process pool, started here rather than on a request thread)
+        self._encryption_executor = None
+        if parallel_encryption:
+            self._encryption_executor = EncryptionExecutor(max_workers=encryption_processes)
+
         # Encrico never uses the blockchain, hence federated_only)
         kwargs['federated_only'] = True
         kwargs['known_node_class'] = Ursula
@@ -1559,6 +1861,28 @@ class Enrico(Character):
         message_kit.policy_pubkey = self.policy_pubkey  # TODO: We can probably do better here.  NRN
         return message_kit, signature
 
+    def encrypt_messages(self, plaintexts: Iterable[bytes]) -> Iterator[Tuple[UmbralMessageKit, Signature]]:
+        """
+        Encrypts a stream of plaintexts, yielding (message_kit, signature) pairs in the same order.
+        With `parallel_encryption`, encryption is spread over a pool of processes.
+        """
+        if not self._encryption_executor:
+            for plaintext in plaintexts:
+                yield self.encrypt_message(plaintext=plaintext)
+            return
+
+        encrypted = self._encryption_executor.encrypt_and_sign(self.policy_pubkey,
+                                                               plaintexts=plaintexts,
+                                                               signer=self.stamp)
+        for message_kit, signature in encrypted:
+            message_kit.policy_pubkey = self.policy_pubkey
+            yield message_kit, signature
+
+    def disconnect(self) -> None:
+        """Shuts down the encryption pool, if any.  A later batch starts a new one."""
+        if self._encryption_executor:
+            self._encryption_executor.shutdown(wait=False)
+
     @classmethod
     def from_alice(cls, alice: Alice, label: bytes):
         """
@@ -1617,4 +1941,33 @@ class Enrico(Character):
 
             return Response(json.dumps(response_data), status=200)
 
+        @enrico_control.route('/encrypt_messages', methods=['POST'])
+        def encrypt_messages():
+            """
+            Character control endpoint for encrypting a batch of messages for a policy
+            and receiving their messagekits (and signatures), in the same order.
+            """
+            try:
+                request_data = json.loads(request.data)
+                messages = request_data['messages']
+            except (KeyError, JSONDecodeError) as e:
+                return Response(str(e), status=400)
+
+            # Encrypt
+            plaintexts = (bytes(message, encoding='utf-8') for message in messages)
+            message_kits, signatures = list(), list()
+            for message_kit, signature in drone_enrico.encrypt_messages(plaintexts):
+                message_kits.append(b64encode(message_kit.to_bytes()).decode())
+                signatures.append(b64encode(bytes(signature)).decode())
+
+            response_data = {
+                'result': {
+                    'message_kits': message_kits,
+                    'signatures': signatures,
+                },
+                'version': str(nucypher.__version__)
+            }
+
+            return Response(json.dumps(response_data), status=200)
+
         return controller
@@ -37,24 +37,32 @@ def enrico():
 @option_policy_encrypting_key(required=True)
 @option_dry_run
 @click.option('--http-port', help="The host port to run Enrico HTTP services on", type=NETWORK_PORT)
+@click.option('--parallel-encryption', help="Encrypt batches of messages on a pool of processes", is_flag=True, default=False)
+@click.option('--encryption-processes', help="Number of encryption processes (default: one per core)", type=click.IntRange(min=1))
 @group_general_config
-def run(general_config, policy_encrypting_key, dry_run, http_port):
+def run(general_config, policy_encrypting_key, dry_run, http_port, parallel_encryption, encryption_processes):
     """Start Enrico's controller."""
 
     # Setup
     emitter = setup_emitter(general_config, policy_encrypting_key)
-    ENRICO = _create_enrico(emitter, policy_encrypting_key)
-
-    # RPC
-    if general_config.json_ipc:
-        rpc_controller = ENRICO.make_rpc_controller()
-        _transport = rpc_controller.make_control_transport()
-        rpc_controller.start()
-        return
-
-    ENRICO.log.info('Starting HTTP Character Web Controller')
-    controller = ENRICO.make_web_controller()
-    return controller.start(http_port=http_port, dry_run=dry_run)
+    ENRICO = _create_enrico(emitter,
+                            policy_encrypting_key,
+                            parallel_encryption=parallel_encryption,
+                            encryption_processes=encryption_processes)
+
+    try:
+        # RPC
+        if general_config.json_ipc:
+            rpc_controller = ENRICO.make_rpc_controller()
+            _transport = rpc_controller.make_control_transport()
+            rpc_controller.start()
+            return
+
+        ENRICO.log.info('Starting HTTP Character Web Controller')
+        controller = ENRICO.make_web_controller()
+        return controller.start(http_port=http_port, dry_run=dry_run)
+    finally:
+        ENRICO.disconnect()  # Once the reactor stops
 
 
 @enrico.command()
@@ -85,8 +93,10 @@ def encrypt(general_config, policy_encrypting_key, message, file, ipfs):
     return response
 
 
-def _create_enrico(emitter, policy_encrypting_key) -> Enrico:
+def _create_enrico(emitter, policy_encrypting_key, parallel_encryption=False, encryption_processes=None) -> Enrico:
     policy_encrypting_key = UmbralPublicKey.from_bytes(bytes.fromhex(policy_encrypting_key))
-    ENRICO = Enrico(policy_encrypting_key=policy_encrypting_key)
+    ENRICO = Enrico(policy_encrypting_key=policy_encrypting_key,
+                    parallel_encryption=parallel_encryption,
+                    encryption_processes=encryption_processes)
     ENRICO.controller.emitter = emitter
     return ENRICO
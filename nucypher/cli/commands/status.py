@@ -25,6 +25,7 @@ from nucypher.blockchain.eth.constants import (
     POLICY_MANAGER_CONTRACT_NAME,
     STAKING_ESCROW_CONTRACT_NAME
 )
+from nucypher.blockchain.eth.events import EventIndex
 from nucypher.blockchain.eth.utils import datetime_at_period
 from nucypher.cli.config import group_general_config
 from nucypher.cli.options import (
@@ -120,9 +121,11 @@ def locked_tokens(general_config, registry_options, periods):
 @option_event_name
 @click.option('--from-block', help="Collect events from this block number", type=click.INT)
 @click.option('--to-block', help="Collect events until this block number", type=click.INT)
+@click.option('--event-index', 'event_index_filepath', help="Index events in this local database, and read them from there",
+              type=click.Path(dir_okay=False))
 # TODO: Add options for number of periods in the past (default current period), or range of blocks
 # TODO: Add way to input additional event filters? (e.g., staker, etc)
-def events(general_config, registry_options, contract_name, from_block, to_block, event_name):
+def events(general_config, registry_options, contract_name, from_block, to_block, event_name, event_index_filepath):
     """Show events associated to NuCypher contracts."""
 
     emitter, registry, blockchain = registry_options.setup(general_config=general_config)
@@ -150,18 +153,44 @@ def events(general_config, registry_options, contract_name, from_block, to_block
     if to_block is None:
         to_block = 'latest'
 
-    # TODO: additional input validation for block numbers
-    emitter.echo(f"Showing events from block {from_block} to {to_block}")
-    for contract_name in contract_names:
-        title = f" {contract_name} Events ".center(40, "-")
-        emitter.echo(f"\n{title}\n", bold=True, color='green')
-        agent = ContractAgency.get_agent_by_contract_name(contract_name, registry)
-        names = agent.events.names if not event_name else [event_name]
-        for name in names:
-            emitter.echo(f"{name}:", bold=True, color='yellow')
-            event_method = agent.events[name]
-            for event_record in event_method(from_block=from_block, to_block=to_block):
-                emitter.echo(f"  - {event_record}")
+    event_index = EventIndex(filepath=event_index_filepath) if event_index_filepath else None
+    try:
+        if event_index:
+            agents = [ContractAgency.get_agent_by_contract_name(name, registry) for name in contract_names]
+            indexed = event_index.sync(agents=agents)
+            emitter.echo(f"Indexed {indexed} new events in {event_index_filepath}")
+
+        # TODO: additional input validation for block numbers
+        emitter.echo(f"Showing events from block {from_block} to {to_block}")
+        for contract_name in contract_names:
+            title = f" {contract_name} Events ".center(40, "-")
+            emitter.echo(f"\n{title}\n", bold=True, color='green')
+            agent = ContractAgency.get_agent_by_contract_name(contract_name, registry)
+            names = agent.events.names if not event_name else [event_name]
+            if event_index:
+                # The index stops short of the newest, unconfirmed blocks; those are read from the chain.
+                checkpoint = event_index.checkpoint(agent)
+                indexed_to_block = checkpoint if checkpoint is not None else -1
+                if to_block != 'latest':
+                    indexed_to_block = min(indexed_to_block, to_block)
+                unindexed_from_block = max(from_block, indexed_to_block + 1)
+            for name in names:
+                emitter.echo(f"{name}:", bold=True, color='yellow')
+                event_method = agent.events[name]
+                if event_index:
+                    event_records = list(event_index.query(agent=agent,
+                                                           event_name=name,
+                                                           from_block=from_block,
+                                                           to_block=indexed_to_block))
+                    if to_block == 'latest' or unindexed_from_block <= to_block:
+                        event_records.extend(event_method(from_block=unindexed_from_block, to_block=to_block))
+                else:
+                    event_records = event_method(from_block=from_block, to_block=to_block)
+                for event_record in event_records:
+                    emitter.echo(f"  - {event_record}")
+    finally:
+        if event_index:
+            event_index.close()
 
 
 @status.command(name='fee-range')
@@ -94,7 +94,9 @@ class UrsulaConfigOptions:
                  light,
                  gas_strategy,
                  signer_uri,
-                 availability_check):
+                 availability_check,
+                 teachers_per_round,
+                 verification_workers):
 
         if federated_only:
             if geth:
@@ -125,6 +127,8 @@ class UrsulaConfigOptions:
         self.light = light
         self.gas_strategy = gas_strategy
         self.availability_check = availability_check
+        self.teachers_per_learning_round = teachers_per_round
+        self.verification_workers = verification_workers
 
     def create_config(self, emitter, config_file):
         if self.dev:
@@ -144,7 +148,9 @@ class UrsulaConfigOptions:
                 rest_host=self.rest_host,
                 rest_port=self.rest_port,
                 db_filepath=self.db_filepath,
-                availability_check=self.availability_check
+                availability_check=self.availability_check,
+                teachers_per_learning_round=self.teachers_per_learning_round,
+                verification_workers=self.verification_workers
             )
         else:
             try:
@@ -163,7 +169,9 @@ class UrsulaConfigOptions:
                     poa=self.poa,
                     light=self.light,
                     federated_only=self.federated_only,
-                    availability_check=self.availability_check
+                    availability_check=self.availability_check,
+                    teachers_per_learning_round=self.teachers_per_learning_round,
+                    verification_workers=self.verification_workers
                 )
             except FileNotFoundError:
                 return handle_missing_configuration_file(character_config_class=UrsulaConfiguration, config_file=config_file)
@@ -209,7 +217,9 @@ class UrsulaConfigOptions:
                                             gas_strategy=self.gas_strategy,
                                             poa=self.poa,
                                             light=self.light,
-                                            availability_check=self.availability_check)
+                                            availability_check=self.availability_check,
+                                            teachers_per_learning_round=self.teachers_per_learning_round,
+                                            verification_workers=self.verification_workers)
 
     def get_updates(self) -> dict:
         payload = dict(rest_host=self.rest_host,
@@ -224,7 +234,9 @@ class UrsulaConfigOptions:
                        gas_strategy=self.gas_strategy,
                        poa=self.poa,
                        light=self.light,
-                       availability_check=self.availability_check)
+                       availability_check=self.availability_check,
+                       teachers_per_learning_round=self.teachers_per_learning_round,
+                       verification_workers=self.verification_workers)
         # Depends on defaults being set on Configuration classes, filtrates None values
         updates = {k: v for k, v in payload.items() if v is not None}
         return updates
@@ -246,7 +258,9 @@ group_config_options = group_options(
     poa=option_poa,
     light=option_light,
     dev=option_dev,
-    availability_check=click.option('--availability-check/--disable-availability-check', help="Enable or disable self-health checks while running", is_flag=True, default=None)
+    availability_check=click.option('--availability-check/--disable-availability-check', help="Enable or disable self-health checks while running", is_flag=True, default=None),
+    teachers_per_round=click.option('--teachers-per-round', help="How many teachers to learn from at once in each learning round", type=click.IntRange(min=1)),
+    verification_workers=click.option('--verification-workers', help="How many newly learned nodes to verify at once", type=click.IntRange(min=1))
 )
 
 
@@ -112,7 +112,8 @@ def paint_locked_tokens_status(emitter, agent, periods) -> None:
 
     MAX_ROWS = 30
     period_range = list(range(1, periods + 1))
-    token_counter = Counter({day: agent.get_all_locked_tokens(day) for day in period_range})
+    projection = agent.get_locked_tokens_projection(periods=periods)
+    token_counter = Counter(projection.time_series(start=1, end=periods))
 
     width = 60  # Adjust to desired width
     longest_key = max(len(str(key)) for key in token_counter)
@@ -44,6 +44,8 @@ class UrsulaConfiguration(CharacterConfiguration):
     __DEFAULT_TLS_CURVE = ec.SECP384R1
     DEFAULT_DB_NAME = '{}.db'.format(NAME)
     DEFAULT_AVAILABILITY_CHECKS = True
+    DEFAULT_PARALLEL_REENCRYPTION = False
+    DEFAULT_REENCRYPTION_PROCESSES = None  # One per core
     LOCAL_SIGNERS_ALLOWED = True
 
     def __init__(self,
@@ -55,6 +57,8 @@ class UrsulaConfiguration(CharacterConfiguration):
                  tls_curve: EllipticCurve = None,
                  certificate: Certificate = None,
                  availability_check: bool = None,
+                 parallel_reencryption: bool = None,
+                 reencryption_processes: int = None,
                  *args, **kwargs) -> None:
 
         if not rest_port:
@@ -69,6 +73,8 @@ class UrsulaConfiguration(CharacterConfiguration):
         self.db_filepath = db_filepath or UNINITIALIZED_CONFIGURATION
         self.worker_address = worker_address
         self.availability_check = availability_check if availability_check is not None else self.DEFAULT_AVAILABILITY_CHECKS
+        self.parallel_reencryption = parallel_reencryption if parallel_reencryption is not None else self.DEFAULT_PARALLEL_REENCRYPTION
+        self.reencryption_processes = reencryption_processes or self.DEFAULT_REENCRYPTION_PROCESSES
         super().__init__(dev_mode=dev_mode, *args, **kwargs)
 
     def generate_runtime_filepaths(self, config_root: str) -> dict:
@@ -88,6 +94,8 @@ class UrsulaConfiguration(CharacterConfiguration):
             rest_port=self.rest_port,
             db_filepath=self.db_filepath,
             availability_check=self.availability_check,
+            parallel_reencryption=self.parallel_reencryption,
+            reencryption_processes=self.reencryption_processes,
         )
         return {**super().static_payload(), **payload}
 
@@ -189,6 +197,29 @@ class BobConfiguration(CharacterConfiguration):
     NAME = CHARACTER_CLASS.__name__.lower()
 
     DEFAULT_CONTROLLER_PORT = 7151
+    DEFAULT_TREASURE_MAP_DB_NAME = 'treasure_maps.db'
+    DEFAULT_TREASURE_MAP_TTL = 60 * 60  # seconds; Alice may revoke a policy and grant its label again
+
+    def __init__(self,
+                 treasure_map_db_filepath: str = None,
+                 treasure_map_ttl: int = DEFAULT_TREASURE_MAP_TTL,
+                 *args, **kwargs) -> None:
+        self.treasure_map_db_filepath = treasure_map_db_filepath or UNINITIALIZED_CONFIGURATION
+        self.treasure_map_ttl = treasure_map_ttl
+        super().__init__(*args, **kwargs)
+
+    def generate_runtime_filepaths(self, config_root: str) -> dict:
+        base_filepaths = super().generate_runtime_filepaths(config_root=config_root)
+        filepaths = dict(treasure_map_db_filepath=os.path.join(config_root, self.DEFAULT_TREASURE_MAP_DB_NAME))
+        base_filepaths.update(filepaths)
+        return base_filepaths
+
+    def static_payload(self) -> dict:
+        # Development Bobs are ephemeral, so there is nothing to gain from caching their TreasureMaps.
+        treasure_map_db_filepath = None if self.dev_mode else self.treasure_map_db_filepath
+        payload = dict(treasure_map_db_filepath=treasure_map_db_filepath,
+                       treasure_map_ttl=self.treasure_map_ttl)
+        return {**super().static_payload(), **payload}
 
     def write_keyring(self, password: str, **generation_kwargs) -> NucypherKeyring:
         return super().write_keyring(password=password,
@@ -196,6 +227,11 @@ class BobConfiguration(CharacterConfiguration):
                                      rest=False,
                                      **generation_kwargs)
 
+    def destroy(self) -> None:
+        if os.path.isfile(self.treasure_map_db_filepath):
+            os.remove(self.treasure_map_db_filepath)
+        super().destroy()
+
 
 class FelixConfiguration(CharacterConfiguration):
     from nucypher.characters.chaotic import Felix
@@ -64,6 +64,10 @@ class CharacterConfiguration(BaseConfiguration):
     # Gas
     DEFAULT_GAS_STRATEGY = 'fast'
 
+    # Learning
+    DEFAULT_TEACHERS_PER_LEARNING_ROUND = 1
+    DEFAULT_VERIFICATION_WORKERS = 1
+
     def __init__(self,
 
                  # Base
@@ -87,6 +91,8 @@ class CharacterConfiguration(BaseConfiguration):
                  learn_on_same_thread: bool = False,
                  abort_on_learning_error: bool = False,
                  start_learning_now: bool = True,
+                 teachers_per_learning_round: int = None,
+                 verification_workers: int = None,
 
                  # Network
                  controller_port: int = None,
@@ -149,6 +155,8 @@ class CharacterConfiguration(BaseConfiguration):
         self.learn_on_same_thread = learn_on_same_thread
         self.abort_on_learning_error = abort_on_learning_error
         self.start_learning_now = start_learning_now
+        self.teachers_per_learning_round = teachers_per_learning_round or self.DEFAULT_TEACHERS_PER_LEARNING_ROUND
+        self.verification_workers = verification_workers or self.DEFAULT_VERIFICATION_WORKERS
         self.save_metadata = save_metadata
         self.reload_metadata = reload_metadata
         self.known_nodes = known_nodes or set()  # handpicked
@@ -398,6 +406,8 @@ class CharacterConfiguration(BaseConfiguration):
             learn_on_same_thread=self.learn_on_same_thread,
             abort_on_learning_error=self.abort_on_learning_error,
             start_learning_now=self.start_learning_now,
+            teachers_per_learning_round=self.teachers_per_learning_round,
+            verification_workers=self.verification_workers,
             save_metadata=self.save_metadata,
             node_storage=self.node_storage.payload(),
         )
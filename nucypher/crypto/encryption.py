@@ -0,0 +1,120 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from threading import Lock
+from typing import Iterable, Iterator, List, Tuple
+
+from constant_sorrow import constants
+from umbral import pre
+from umbral.config import default_params
+from umbral.keys import UmbralPublicKey
+from umbral.signing import Signature
+
+from nucypher.crypto.kits import UmbralMessageKit
+from nucypher.crypto.signing import SignatureStamp
+
+
+def encrypt_payloads(recipient_pubkey_bytes: bytes, payloads: List[bytes]) -> List[Tuple[bytes, bytes]]:
+    """
+    Encrypts a chunk of payloads for the same recipient.  Meant to be run on a worker process,
+    so everything goes in and out as bytes; payloads are already signed, and no private key ever leaves
+    the encrypting process.
+    """
+    recipient_pubkey = UmbralPublicKey.from_bytes(recipient_pubkey_bytes)
+    results = list()
+    for payload in payloads:
+        ciphertext, capsule = pre.encrypt(recipient_pubkey, payload)
+        results.append((ciphertext, bytes(capsule)))
+    return results
+
+
+class EncryptionExecutor:
+    """
+    Spreads the encryption of many messages for the same policy over a pool of processes,
+    one per core by default.  The pool is started along with the executor, and its workers are
+    spawned rather than forked, so that they don't inherit locks held by the caller's other threads.
+
+    Messages are signed on the calling process, sent to the pool in chunks, and yielded back in order,
+    with a bounded number of chunks in flight so that arbitrarily long streams can be encrypted.
+    """
+
+    DEFAULT_CHUNK_SIZE = 64
+
+    def __init__(self, max_workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.max_workers = max_workers or os.cpu_count()
+        self.chunk_size = chunk_size
+        self.__pool = None
+        self.__pool_lock = Lock()
+        self.start()
+
+    def start(self) -> None:
+        with self.__pool_lock:
+            if self.__pool is None:
+                self.__pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                  mp_context=multiprocessing.get_context('spawn'))
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        self.start()  # Again, if it was shut down
+        return self.__pool
+
+    def encrypt_and_sign(self,
+                         recipient_pubkey_enc: UmbralPublicKey,
+                         plaintexts: Iterable[bytes],
+                         signer: SignatureStamp
+                         ) -> Iterator[Tuple[UmbralMessageKit, Signature]]:
+        """Like `nucypher.crypto.api.encrypt_and_sign`, signing each plaintext before encrypting it."""
+        recipient_pubkey_bytes = bytes(recipient_pubkey_enc)
+        sender_verifying_key = signer.as_umbral_pubkey()
+        max_chunks_in_flight = 2 * self.max_workers
+
+        plaintexts = iter(plaintexts)
+        in_flight = deque()
+        while True:
+            while len(in_flight) < max_chunks_in_flight:
+                chunk = list(islice(plaintexts, self.chunk_size))
+                if not chunk:
+                    break
+                signatures = [signer(plaintext) for plaintext in chunk]
+                payloads = [constants.SIGNATURE_TO_FOLLOW + signature + plaintext
+                            for signature, plaintext in zip(signatures, chunk)]
+                future = self.pool.submit(encrypt_payloads, recipient_pubkey_bytes, payloads)
+                in_flight.append((signatures, future))
+
+            if not in_flight:
+                return
+
+            signatures, future = in_flight.popleft()
+            for signature, (ciphertext, capsule_bytes) in zip(signatures, future.result()):
+                capsule = pre.Capsule.from_bytes(capsule_bytes, params=default_params())
+                message_kit = UmbralMessageKit(ciphertext=ciphertext,
+                                               capsule=capsule,
+                                               sender_verifying_key=sender_verifying_key,
+                                               signature=signature)
+                yield message_kit, signature
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self.__pool_lock:
+            if self.__pool is not None:
+                self.__pool.shutdown(wait=wait)
+                self.__pool = None
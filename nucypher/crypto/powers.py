@@ -17,6 +17,9 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 
 import inspect
+from collections import OrderedDict
+from threading import Lock
+
 from hexbytes import HexBytes
 from typing import List, Optional, Tuple
 from umbral import pre
@@ -268,20 +271,52 @@ class DerivedKeyBasedPower(CryptoPowerUp):
 
 class DelegatingPower(DerivedKeyBasedPower):
 
+    # Label keypairs are derived with HKDF, so the most recently used ones are kept around.
+    DEFAULT_LABEL_CACHE_SIZE = 512
+
     def __init__(self,
                  keying_material: Optional[bytes] = None,
-                 password: Optional[bytes] = None) -> None:
+                 password: Optional[bytes] = None,
+                 label_cache_size: int = DEFAULT_LABEL_CACHE_SIZE) -> None:
         if keying_material is None:
             self.__umbral_keying_material = UmbralKeyingMaterial()
         else:
             self.__umbral_keying_material = UmbralKeyingMaterial.from_bytes(key_bytes=keying_material,
                                                                             password=password)
+        self.__label_cache_size = label_cache_size
+        self.__label_powers = OrderedDict()  # label -> DecryptingPower
+        self.__label_cache_lock = Lock()
+
+    def _get_decrypting_power_from_label(self, label: bytes) -> 'DecryptingPower':
+        with self.__label_cache_lock:
+            try:
+                self.__label_powers.move_to_end(label)
+                return self.__label_powers[label]
+            except KeyError:
+                pass
+
+        label_privkey = self.__umbral_keying_material.derive_privkey_by_label(label)
+        label_keypair = keypairs.DecryptingKeypair(private_key=label_privkey)
+        decrypting_power = DecryptingPower(keypair=label_keypair)
+
+        with self.__label_cache_lock:
+            self.__label_powers[label] = decrypting_power
+            while len(self.__label_powers) > self.__label_cache_size:
+                # Umbral keys clear their bignums when freed, so evicted keys are wiped
+                # as soon as whoever might be using them is done with them.
+                self.__label_powers.popitem(last=False)
+        return decrypting_power
+
+    def forget_label_keys(self) -> None:
+        """Drops all the cached keys derived from labels."""
+        with self.__label_cache_lock:
+            self.__label_powers.clear()
 
     def _get_privkey_from_label(self, label):
-        return self.__umbral_keying_material.derive_privkey_by_label(label)
+        return self._get_decrypting_power_from_label(label).keypair._privkey
 
     def get_pubkey_from_label(self, label):
-        return self._get_privkey_from_label(label).get_pubkey()
+        return self._get_decrypting_power_from_label(label).public_key()
 
     def generate_kfrags(self,
                         bob_pubkey_enc,
@@ -312,7 +347,4 @@ class DelegatingPower(DerivedKeyBasedPower):
         return __private_key.get_pubkey(), kfrags
 
     def get_decrypting_power_from_label(self, label):
-        label_privkey = self._get_privkey_from_label(label)
-        label_keypair = keypairs.DecryptingKeypair(private_key=label_privkey)
-        decrypting_power = DecryptingPower(keypair=label_keypair)
-        return decrypting_power
+        return self._get_decrypting_power_from_label(label)
@@ -0,0 +1,91 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from threading import Lock
+from typing import Iterable, List, Tuple
+
+from umbral import pre
+from umbral.cfrags import CapsuleFrag
+from umbral.config import default_params
+from umbral.keys import UmbralPublicKey
+from umbral.kfrags import KFrag
+
+
+def reencrypt_capsule(kfrag_bytes: bytes,
+                      capsule_bytes: bytes,
+                      alice_verifying_key_bytes: bytes,
+                      metadata: bytes) -> bytes:
+    """
+    Re-encrypts a single capsule.  Meant to be run on a worker process, so everything
+    goes in and out as bytes; no key material other than the KFrag ever leaves Ursula's process.
+    """
+    kfrag = KFrag.from_bytes(kfrag_bytes)
+    capsule = pre.Capsule.from_bytes(capsule_bytes, params=default_params())
+    capsule.set_correctness_keys(verifying=UmbralPublicKey.from_bytes(alice_verifying_key_bytes))
+    cfrag = pre.reencrypt(kfrag, capsule, metadata=metadata)
+    return bytes(cfrag)
+
+
+class ReencryptionExecutor:
+    """
+    Spreads the re-encryption of a WorkOrder's capsules over a pool of processes,
+    one per core by default.
+
+    The worker processes are spawned rather than forked: Ursula serves requests on many threads,
+    and a child forked from one of them could inherit a lock held by another, and deadlock on it.
+    """
+
+    def __init__(self, max_workers: int = None) -> None:
+        self.max_workers = max_workers or os.cpu_count()
+        self.__pool = None
+        self.__pool_lock = Lock()
+        self.start()
+
+    def start(self) -> None:
+        with self.__pool_lock:
+            if self.__pool is None:
+                self.__pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                  mp_context=multiprocessing.get_context('spawn'))
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        self.start()  # Again, if it was shut down
+        return self.__pool
+
+    def reencrypt(self,
+                  kfrag: KFrag,
+                  capsules_and_metadata: Iterable[Tuple[pre.Capsule, bytes]],
+                  alice_verifying_key: UmbralPublicKey
+                  ) -> List[CapsuleFrag]:
+        kfrag_bytes, alice_verifying_key_bytes = bytes(kfrag), bytes(alice_verifying_key)
+        futures = [self.pool.submit(reencrypt_capsule,
+                                    kfrag_bytes,
+                                    bytes(capsule),
+                                    alice_verifying_key_bytes,
+                                    metadata)
+                   for capsule, metadata in capsules_and_metadata]
+        return [CapsuleFrag.from_bytes(future.result()) for future in futures]
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self.__pool_lock:
+            if self.__pool is not None:
+                self.__pool.shutdown(wait=wait)
+                self.__pool = None
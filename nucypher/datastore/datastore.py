@@ -18,16 +18,22 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import maya
 from bytestring_splitter import BytestringSplitter
-from datetime import datetime
+from datetime import datetime, timedelta
+from sqlalchemy import func
+from sqlalchemy.engine import create_engine
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import sessionmaker
-from typing import List
+from sqlalchemy.pool import StaticPool
+from threading import Lock
+from typing import Dict, List, Tuple
 from umbral.keys import UmbralPublicKey
 from umbral.kfrags import KFrag
 
 from nucypher.crypto.signing import Signature
 from nucypher.crypto.utils import fingerprint_from_key
-from nucypher.datastore.db.models import Key, PolicyArrangement, Workorder
+from nucypher.datastore.db import Base
+from nucypher.datastore.db.models import Key, PolicyArrangement, TreasureMap, Workorder
+from nucypher.datastore.threading import ThreadedSession, serialize_sessions
 
 
 class NotFound(Exception):
@@ -280,3 +286,194 @@ class Datastore:
         deleted = workorders.delete()
         self.__commit(session=session)
         return deleted
+
+    #
+    # Treasure Maps
+    #
+
+    def store_treasure_map(self, map_id: bytes, treasure_map: bytes, expiration: datetime, session=None) -> TreasureMap:
+        """
+        Adds (or replaces) the serialized TreasureMap with ID map_id to the Keystore.
+        """
+        session = session or self._session_on_init_thread
+
+        stored_map = session.merge(TreasureMap(id=map_id, treasure_map=treasure_map, expiration=expiration))
+        self.__commit(session=session)
+        return stored_map
+
+    def get_treasure_map(self, map_id: bytes, session=None, now=None) -> bytes:
+        """
+        Returns the serialized TreasureMap with ID map_id.
+        If now is given, a TreasureMap that has expired by then counts as not found.
+        """
+        session = session or self._session_on_init_thread
+
+        query = session.query(TreasureMap).filter_by(id=map_id)
+        if now is not None:
+            query = query.filter(TreasureMap.expiration > now)
+        stored_map = query.first()
+        if not stored_map:
+            raise NotFound(f"No TreasureMap {map_id.hex()} found in datastore.")
+        return stored_map.treasure_map
+
+    def get_all_treasure_maps(self, session=None, now=None) -> List[Tuple[bytes, bytes]]:
+        """
+        Returns the ID and serialized form of every TreasureMap that has not expired by now.
+        """
+        session = session or self._session_on_init_thread
+        now = now or datetime.now()
+
+        query = session.query(TreasureMap.id, TreasureMap.treasure_map).filter(TreasureMap.expiration > now)
+        return [(map_id, treasure_map) for map_id, treasure_map in query]
+
+    def del_treasure_map(self, map_id: bytes, session=None) -> int:
+        """
+        Deletes the TreasureMap with ID map_id from the Keystore.
+        """
+        session = session or self._session_on_init_thread
+
+        deleted_records = session.query(TreasureMap).filter_by(id=map_id).delete()
+        self.__commit(session=session)
+        return deleted_records
+
+    def del_expired_treasure_maps(self, session=None, now=None) -> int:
+        """
+        Deletes all expired TreasureMaps from the Keystore.
+        """
+        session = session or self._session_on_init_thread
+        now = now or datetime.now()
+
+        deleted_records = session.query(TreasureMap).filter(TreasureMap.expiration <= now).delete()
+        self.__commit(session=session)
+        return deleted_records
+
+    def get_treasure_maps_size(self, map_id: bytes = None, session=None) -> int:
+        """
+        Returns the bytes taken up by the TreasureMap with ID map_id, or by all of them without a map_id.
+        """
+        session = session or self._session_on_init_thread
+
+        query = session.query(func.sum(TreasureMap.size))
+        if map_id is not None:
+            query = query.filter_by(id=map_id)
+        return query.scalar() or 0
+
+    def evict_treasure_maps(self, max_bytes: int, session=None) -> int:
+        """
+        Deletes the TreasureMaps closest to expiration until the remaining ones take up at most max_bytes.
+        """
+        session = session or self._session_on_init_thread
+
+        total_bytes = self.get_treasure_maps_size(session=session)
+        if total_bytes <= max_bytes:
+            return 0
+
+        map_ids_to_evict = []
+        for map_id, size in session.query(TreasureMap.id, TreasureMap.size).order_by(TreasureMap.expiration):
+            if total_bytes <= max_bytes:
+                break
+            map_ids_to_evict.append(map_id)
+            total_bytes -= size
+
+        deleted_records = session.query(TreasureMap).filter(TreasureMap.id.in_(map_ids_to_evict)).delete(synchronize_session=False)
+        self.__commit(session=session)
+        return deleted_records
+
+
+def make_datastore(db_filepath: str = None) -> Datastore:
+    """
+    Creates a Datastore on a SQLite database at db_filepath, with all its tables;
+    without a db_filepath (or with ':memory:'), the database lives in memory.
+    """
+    # See: https://docs.sqlalchemy.org/en/rel_0_9/dialects/sqlite.html#connect-strings
+    if db_filepath and db_filepath != ':memory:':
+        engine = create_engine(f'sqlite:///{db_filepath}')
+    else:
+        # TODO: Is this a sane default? See #667
+        # An in-memory database only exists on the connection that made it, so every
+        # thread handling requests (eg, concurrent TreasureMap pushes) must share that one,
+        # and take turns with it so that their transactions don't interleave.
+        engine = create_engine('sqlite://',
+                               connect_args={'check_same_thread': False},
+                               poolclass=StaticPool)
+        serialize_sessions(engine)
+
+    Base.metadata.create_all(engine)
+    return Datastore(engine)
+
+
+class TreasureMapStore:
+    """
+    Ursula's TreasureMaps, kept in her datastore as the bytes they arrived as, so that they survive restarts
+    and can be served without being serialized again.
+
+    Every map expires ttl after it is stored; whenever the maps take up more than max_bytes,
+    the ones closest to expiration are evicted until they are back under EVICTION_TARGET of it.
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # 64 MiB
+    DEFAULT_TTL = timedelta(days=365)
+    EVICTION_TARGET = 0.9  # Fraction of max_bytes left after an eviction
+
+    def __init__(self, datastore: Datastore, max_bytes: int = None, ttl: timedelta = None) -> None:
+        self.datastore = datastore
+        self.max_bytes = max_bytes or self.DEFAULT_MAX_BYTES
+        self.ttl = ttl or self.DEFAULT_TTL
+
+        # Running total of the bytes stored, so that storing a map doesn't have to sum up the whole table.
+        # It is recounted (when next needed) after evictions, deletions and prunes.
+        self.__size = None
+        self.__size_lock = Lock()
+
+    def __setitem__(self, map_id: bytes, treasure_map) -> None:
+        self.store(map_id, bytes(treasure_map))
+
+    def __getitem__(self, map_id: bytes):
+        from nucypher.policy.collections import TreasureMap as PolicyTreasureMap  # Avoid circular import
+        return PolicyTreasureMap.from_bytes(self.get_bytes(map_id))
+
+    def __contains__(self, map_id: bytes) -> bool:
+        try:
+            self.get_bytes(map_id)
+        except KeyError:
+            return False
+        return True
+
+    def __delitem__(self, map_id: bytes) -> None:
+        with ThreadedSession(self.datastore.engine) as session:
+            deleted = self.datastore.del_treasure_map(map_id, session=session)
+        with self.__size_lock:
+            self.__size = None
+        if not deleted:
+            raise KeyError(map_id)
+
+    def get_bytes(self, map_id: bytes, now: datetime = None) -> bytes:
+        with ThreadedSession(self.datastore.engine) as session:
+            try:
+                return self.datastore.get_treasure_map(map_id, session=session, now=now)
+            except NotFound:
+                raise KeyError(map_id)
+
+    def unexpired(self, now: datetime = None) -> Dict[bytes, bytes]:
+        """Returns the serialized TreasureMaps that have not expired by now, by ID."""
+        with ThreadedSession(self.datastore.engine) as session:
+            return dict(self.datastore.get_all_treasure_maps(session=session, now=now))
+
+    def store(self, map_id: bytes, map_bytes: bytes, expiration: datetime = None) -> None:
+        expiration = expiration or datetime.now() + self.ttl
+        with ThreadedSession(self.datastore.engine) as session, self.__size_lock:
+            if self.__size is None:
+                self.__size = self.datastore.get_treasure_maps_size(session=session)
+            self.__size -= self.datastore.get_treasure_maps_size(map_id=map_id, session=session)  # If replaced
+            self.datastore.store_treasure_map(map_id, map_bytes, expiration=expiration, session=session)
+            self.__size += len(map_bytes)
+            if self.__size > self.max_bytes:
+                self.datastore.evict_treasure_maps(int(self.max_bytes * self.EVICTION_TARGET), session=session)
+                self.__size = None
+
+    def prune(self, now: datetime = None) -> int:
+        with ThreadedSession(self.datastore.engine) as session:
+            pruned = self.datastore.del_expired_treasure_maps(session=session, now=now)
+        with self.__size_lock:
+            self.__size = None
+        return pruned
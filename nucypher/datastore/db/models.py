@@ -93,3 +93,22 @@ class Workorder(Base):
 
     def __repr__(self):
         return f'{self.__class__.__name__}(id={self.id})'
+
+
+class TreasureMap(Base):
+    __tablename__ = 'treasuremaps'
+
+    id = Column(LargeBinary, unique=True, primary_key=True)
+    treasure_map = Column(LargeBinary)
+    size = Column(Integer)
+    expiration = Column(DateTime, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    def __init__(self, id, treasure_map, expiration) -> None:
+        self.id = id
+        self.treasure_map = treasure_map
+        self.size = len(treasure_map)
+        self.expiration = expiration
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(id={self.id})'
@@ -14,18 +14,39 @@ GNU Affero General Public License for more details.
 You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
+from threading import RLock
+from weakref import WeakKeyDictionary
+
 from sqlalchemy.orm import scoped_session, sessionmaker
 
+# Engines whose ThreadedSessions must take turns, each with its lock.
+_serialized_engines = WeakKeyDictionary()
+
+
+def serialize_sessions(sqlalchemy_engine) -> None:
+    """
+    Makes ThreadedSessions on this engine run one at a time, for engines whose threads all share
+    a single connection (eg, an in-memory SQLite database), where concurrent transactions would interleave.
+    """
+    _serialized_engines.setdefault(sqlalchemy_engine, RLock())
+
 
 class ThreadedSession:
 
     def __init__(self, sqlalchemy_engine) -> None:
         self.engine = sqlalchemy_engine
+        self._lock = _serialized_engines.get(sqlalchemy_engine)
 
     def __enter__(self):
+        if self._lock is not None:
+            self._lock.acquire()
         session_factory = sessionmaker(bind=self.engine)
         self.session = scoped_session(session_factory)
         return self.session
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.session.remove()
+        try:
+            self.session.remove()
+        finally:
+            if self._lock is not None:
+                self._lock.release()
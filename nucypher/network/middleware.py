@@ -28,6 +28,8 @@ from twisted.logger import Logger
 from umbral.cfrags import CapsuleFrag
 from umbral.signing import Signature
 
+from nucypher.crypto.signing import InvalidSignature
+
 EXEMPT_FROM_VERIFICATION.bool_value(False)
 
 
@@ -207,6 +209,31 @@ class RestMiddleware:
         cfrags_and_signatures = splitter.repeat(ursula_rest_response.content)
         return cfrags_and_signatures
 
+    def reencrypt_batch(self, work_orders):
+        """
+        Sends several WorkOrders, all for the same Ursula, in a single request.
+
+        Returns a list with the CFrags and signatures for each WorkOrder, in the same order
+        as work_orders, or None for the WorkOrders that Ursula couldn't service.
+        """
+        ursula = work_orders[0].ursula
+        if any(work_order.ursula != ursula for work_order in work_orders):
+            raise ValueError("All WorkOrders in a batch must be for the same Ursula.")
+
+        ursula_rest_response = self.send_work_order_payloads_to_ursula(ursula, work_orders)
+        signature, cfrag_byte_streams = BytestringSplitter(Signature)(ursula_rest_response.content,
+                                                                      return_remainder=True)
+        if not signature.verify(cfrag_byte_streams, ursula.stamp.as_umbral_pubkey()):
+            raise InvalidSignature(f"{ursula} didn't properly sign its batch of re-encrypted CFrags.")
+
+        cfrag_byte_streams = VariableLengthBytestring.dispense(cfrag_byte_streams)
+        if len(cfrag_byte_streams) != len(work_orders):
+            m = f"Sent {len(work_orders)} WorkOrders to {ursula}, but got {len(cfrag_byte_streams)} results back."
+            raise self.UnexpectedResponse(m, status=ursula_rest_response.status_code)
+
+        splitter = BytestringSplitter((CapsuleFrag, VariableLengthBytestring), Signature)
+        return [splitter.repeat(stream) if stream else None for stream in cfrag_byte_streams]
+
     def revoke_arrangement(self, ursula, revocation):
         # TODO: Implement revocation confirmations
         response = self.client.delete(
@@ -243,6 +270,18 @@ class RestMiddleware:
         )
         return response
 
+    def send_work_order_payloads_to_ursula(self, ursula, work_orders):
+        payload = b''.join(bytes(VariableLengthBytestring(work_order.arrangement_id)) +
+                           bytes(VariableLengthBytestring(work_order.payload()))
+                           for work_order in work_orders)
+        response = self.client.post(
+            node_or_sprout=ursula,
+            path="reencrypt",
+            data=payload,
+            timeout=2
+        )
+        return response
+
     def check_rest_availability(self, initiator, responder):
         response = self.client.post(node_or_sprout=responder,
                                     data=bytes(initiator),
@@ -17,8 +17,12 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import contextlib
 import random
-from collections import OrderedDict, defaultdict, deque, namedtuple
+from collections import Counter, OrderedDict, defaultdict, deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from contextlib import suppress
+from functools import partial
+from itertools import islice
+from threading import Lock
 
 import binascii
 import maya
@@ -30,8 +34,9 @@ from constant_sorrow import constant_or_bytes
 from constant_sorrow.constants import (CERTIFICATE_NOT_SAVED, FLEET_STATES_MATCH, NEVER_SEEN, NOT_SIGNED,
                                        NO_KNOWN_NODES, NO_STORAGE_AVAILIBLE, UNKNOWN_FLEET_STATE)
 from cryptography.x509 import Certificate
-from eth_utils import to_checksum_address
+from eth_utils import to_canonical_address, to_checksum_address
 from requests.exceptions import SSLError
+from sortedcontainers import SortedDict
 from twisted.internet import defer, reactor, task
 from twisted.internet.threads import deferToThread
 from twisted.logger import Logger
@@ -80,6 +85,100 @@ def icon_from_checksum(checksum,
     )
 
 
+class FleetStateChecksum:
+    """
+    An incrementally maintained checksum over a fleet of nodes.
+
+    Each node is represented by the digest of its bytes and placed in one of a fixed number of buckets
+    according to the leading byte of its address.  The bucket digests are the leaves of a binary Merkle tree
+    whose root is the fleet state checksum.  Adding, replacing, or removing a node only rehashes its bucket
+    and the path from that bucket to the root, and this work is deferred until the root is next requested.
+    """
+
+    _BUCKET_BITS = 8
+    _EMPTY_DIGEST = bytes(32)
+
+    def __init__(self):
+        self._bucket_count = 2 ** self._BUCKET_BITS
+        self._buckets = [dict() for _ in range(self._bucket_count)]
+        self._tree = [self._EMPTY_DIGEST] * (2 * self._bucket_count)  # Heap layout; the root is at index 1.
+        self._dirty_buckets = set(range(self._bucket_count))
+
+    def _bucket_index(self, checksum_address: str) -> int:
+        return int(checksum_address[2:2 + self._BUCKET_BITS // 4], 16)
+
+    def add(self, node) -> None:
+        """Adds a node, or replaces the existing node with the same address."""
+        index = self._bucket_index(node.checksum_address)
+        self._buckets[index][node.checksum_address] = keccak_digest(bytes(node))
+        self._dirty_buckets.add(index)
+
+    def remove(self, checksum_address: str) -> None:
+        index = self._bucket_index(checksum_address)
+        del self._buckets[index][checksum_address]
+        self._dirty_buckets.add(index)
+
+    def digest(self) -> bytes:
+        if self._dirty_buckets:
+            self._rehash()
+        return self._tree[1]
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+    def _rehash(self) -> None:
+        dirty_parents = set()
+        for index in self._dirty_buckets:
+            bucket = self._buckets[index]
+            if bucket:
+                bucket_digest = keccak_digest(*(bucket[address] for address in sorted(bucket)))
+            else:
+                bucket_digest = self._EMPTY_DIGEST
+            position = self._bucket_count + index
+            self._tree[position] = bucket_digest
+            dirty_parents.add(position // 2)
+        self._dirty_buckets.clear()
+
+        # Walk up one level at a time so that siblings sharing a parent are only hashed once.
+        while dirty_parents:
+            next_parents = set()
+            for position in dirty_parents:
+                self._tree[position] = keccak_digest(self._tree[2 * position], self._tree[2 * position + 1])
+                if position > 1:
+                    next_parents.add(position // 2)
+            dirty_parents = next_parents
+
+
+class NodeVerificationPipeline:
+    """
+    Verifies nodes on a bounded pool of worker threads.
+
+    No more than max_pending verifications are queued or in flight at once; further nodes are only
+    taken from the input as earlier verifications complete, and results are yielded in completion order.
+    """
+
+    def __init__(self, verifier, max_workers: int, max_pending: int = None):
+        self.verifier = verifier
+        self.max_workers = max_workers
+        self.max_pending = max_pending or 2 * max_workers
+
+    def verify(self, nodes):
+        """
+        Yields (node, future) pairs as each verification completes.
+        """
+        nodes = iter(nodes)
+        pending = dict()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                for node in islice(nodes, self.max_pending - len(pending)):
+                    pending[executor.submit(self.verifier, node)] = node
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future
+
+
 class FleetStateTracker:
     """
     A representation of a fleet of NuCypher nodes.
@@ -97,15 +196,29 @@ class FleetStateTracker:
         self.additional_nodes_to_track = []
         self.updated = maya.now()
         self._nodes = OrderedDict()
+        self._sorted_nodes = SortedDict()
+        self._timestamps = dict()  # Timestamp epochs, by canonical address
+        self._fleet_checksum = FleetStateChecksum()
         self.states = OrderedDict()
 
     def __setitem__(self, key, value):
         self._nodes[key] = value
+        self._track_node(value)
 
         if self._tracking:
             self.log.info("Updating fleet state after saving node {}".format(value))
             self.record_fleet_state()
 
+    def __delitem__(self, key):
+        node = self._nodes.pop(key)
+        del self._sorted_nodes[node.checksum_address]
+        del self._timestamps[to_canonical_address(node.checksum_address)]
+        self._fleet_checksum.remove(node.checksum_address)
+
+        if self._tracking:
+            self.log.info("Updating fleet state after forgetting node {}".format(node))
+            self.record_fleet_state()
+
     def __getitem__(self, item):
         return self._nodes[item]
 
@@ -163,24 +276,38 @@ class FleetStateTracker:
         fleet_state_updated_bytes = self.updated.epoch.to_bytes(4, byteorder="big")
         return fleet_state_checksum_bytes + fleet_state_updated_bytes
 
+    def _track_node(self, node):
+        self._sorted_nodes[node.checksum_address] = node
+        self._timestamps[to_canonical_address(node.checksum_address)] = node.timestamp.epoch
+        self._fleet_checksum.add(node)
+
+    def is_up_to_date(self, canonical_address: bytes, timestamp_epoch: int) -> bool:
+        """
+        True if we already track the node with this address, at this timestamp or a later one.
+        """
+        try:
+            return self._timestamps[canonical_address] >= timestamp_epoch
+        except KeyError:
+            return False
+
     def record_fleet_state(self, additional_nodes_to_track=None):
         if additional_nodes_to_track:
             self.additional_nodes_to_track.extend(additional_nodes_to_track)
+            for node in additional_nodes_to_track:
+                self._track_node(node)
         if not self._nodes:
             # No news here.
             return
-        sorted_nodes = self.sorted()
 
-        sorted_nodes_joined = b"".join(bytes(n) for n in sorted_nodes)
-        checksum = keccak_digest(sorted_nodes_joined).hex()
+        checksum = self._fleet_checksum.hexdigest()
         if checksum not in self.states:
-            self.checksum = keccak_digest(b"".join(bytes(n) for n in self.sorted())).hex()
+            self.checksum = checksum
             self.updated = maya.now()
             # For now we store the sorted node list.  Someday we probably spin this out into
             # its own class, FleetState, and use it as the basis for partial updates.
             new_state = self.FleetState(nickname=self.nickname,
                                         metadata=self.nickname_metadata,
-                                        nodes=sorted_nodes,
+                                        nodes=self.sorted(),
                                         icon=self.icon,
                                         updated=self.updated)
             self.states[checksum] = new_state
@@ -190,18 +317,41 @@ class FleetStateTracker:
         if additional_nodes_to_track is None:
             additional_nodes_to_track = list()
         self.additional_nodes_to_track.extend(additional_nodes_to_track)
+        for node in additional_nodes_to_track:
+            self._track_node(node)
         self._tracking = True
         self.update_fleet_state()
 
     def sorted(self):
-        nodes_to_consider = list(self._nodes.values()) + self.additional_nodes_to_track
-        return sorted(nodes_to_consider, key=lambda n: n.checksum_address)
+        return list(self._sorted_nodes.values())
+
+    def nodes_updated_since(self, checksum):
+        """
+        Returns the nodes which have been added or updated since this fleet was in the state
+        with the given checksum, or None if that state isn't in our history.
+        """
+        try:
+            previous_state = self.states[checksum]
+        except KeyError:
+            return None
+        previous_nodes = {node.checksum_address: node for node in previous_state.nodes}
+        return [node for node in self.sorted() if previous_nodes.get(node.checksum_address) is not node]
 
     def shuffled(self):
         nodes_we_know_about = list(self._nodes.values())
         random.shuffle(nodes_we_know_about)
         return nodes_we_know_about
 
+    def rendezvous_ranking(self, key: bytes):
+        """
+        All the nodes we know about, ranked by the keccak of key and each node's address
+        (highest random weight hashing).  Anyone who knows roughly the same nodes will
+        come up with roughly the same ones at the top for the same key.
+        """
+        def weight(node):
+            return keccak_digest(key, to_canonical_address(node.checksum_address))
+        return sorted(self._nodes.values(), key=weight, reverse=True)
+
     def abridged_states_dict(self):
         abridged_states = {}
         for k, v in self.states.items():
@@ -226,17 +376,40 @@ class NodeSprout(PartiallyKwargifiedBytes):
 
     def __init__(self, node_metadata):
         super().__init__(node_metadata)
-        self.checksum_address = to_checksum_address(self.public_address)
-        self.nickname = nickname_from_seed(self.checksum_address)[0]
-        self.timestamp = maya.MayaDT(self.timestamp)  # Weird for this to be in init. maybe this belongs in the splitter also.
-        self._hash = int.from_bytes(self.public_address, byteorder="big")  # stop-propagation logic (ie, only propagate verified, staked nodes) keeps this unique and BFT.
-        self._repr = f"({self.__class__.__name__})⇀{self.nickname}↽ ({self.checksum_address})"
+        # Everything derived from the metadata is computed on first access;
+        # most sprouts are discarded before anyone asks.
+        self._checksum_address = None
+        self._nickname = None
+        self._timestamp = None
+        self._hash = None
+
+    @property
+    def checksum_address(self):
+        if self._checksum_address is None:
+            self._checksum_address = to_checksum_address(self.public_address)
+        return self._checksum_address
+
+    @property
+    def nickname(self):
+        if self._nickname is None:
+            self._nickname = nickname_from_seed(self.checksum_address)[0]
+        return self._nickname
+
+    @property
+    def timestamp(self):
+        if self._timestamp is None:
+            # Going through the splitter means the raw epoch (rather than this MayaDT) is used when maturing.
+            self._timestamp = maya.MayaDT(self.__getattr__('timestamp'))
+        return self._timestamp
 
     def __hash__(self):
+        if self._hash is None:
+            # stop-propagation logic (ie, only propagate verified, staked nodes) keeps this unique and BFT.
+            self._hash = int.from_bytes(self.public_address, byteorder="big")
         return self._hash
 
     def __repr__(self):
-        return self._repr
+        return f"({self.__class__.__name__})⇀{self.nickname}↽ ({self.checksum_address})"
 
     def __bytes__(self):
         b = super().__bytes__()
@@ -275,6 +448,8 @@ class Learner:
     _LONG_LEARNING_DELAY = 90
     LEARNING_TIMEOUT = 10
     _ROUNDS_WITHOUT_NODES_AFTER_WHICH_TO_SLOW_DOWN = 10
+    teachers_per_learning_round = 1  # More than one, and the learning loop asks several teachers at once.
+    verification_workers = 1  # More than one, and eagerly learned nodes are verified concurrently.
 
     # For Keeps
     __DEFAULT_NODE_STORAGE = ForgetfulNodeStorage
@@ -319,11 +494,18 @@ class Learner:
                  node_storage=None,
                  save_metadata: bool = False,
                  abort_on_learning_error: bool = False,
-                 lonely: bool = False
+                 lonely: bool = False,
+                 teachers_per_learning_round: int = None,
+                 verification_workers: int = None,
                  ) -> None:
 
         self.log = Logger("learning-loop")  # type: Logger
 
+        if teachers_per_learning_round is not None:
+            self.teachers_per_learning_round = teachers_per_learning_round
+        if verification_workers is not None:
+            self.verification_workers = verification_workers
+
         self.learning_domains = domains
         if not self.federated_only:
             default_middleware = self.__DEFAULT_MIDDLEWARE_CLASS(registry=self.registry)
@@ -431,6 +613,19 @@ class Learner:
         # VERIFIED_CERT
         # VERIFIED_STAKE
 
+        if not self._accept_node(node):
+            return False
+
+        if eager:
+            if not self._verify_accepted_node(node, force=force_verification_recheck):
+                return False
+
+        return self._node_remembered(node, record_fleet_state=record_fleet_state)
+
+    def _accept_node(self, node) -> bool:
+        """
+        Adds the node to our known nodes, unless it is us or an outdated representation of a node we already know.
+        """
         if node == self:  # No need to remember self.
             return False
 
@@ -448,37 +643,42 @@ class Learner:
         if self.save_metadata:
             self.node_storage.store_node_metadata(node=node)
 
-        if eager:
-            node.mature()
-            stranger_certificate = node.certificate
+        return True
 
-            # Store node's certificate - It has been seen.
-            certificate_filepath = self.node_storage.store_node_certificate(certificate=stranger_certificate)
+    def _verify_accepted_node(self, node, force: bool = False) -> bool:
+        node.mature()
+        stranger_certificate = node.certificate
 
-            # In some cases (seed nodes or other temp stored certs),
-            # this will update the filepath from the temp location to this one.
-            node.certificate_filepath = certificate_filepath
+        # Store node's certificate - It has been seen.
+        certificate_filepath = self.node_storage.store_node_certificate(certificate=stranger_certificate)
 
-            try:
-                node.verify_node(force=force_verification_recheck,
-                                 network_middleware_client=self.network_middleware.client,
-                                 registry=self.registry)  # composed on character subclass, determines operating mode
-            except SSLError:
-                # TODO: Bucket this node as having bad TLS info - maybe it's an update that hasn't fully propagated?  567
-                return False
+        # In some cases (seed nodes or other temp stored certs),
+        # this will update the filepath from the temp location to this one.
+        node.certificate_filepath = certificate_filepath
 
-            except NodeSeemsToBeDown:
-                self.log.info("No Response while trying to verify node {}|{}".format(node.rest_interface, node))
-                # TODO: Bucket this node as "ghost" or something: somebody else knows about it, but we can't get to it.  567
-                return False
+        try:
+            node.verify_node(force=force,
+                             network_middleware_client=self.network_middleware.client,
+                             registry=self.registry)  # composed on character subclass, determines operating mode
+        except SSLError:
+            # TODO: Bucket this node as having bad TLS info - maybe it's an update that hasn't fully propagated?  567
+            return False
 
-            except node.NotStaking:
-                # TODO: Bucket this node as inactive, and potentially safe to forget.  567
-                self.log.info(f'Staker:Worker {node.checksum_address}:{node.worker_address} is not actively staking, skipping.')
-                return False
+        except NodeSeemsToBeDown:
+            self.log.info("No Response while trying to verify node {}|{}".format(node.rest_interface, node))
+            # TODO: Bucket this node as "ghost" or something: somebody else knows about it, but we can't get to it.  567
+            return False
+
+        except node.NotStaking:
+            # TODO: Bucket this node as inactive, and potentially safe to forget.  567
+            self.log.info(f'Staker:Worker {node.checksum_address}:{node.worker_address} is not actively staking, skipping.')
+            return False
 
-            # TODO: What about InvalidNode?  (for that matter, any SuspiciousActivity)  1714, 567 too really
+        # TODO: What about InvalidNode?  (for that matter, any SuspiciousActivity)  1714, 567 too really
 
+        return True
+
+    def _node_remembered(self, node, record_fleet_state: bool = True):
         listeners = self._learning_listeners.pop(node.checksum_address, tuple())
 
         for listener in listeners:
@@ -602,7 +802,10 @@ class Learner:
         Continually learn about new nodes.
         """
         # TODO: Allow the user to set eagerness?  1712
-        self.learn_from_teacher_node(eager=False)
+        if self.teachers_per_learning_round > 1:
+            self.learn_from_teacher_nodes(eager=False)
+        else:
+            self.learn_from_teacher_node(eager=False)
 
     def learn_about_specific_nodes(self, addresses: Set):
         self._node_ids_to_learn_about_immediately.update(addresses)  # hmmmm
@@ -773,6 +976,91 @@ class Learner:
             self.log.warn("Can't learn right now: {}".format(e.args[0]))
             return
 
+        try:
+            response = self._request_nodes_from_teacher(current_teacher)
+        finally:
+            # Is cycling happening in the right order?
+            self.cycle_teacher_node()
+
+        if response is None:
+            return
+
+        tally = Counter()
+        sprouts = self._sprouts_from_teacher_response(current_teacher, response, tally=tally)
+        if sprouts is None or sprouts is NO_KNOWN_NODES or sprouts is FLEET_STATES_MATCH:
+            return sprouts
+
+        remembered = self._remember_sprouts(sprouts, teacher=current_teacher, eager=eager, tally=tally)
+
+        learning_round_log_message = "Learning round {}.  Teacher: {} sent {} nodes; {} new, {} updated, {} already known."
+        self.log.info(learning_round_log_message.format(self._learning_round,
+                                                        current_teacher,
+                                                        len(sprouts) + tally['skipped'],
+                                                        tally['new'],
+                                                        tally['updated'],
+                                                        tally['skipped']))
+        if remembered:
+            self.known_nodes.record_fleet_state()
+        return sprouts
+
+    def learn_from_teacher_nodes(self, number_of_teachers: int = None, eager=False):
+        """
+        Sends requests to several teachers at once, merges the nodes they know about,
+        and records a single new fleet state for the round.
+        """
+        number_of_teachers = number_of_teachers or self.teachers_per_learning_round
+        self._learning_round += 1
+
+        teachers = OrderedDict()
+        try:
+            while len(teachers) < number_of_teachers:
+                teacher = self.current_teacher_node()
+                if teacher.checksum_address in teachers:
+                    break  # We've gone all the way around; there are fewer teachers than we'd like.
+                teachers[teacher.checksum_address] = teacher
+                self.cycle_teacher_node()
+        except self.NotEnoughTeachers as e:
+            if not teachers:
+                self.log.warn("Can't learn right now: {}".format(e.args[0]))
+                return
+
+        with ThreadPoolExecutor(max_workers=len(teachers)) as executor:
+            responses = list(executor.map(self._request_nodes_from_teacher, teachers.values()))
+
+        # Only the most recent representation of each node is worth remembering.
+        tally = Counter()
+        newest_sprouts = dict()
+        for teacher, response in zip(teachers.values(), responses):
+            if response is None:
+                continue
+            sprouts = self._sprouts_from_teacher_response(teacher, response, tally=tally)
+            if sprouts is None or sprouts is NO_KNOWN_NODES or sprouts is FLEET_STATES_MATCH:
+                continue
+            for sprout in sprouts:
+                with suppress(KeyError):
+                    if not sprout.timestamp > newest_sprouts[sprout.checksum_address].timestamp:
+                        continue
+                newest_sprouts[sprout.checksum_address] = sprout
+
+        sprouts = list(newest_sprouts.values())
+        remembered = self._remember_sprouts(sprouts, eager=eager, tally=tally)
+
+        learning_round_log_message = "Learning round {}.  {} teachers sent {} distinct nodes; " \
+                                     "{} new, {} updated, {} already known."
+        self.log.info(learning_round_log_message.format(self._learning_round,
+                                                        len(teachers),
+                                                        len(sprouts),
+                                                        tally['new'],
+                                                        tally['updated'],
+                                                        tally['skipped']))
+        if remembered:
+            self.known_nodes.record_fleet_state()
+        return sprouts
+
+    def _request_nodes_from_teacher(self, teacher):
+        """
+        Asks a teacher about the nodes it knows; returns the response, or None if the teacher can't help us.
+        """
         if Teacher in self.__class__.__bases__:
             announce_nodes = [self]
         else:
@@ -785,25 +1073,29 @@ class Learner:
         #
 
         try:
-            response = self.network_middleware.get_nodes_via_rest(node=current_teacher,
+            response = self.network_middleware.get_nodes_via_rest(node=teacher,
                                                                   nodes_i_need=self._node_ids_to_learn_about_immediately,
                                                                   announce_nodes=announce_nodes,
                                                                   fleet_checksum=self.known_nodes.checksum)
         except NodeSeemsToBeDown as e:
-            unresponsive_nodes.add(current_teacher)
-            self.log.info("Bad Response from teacher: {}:{}.".format(current_teacher, e))
+            unresponsive_nodes.add(teacher)
+            self.log.info("Bad Response from teacher: {}:{}.".format(teacher, e))
             return
-        except current_teacher.InvalidNode as e:
+        except teacher.InvalidNode as e:
             # Ugh.  The teacher is invalid.  Rough.
             # TODO: Bucket separately and report.
-            unresponsive_nodes.add(current_teacher)
-            self.log.info("Teacher is invalid: {}:{}.".format(current_teacher, e))
+            unresponsive_nodes.add(teacher)
+            self.log.info("Teacher is invalid: {}:{}.".format(teacher, e))
             return
 
-        finally:
-            # Is cycling happening in the right order?
-            self.cycle_teacher_node()
+        return response
 
+    def _sprouts_from_teacher_response(self, current_teacher, response, tally: Counter = None):
+        """
+        Verifies and deserializes a teacher's response, returning sprouts for the nodes in it which
+        are newer than what we know, or else NO_KNOWN_NODES, FLEET_STATES_MATCH, or None if the response
+        can't be used.  Nodes which aren't newer are counted as 'skipped' in the tally.
+        """
         # Before we parse the response, let's handle some edge cases.
         if response.status_code == 204:
             # In this case, this node knows about no other nodes.  Hopefully we've taught it something.
@@ -859,17 +1151,64 @@ class Learner:
         # so it has been removed.  When we create a new Ursula bytestring version, let's put the check
         # somewhere more performant, like mature() or verify_node().
 
-        sprouts = self.node_class.batch_from_bytes(node_payload)
+        skipped = 0
+        teacher_included = False
+
+        def already_known(canonical_address, timestamp_epoch):
+            nonlocal skipped, teacher_included
+            if canonical_address == current_teacher.canonical_public_address:
+                teacher_included = True
+            if self.known_nodes.is_up_to_date(canonical_address, timestamp_epoch):
+                skipped += 1
+                return True
+            return False
+
+        sprouts = self.node_class.batch_from_bytes(node_payload, skip=already_known)
+        if tally is not None:
+            tally['skipped'] += skipped
+
+        # A teacher sending everything it knows includes itself; one sending only the nodes updated
+        # since our fleet state doesn't, and then the payload says nothing about the size of its fleet.
+        teacher_included = teacher_included or any(s.checksum_address == current_teacher.checksum_address
+                                                   for s in sprouts)
+        if teacher_included:
+            number_of_known_nodes = len(sprouts) + skipped
+        else:
+            number_of_known_nodes = current_teacher.fleet_state_population
+
+        # Is cycling happening in the right order?
+        current_teacher.update_snapshot(checksum=checksum,
+                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
+                                        number_of_known_nodes=number_of_known_nodes)
+        return sprouts
+
+    def _remember_sprouts(self, sprouts, teacher=None, eager=False, tally: Counter = None) -> list:
+        """
+        Remembers each of the sprouts without recording a new fleet state, reporting any that fail verification.
+        Remembered nodes are counted in the tally as either 'new' or 'updated'.
+        """
+        known_addresses = self.known_nodes.addresses()
+        previously_known = {sprout.checksum_address for sprout in sprouts if sprout.checksum_address in known_addresses}
+
+        if eager and self.verification_workers > 1:
+            attempts = self._verify_sprouts_concurrently(sprouts)
+        else:
+            attempts = ((sprout, partial(self.remember_node,
+                                         sprout,
+                                         record_fleet_state=False,
+                                         # Do we want both of these to be decided by `eager`?
+                                         eager=eager))
+                        for sprout in sprouts)
+
         remembered = []
-        for sprout in sprouts:
+        for sprout, remember in attempts:
             fail_fast = True  # TODO  NRN
             try:
-                node_or_false = self.remember_node(sprout,
-                                                   record_fleet_state=False,
-                                                   # Do we want both of these to be decided by `eager`?
-                                                   eager=eager)
+                node_or_false = remember()
                 if node_or_false is not False:
                     remembered.append(node_or_false)
+                    if tally is not None:
+                        tally['updated' if sprout.checksum_address in previously_known else 'new'] += 1
 
                 #
                 # Report Failure
@@ -901,26 +1240,103 @@ class Learner:
 
             except sprout.SuspiciousActivity:
                 message = f"Suspicious Activity: Discovered sprout with bad signature: {sprout}." \
-                          f"Propagated by: {current_teacher}"
+                          f"Propagated by: {teacher}"
                 self.log.warn(message)
 
+        return remembered
 
-        # Is cycling happening in the right order?
-        current_teacher.update_snapshot(checksum=checksum,
-                                        updated=maya.MayaDT(int.from_bytes(fleet_state_updated_bytes, byteorder="big")),
-                                        number_of_known_nodes=len(sprouts))
+    def _verify_sprouts_concurrently(self, sprouts):
+        """
+        Accepts the sprouts which are new to us, then verifies them on the verification pipeline.
+        Yields each sprout as its verification completes, along with a callable which finishes
+        remembering it (or raises whatever its verification raised).
+        """
+        accepted_sprouts = [sprout for sprout in sprouts if self._accept_node(sprout)]
+        pipeline = NodeVerificationPipeline(verifier=self._verify_accepted_node,
+                                            max_workers=self.verification_workers)
 
-        ###################
+        def finish_remembering(sprout, verification):
+            if not verification.result():
+                return False
+            return self._node_remembered(sprout, record_fleet_state=False)
 
+        for sprout, verification in pipeline.verify(accepted_sprouts):
+            yield sprout, partial(finish_remembering, sprout, verification)
 
-        learning_round_log_message = "Learning round {}.  Teacher: {} knew about {} nodes, {} were new."
-        self.log.info(learning_round_log_message.format(self._learning_round,
-                                                        current_teacher,
-                                                        len(sprouts),
-                                                        len(remembered)))
-        if remembered:
-            self.known_nodes.record_fleet_state()
-        return sprouts
+
+class StakingStatusSnapshot:
+    """
+    A per-period view of who is staking, shared by all node verifications against the same registry,
+    so that verifying a fleet costs next to nothing per node instead of a handful of calls.
+
+    Locked tokens for all active stakers are fetched at once (paginated) when the period changes.
+    The current period is asked of the chain rather than worked out with our own clock, which may
+    disagree with it (e.g. after time travel on a test chain).  Stakers who aren't in the snapshot (or whose
+    next-period stake is short) aren't presumed not to be staking; the caller has to ask the chain about them.
+
+    Worker bonds are looked up as they are needed and remembered until the period is over.  A worker
+    who is unbonded, or bonded to another staker, partway through a period (like a staker who withdraws)
+    is therefore still taken to be as it was until the next one, unless verification is forced.
+    """
+
+    __snapshots = dict()
+    __snapshots_lock = Lock()
+
+    def __init__(self, registry: BaseContractRegistry) -> None:
+        self.registry = registry
+        self.period = None
+        self._locked_tokens = dict()
+        self._stakers_by_worker = dict()
+        self.__lock = Lock()
+
+    @classmethod
+    def for_registry(cls, registry: BaseContractRegistry) -> 'StakingStatusSnapshot':
+        registry_id = registry.id
+        with cls.__snapshots_lock:
+            try:
+                return cls.__snapshots[registry_id]
+            except KeyError:
+                snapshot = cls.__snapshots[registry_id] = cls(registry=registry)
+                return snapshot
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forgets the snapshots of every registry."""
+        with cls.__snapshots_lock:
+            cls.__snapshots.clear()
+
+    @property
+    def staking_agent(self) -> StakingEscrowAgent:
+        return ContractAgency.get_agent(StakingEscrowAgent, registry=self.registry)
+
+    def refresh(self) -> None:
+        current_period = self.staking_agent.get_current_period()  # <-- Blockchain CALL
+        with self.__lock:
+            if current_period == self.period:
+                return
+            _all_locked_tokens, locked_tokens = self.staking_agent.get_all_active_stakers(periods=1)  # <-- Blockchain CALL(s)
+            self._locked_tokens = locked_tokens
+            self._stakers_by_worker = dict()
+            self.period = current_period
+
+    def get_staker_from_worker(self, worker_address: str) -> str:
+        self.refresh()
+        try:
+            return self._stakers_by_worker[worker_address]
+        except KeyError:
+            staker_address = self.staking_agent.get_staker_from_worker(worker_address=worker_address)  # <-- Blockchain CALL
+            if staker_address != NULL_ADDRESS:
+                # Unbonded workers may well be bonded before the period is over.
+                self._stakers_by_worker[worker_address] = staker_address
+            return staker_address
+
+    def is_staking(self, staker_address: str, min_stake: int) -> bool:
+        """
+        True if staker_address has at least min_stake locked for the next period.  False means
+        "not as far as the snapshot knows" - their stake for the current period may still be enough.
+        """
+        self.refresh()
+        return self._locked_tokens.get(staker_address, 0) >= min_stake
 
 
 class Teacher:
@@ -928,6 +1344,7 @@ class Teacher:
     _interface_info_splitter = (int, 4, {'byteorder': 'big'})
     log = Logger("teacher")
     synchronous_query_timeout = 20  # How long to wait during REST endpoints for blockchain queries to resolve
+    known_nodes_payload_cache_size = 16  # Distinct learner fleet states to keep signed payloads for
     __DEFAULT_MIN_SEED_STAKE = 0
 
     def __init__(self,
@@ -946,12 +1363,19 @@ class Teacher:
         self.serving_domains = domains
         self.fleet_state_checksum = None
         self.fleet_state_updated = None
+        self.fleet_state_population = None
         self.last_seen = NEVER_SEEN("No Connection to Node")
 
         self.fleet_state_icon = UNKNOWN_FLEET_STATE
         self.fleet_state_nickname = UNKNOWN_FLEET_STATE
         self.fleet_state_nickname_metadata = UNKNOWN_FLEET_STATE
 
+        # Signed /node_metadata payloads, valid only for the fleet state they were made in.
+        # Served from many request threads at once, so every access to them goes through the lock.
+        self._known_nodes_payload_checksum = None
+        self._known_nodes_payloads = OrderedDict()
+        self._known_nodes_payloads_lock = Lock()
+
         #
         # Identity
         #
@@ -1031,15 +1455,68 @@ class Teacher:
         nodes_to_consider = list(self.known_nodes.values()) + [self]
         return sorted(nodes_to_consider, key=lambda n: n.checksum_address)
 
-    def bytestring_of_known_nodes(self):
+    def bytestring_of_known_nodes(self, since_fleet_state: str = None):
+        """
+        If since_fleet_state is the checksum of one of our previous fleet states, only the nodes
+        added or updated since then are included; otherwise, all known nodes are.
+        """
         payload = self.known_nodes.snapshot()
-        ursulas_as_vbytes = (VariableLengthBytestring(n) for n in self.known_nodes)
-        ursulas_as_bytes = bytes().join(bytes(u) for u in ursulas_as_vbytes)
-        ursulas_as_bytes += VariableLengthBytestring(bytes(self))
+
+        updated_nodes = None
+        if since_fleet_state:
+            updated_nodes = self.known_nodes.nodes_updated_since(since_fleet_state)
+
+        if updated_nodes is None:
+            ursulas_as_vbytes = (VariableLengthBytestring(n) for n in self.known_nodes)
+            ursulas_as_bytes = bytes().join(bytes(u) for u in ursulas_as_vbytes)
+            ursulas_as_bytes += VariableLengthBytestring(bytes(self))
+        else:
+            ursulas_as_bytes = bytes().join(bytes(VariableLengthBytestring(n)) for n in updated_nodes)
 
         payload += ursulas_as_bytes
         return payload
 
+    def signed_bytestring_of_known_nodes(self, since_fleet_state: str = None) -> bytes:
+        """
+        The signed payload served to a learner in fleet state since_fleet_state.  Payloads are
+        cached until our own fleet state changes, so that popular teachers don't re-serialize and
+        re-sign their known nodes for every request.
+        """
+        checksum = self.known_nodes.checksum
+        if since_fleet_state == checksum:
+            cache_key = FLEET_STATES_MATCH
+        elif since_fleet_state in self.known_nodes.states:
+            cache_key = since_fleet_state
+        else:
+            cache_key = None  # The learner is in a state we've never been in; they get everything.
+
+        with self._known_nodes_payloads_lock:
+            if checksum != self._known_nodes_payload_checksum:
+                self._known_nodes_payloads.clear()
+                self._known_nodes_payload_checksum = checksum
+            try:
+                signed_payload = self._known_nodes_payloads[cache_key]
+            except KeyError:
+                pass
+            else:
+                self._known_nodes_payloads.move_to_end(cache_key)
+                return signed_payload
+
+        # Serialized and signed outside of the lock, so that requests for other payloads don't wait on it.
+        if cache_key is FLEET_STATES_MATCH:
+            payload = self.known_nodes.snapshot() + bytes(FLEET_STATES_MATCH)
+        else:
+            payload = self.bytestring_of_known_nodes(since_fleet_state=cache_key)
+        signed_payload = bytes(self.stamp(payload)) + payload
+
+        with self._known_nodes_payloads_lock:
+            if checksum == self._known_nodes_payload_checksum:  # Or else, the fleet state moved on meanwhile
+                self._known_nodes_payloads[cache_key] = signed_payload
+                if len(self._known_nodes_payloads) > self.known_nodes_payload_cache_size:
+                    self._known_nodes_payloads.popitem(last=False)
+
+        return signed_payload
+
     def update_snapshot(self, checksum, updated, number_of_known_nodes):
         """
         TODO: We update the simple snapshot here, but of course if we're dealing
@@ -1055,9 +1532,13 @@ class Teacher:
         self.fleet_state_nickname, self.fleet_state_nickname_metadata = nickname_from_seed(checksum, number_of_pairs=1)
         self.fleet_state_checksum = checksum
         self.fleet_state_updated = updated
+        self.fleet_state_population = number_of_known_nodes
+        icon_kwargs = dict()
+        if number_of_known_nodes is not None:
+            icon_kwargs.update(number_of_nodes=number_of_known_nodes)
         self.fleet_state_icon = icon_from_checksum(self.fleet_state_checksum,
                                                    nickname_metadata=self.fleet_state_nickname_metadata,
-                                                   number_of_nodes=number_of_known_nodes)
+                                                   **icon_kwargs)
 
     #
     # Stamp
@@ -1077,21 +1558,23 @@ class Teacher:
                                             address=self.worker_address)
         return signature_is_valid
 
-    def _worker_is_bonded_to_staker(self, registry: BaseContractRegistry) -> bool:
+    def _worker_is_bonded_to_staker(self, registry: BaseContractRegistry, use_snapshot: bool = True) -> bool:
         """
         This method assumes the stamp's signature is valid and accurate.
         As a follow-up, this checks that the worker is bonded to a staker, but it may be
         the case that the "staker" isn't "staking" (e.g., all her tokens have been slashed).
         """
-        # Lazy agent get or create
-        staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=registry)
-
-        staker_address = staking_agent.get_staker_from_worker(worker_address=self.worker_address)
+        if use_snapshot:
+            staking_snapshot = StakingStatusSnapshot.for_registry(registry=registry)
+            staker_address = staking_snapshot.get_staker_from_worker(worker_address=self.worker_address)
+        else:
+            staking_agent = ContractAgency.get_agent(StakingEscrowAgent, registry=registry)
+            staker_address = staking_agent.get_staker_from_worker(worker_address=self.worker_address)
         if staker_address == NULL_ADDRESS:
             raise self.UnbondedWorker(f"Worker {self.worker_address} is not bonded")
         return staker_address == self.checksum_address
 
-    def _staker_is_really_staking(self, registry: BaseContractRegistry) -> bool:
+    def _staker_is_really_staking(self, registry: BaseContractRegistry, use_snapshot: bool = True) -> bool:
         """
         This method assumes the stamp's signature is valid and accurate.
         As a follow-up, this checks that the staker is, indeed, staking.
@@ -1106,12 +1589,19 @@ class Teacher:
 
         min_stake = economics.minimum_allowed_locked
 
+        # Most stakers are vouched for by this period's snapshot...
+        if use_snapshot:
+            staking_snapshot = StakingStatusSnapshot.for_registry(registry=registry)
+            if staking_snapshot.is_staking(staker_address=self.checksum_address, min_stake=min_stake):
+                return True
+
+        # ...but the ones who aren't have to be asked about directly.
         stake_current_period = staking_agent.get_locked_tokens(staker_address=self.checksum_address, periods=0)
         stake_next_period = staking_agent.get_locked_tokens(staker_address=self.checksum_address, periods=1)
         is_staking = max(stake_current_period, stake_next_period) >= min_stake
         return is_staking
 
-    def validate_worker(self, registry: BaseContractRegistry = None) -> None:
+    def validate_worker(self, registry: BaseContractRegistry = None, use_snapshot: bool = True) -> None:
 
         # Federated
         if self.federated_only:
@@ -1133,19 +1623,19 @@ class Teacher:
 
             # On-chain staking check, if registry is present
             if registry:
-                if not self._worker_is_bonded_to_staker(registry=registry):  # <-- Blockchain CALL
+                if not self._worker_is_bonded_to_staker(registry=registry, use_snapshot=use_snapshot):  # <-- Blockchain CALL
                     message = f"Worker {self.worker_address} is not bonded to staker {self.checksum_address}"
                     self.log.debug(message)
                     raise self.UnbondedWorker(message)
 
-                if self._staker_is_really_staking(registry=registry):  # <-- Blockchain CALL
+                if self._staker_is_really_staking(registry=registry, use_snapshot=use_snapshot):  # <-- Blockchain CALL
                     self.verified_worker = True
                 else:
                     raise self.NotStaking(f"Staker {self.checksum_address} is not staking")
 
             self.verified_stamp = True
 
-    def validate_metadata(self, registry: BaseContractRegistry = None):
+    def validate_metadata(self, registry: BaseContractRegistry = None, use_snapshot: bool = True):
 
         # Verify the interface signature
         if not self.verified_interface:
@@ -1157,7 +1647,7 @@ class Teacher:
 
         # Offline check of valid stamp signature by worker
         try:
-            self.validate_worker(registry=registry)
+            self.validate_worker(registry=registry, use_snapshot=use_snapshot)
         except self.WrongMode:
             if bool(registry):
                 raise
@@ -1196,8 +1686,9 @@ class Teacher:
                            "on-chain Staking verification will not be performed.")
 
         # This is both the stamp's client signature and interface metadata check; May raise InvalidNode
+        # Forcing verification means asking the chain, not this period's staking snapshot.
         try:
-            self.validate_metadata(registry=registry)
+            self.validate_metadata(registry=registry, use_snapshot=not force)
         except self.UnbondedWorker:
             self.verified_node = False
             return False
@@ -17,9 +17,10 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import binascii
 import os
-from bytestring_splitter import BytestringSplitter
+from datetime import datetime
+from bytestring_splitter import BytestringSplitter, BytestringSplittingError, VariableLengthBytestring
 from constant_sorrow import constants
-from constant_sorrow.constants import FLEET_STATES_MATCH, NO_BLOCKCHAIN_CONNECTION, NO_KNOWN_NODES
+from constant_sorrow.constants import NO_BLOCKCHAIN_CONNECTION, NO_KNOWN_NODES
 from flask import Flask, Response, jsonify, request
 from hendrix.experience import crosstown_traffic
 from jinja2 import Template, TemplateError
@@ -85,23 +86,11 @@ def make_rest_app(
 
     forgetful_node_storage = ForgetfulNodeStorage(federated_only=this_node.federated_only)
 
-    from nucypher.datastore import datastore
-    from nucypher.datastore.db import Base
-    from sqlalchemy.engine import create_engine
+    from nucypher.datastore.datastore import make_datastore
 
     log.info("Starting datastore {}".format(db_filepath))
-
-    # See: https://docs.sqlalchemy.org/en/rel_0_9/dialects/sqlite.html#connect-strings
-    if db_filepath:
-        db_uri = f'sqlite:///{db_filepath}'
-    else:
-        db_uri = 'sqlite://'  # TODO: Is this a sane default? See #667
-
-    engine = create_engine(db_uri)
-
-    Base.metadata.create_all(engine)
-    datastore = datastore.Datastore(engine)
-    db_engine = engine
+    datastore = make_datastore(db_filepath=db_filepath)
+    db_engine = datastore.engine
 
     from nucypher.characters.lawful import Alice, Ursula
     _alice_class = Alice
@@ -167,9 +156,10 @@ def make_rest_app(
         if this_node.known_nodes.checksum is NO_KNOWN_NODES:
             return Response(b"", headers=headers, status=204)
 
-        known_nodes_bytestring = this_node.bytestring_of_known_nodes()
-        signature = this_node.stamp(known_nodes_bytestring)
-        return Response(bytes(signature) + known_nodes_bytestring, headers=headers)
+        # If the learner tells us a fleet state we've been through, only send what has changed since.
+        learner_fleet_state = request.args.get('fleet')
+        signed_payload = this_node.signed_bytestring_of_known_nodes(since_fleet_state=learner_fleet_state)
+        return Response(signed_payload, headers=headers)
 
     @rest_app.route('/node_metadata', methods=["POST"])
     def node_metadata_exchange():
@@ -179,12 +169,12 @@ def make_rest_app(
         if learner_fleet_state == this_node.known_nodes.checksum:
             log.debug("Learner already knew fleet state {}; doing nothing.".format(learner_fleet_state))
             headers = {'Content-Type': 'application/octet-stream'}
-            payload = this_node.known_nodes.snapshot() + bytes(FLEET_STATES_MATCH)
-            signature = this_node.stamp(payload)
-            return Response(bytes(signature) + payload, headers=headers)
+            signed_payload = this_node.signed_bytestring_of_known_nodes(since_fleet_state=learner_fleet_state)
+            return Response(signed_payload, headers=headers)
 
         sprouts = _node_class.batch_from_bytes(request.data,
-                                             registry=this_node.registry)
+                                               registry=this_node.registry,
+                                               skip=this_node.known_nodes.is_up_to_date)
 
         # TODO: This logic is basically repeated in learn_from_teacher_node and remember_node.
         # Let's find a better way.  #555
@@ -335,20 +325,11 @@ def make_rest_app(
             log.info("KFrag successfully removed.")
             return Response(response='KFrag deleted!', status=200)
 
-    @rest_app.route('/kFrag/<id_as_hex>/reencrypt', methods=["POST"])
-    def reencrypt_via_rest(id_as_hex):
-
-        # Get Policy Arrangement
-        try:
-            arrangement_id = binascii.unhexlify(id_as_hex)
-        except (binascii.Error, TypeError):
-            return Response(response=b'Invalid arrangement ID', status=405)
-        try:
-            with ThreadedSession(db_engine) as session:
-                arrangement = datastore.get_policy_arrangement(arrangement_id=id_as_hex.encode(), session=session)
-        except NotFound:
-            return Response(response=arrangement_id, status=404)
-
+    def _reencrypt_work_order(arrangement, arrangement_id: bytes, work_order_payload: bytes):
+        """
+        Re-encrypts the WorkOrder in work_order_payload using the KFrag of an already-fetched arrangement.
+        Returns the WorkOrder along with the re-encrypted, signed bytes to send back to Bob.
+        """
         # Get KFrag
         # TODO: Yeah, well, what if this arrangement hasn't been enacted?  1702
         kfrag = KFrag.from_bytes(arrangement.kfrag)
@@ -358,7 +339,6 @@ def make_rest_app(
         alice_verifying_key_bytes = arrangement.alice_verifying_key.key_data
         alice_verifying_key = UmbralPublicKey.from_bytes(alice_verifying_key_bytes)
         alice_address = canonical_address_from_umbral_key(alice_verifying_key)
-        work_order_payload = request.data
         work_order = WorkOrder.from_rest_payload(arrangement_id=arrangement_id,
                                                  rest_payload=work_order_payload,
                                                  ursula=this_node,
@@ -366,19 +346,97 @@ def make_rest_app(
         log.info(f"Work Order from {work_order.bob}, signed {work_order.receipt_signature}")
 
         # Re-encrypt
-        response = this_node._reencrypt(kfrag=kfrag,
-                                        work_order=work_order,
-                                        alice_verifying_key=alice_verifying_key)
+        cfrag_byte_stream = this_node._reencrypt(kfrag=kfrag,
+                                                 work_order=work_order,
+                                                 alice_verifying_key=alice_verifying_key)
+        return work_order, cfrag_byte_stream
+
+    def _save_work_order(work_order):
+        this_node.datastore.save_workorder(bob_verifying_key=bytes(work_order.bob.stamp),
+                                           bob_signature=bytes(work_order.receipt_signature),
+                                           arrangement_id=work_order.arrangement_id)
+
+    @rest_app.route('/kFrag/<id_as_hex>/reencrypt', methods=["POST"])
+    def reencrypt_via_rest(id_as_hex):
+
+        # Get Policy Arrangement
+        try:
+            arrangement_id = binascii.unhexlify(id_as_hex)
+        except (binascii.Error, TypeError):
+            return Response(response=b'Invalid arrangement ID', status=405)
+        try:
+            with ThreadedSession(db_engine) as session:
+                arrangement = datastore.get_policy_arrangement(arrangement_id=id_as_hex.encode(), session=session)
+        except NotFound:
+            return Response(response=arrangement_id, status=404)
+
+        work_order, response = _reencrypt_work_order(arrangement=arrangement,
+                                                     arrangement_id=arrangement_id,
+                                                     work_order_payload=request.data)
 
         # Now, Ursula saves this workorder to her database...
         with ThreadedSession(db_engine):
-            this_node.datastore.save_workorder(bob_verifying_key=bytes(work_order.bob.stamp),
-                                               bob_signature=bytes(work_order.receipt_signature),
-                                               arrangement_id=work_order.arrangement_id)
+            _save_work_order(work_order)
 
         headers = {'Content-Type': 'application/octet-stream'}
         return Response(headers=headers, response=response)
 
+    @rest_app.route('/reencrypt', methods=["POST"])
+    def reencrypt_batch_via_rest():
+        """
+        Re-encrypts several WorkOrders, possibly for different arrangements, in a single request.
+
+        The payload is a sequence of (arrangement ID, WorkOrder payload) pairs, each framed as a
+        VariableLengthBytestring.  The response is this node's signature over the rest of the response,
+        followed by one VariableLengthBytestring per WorkOrder, in the order they were received.
+        An empty entry means that this node couldn't service that WorkOrder.
+        """
+        work_order_splitter = BytestringSplitter(VariableLengthBytestring, VariableLengthBytestring)
+        try:
+            work_order_payloads = work_order_splitter.repeat(request.data)
+        except BytestringSplittingError:
+            return Response(response=b'Invalid batch of WorkOrders', status=400)
+
+        # One pass over the datastore for the whole batch...
+        arrangements = dict()
+        with ThreadedSession(db_engine) as session:
+            for arrangement_id, _work_order_payload in work_order_payloads:
+                if arrangement_id in arrangements:
+                    continue
+                try:
+                    arrangements[arrangement_id] = datastore.get_policy_arrangement(arrangement_id=arrangement_id.hex().encode(),
+                                                                                    session=session)
+                except NotFound:
+                    log.info(f"No arrangement {arrangement_id.hex()} for batched WorkOrder.")
+                    arrangements[arrangement_id] = None
+
+        # ...then re-encrypt everything we can.
+        work_orders, cfrag_byte_streams = list(), list()
+        for arrangement_id, work_order_payload in work_order_payloads:
+            arrangement = arrangements[arrangement_id]
+            if arrangement is None:
+                cfrag_byte_streams.append(b'')
+                continue
+            try:
+                work_order, cfrag_byte_stream = _reencrypt_work_order(arrangement=arrangement,
+                                                                      arrangement_id=arrangement_id,
+                                                                      work_order_payload=work_order_payload)
+            except (InvalidSignature, BytestringSplittingError) as e:
+                log.info(f"Declining batched WorkOrder for arrangement {arrangement_id.hex()}: {e}")
+                cfrag_byte_streams.append(b'')
+                continue
+            work_orders.append(work_order)
+            cfrag_byte_streams.append(cfrag_byte_stream)
+
+        # Now, Ursula saves these workorders to her database...
+        with ThreadedSession(db_engine):
+            for work_order in work_orders:
+                _save_work_order(work_order)
+
+        body = b''.join(bytes(VariableLengthBytestring(stream)) for stream in cfrag_byte_streams)
+        headers = {'Content-Type': 'application/octet-stream'}
+        return Response(headers=headers, response=bytes(this_node.stamp(body)) + body)
+
     @rest_app.route('/treasure_map/<treasure_map_id>')
     def provide_treasure_map(treasure_map_id):
         headers = {'Content-Type': 'application/octet-stream'}
@@ -387,8 +445,9 @@ def make_rest_app(
 
         try:
 
-            treasure_map = this_node.treasure_maps[treasure_map_index]
-            response = Response(bytes(treasure_map), headers=headers)
+            # Served as stored; no need to deserialize and serialize it again.
+            treasure_map_bytes = this_node.treasure_maps.get_bytes(treasure_map_index, now=datetime.now())
+            response = Response(treasure_map_bytes, headers=headers)
             log.info("{} providing TreasureMap {}".format(this_node.nickname, treasure_map_id))
 
         except KeyError:
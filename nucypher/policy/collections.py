@@ -20,14 +20,19 @@ import json
 from collections import OrderedDict
 
 import binascii
+import math
 import maya
 import msgpack
+import os
+import shutil
+import time
 from bytestring_splitter import BytestringSplitter, BytestringSplittingError, VariableLengthBytestring
 from constant_sorrow.constants import CFRAG_NOT_RETAINED, NO_DECRYPTION_PERFORMED
 from cryptography.hazmat.backends.openssl import backend
 from cryptography.hazmat.primitives import hashes
 from eth_utils import to_canonical_address, to_checksum_address
-from typing import List, Optional, Tuple
+from threading import RLock
+from typing import Dict, List, Optional, Tuple
 from umbral.cfrags import CapsuleFrag
 from umbral.config import default_params
 from umbral.curvebn import CurveBN
@@ -66,6 +71,11 @@ class TreasureMap:
         leaves Bob disoriented.
         """
 
+    class MismatchedID(Exception):
+        """
+        Raised when a TreasureMap is found under an ID other than its own.
+        """
+
     node_id_splitter = BytestringSplitter((to_checksum_address, int(PUBLIC_ADDRESS_LENGTH)), ID_LENGTH)
 
     from nucypher.crypto.signing import InvalidSignature  # Raised when the public signature (typically intended for Ursula) is not valid.
@@ -469,12 +479,205 @@ class WorkOrder:
             task.cfrag = CFRAG_NOT_RETAINED
 
 
+class RetainedCFragStorage:
+    """
+    Keeps the CFrags that Bob chose to retain on disk, one file per (Capsule, Ursula),
+    so that they survive restarts and evictions from memory.
+
+    Records older than `ttl` seconds are pruned on startup, and whenever the storage goes over
+    `max_records` or `max_bytes`, in which case the oldest records are removed until it is back
+    under PRUNE_TARGET of both, so that a full storage isn't rescanned on every save.
+    """
+
+    DEFAULT_MAX_RECORDS = 100_000
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+    PRUNE_TARGET = 0.9  # Fraction of the budget left after pruning an over-budget storage
+
+    def __init__(self,
+                 path: str,
+                 ttl: Optional[float] = None,
+                 max_records: int = DEFAULT_MAX_RECORDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES
+                 ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        os.makedirs(path, exist_ok=True)
+
+        # Running totals, recounted on every prune; records removed in between only make them high.
+        self.__records = 0
+        self.__size = 0
+        self.prune()
+
+    @staticmethod
+    def capsule_id(capsule: Capsule) -> str:
+        return keccak_digest(bytes(capsule)).hex()
+
+    def __capsule_dir(self, capsule: Capsule) -> str:
+        return os.path.join(self.path, self.capsule_id(capsule))
+
+    def save(self, capsule: Capsule, checksum_address: str, work_order: 'WorkOrder') -> None:
+        task = work_order.tasks[capsule]
+        record = msgpack.dumps((work_order.arrangement_id,
+                                work_order.alice_address,
+                                work_order.blockhash,
+                                bytes(work_order.receipt_signature),
+                                bytes(task.signature),
+                                bytes(task.cfrag),
+                                bytes(task.cfrag_signature)))
+        capsule_dir = self.__capsule_dir(capsule)
+        os.makedirs(capsule_dir, exist_ok=True)
+        filepath = os.path.join(capsule_dir, checksum_address)
+        try:
+            replaced_size = os.path.getsize(filepath)
+        except FileNotFoundError:
+            replaced_size = None
+        temp_filepath = f'{filepath}.tmp'
+        with open(temp_filepath, 'wb') as file:
+            file.write(record)
+        os.replace(temp_filepath, filepath)  # Readers never see a partially written record
+
+        if replaced_size is None:
+            self.__records += 1
+        else:
+            self.__size -= replaced_size
+        self.__size += len(record)
+        if self.__records > self.max_records or self.__size > self.max_bytes:
+            self.prune()
+
+    def prune(self) -> int:
+        """
+        Removes the expired records and, if the storage is over `max_records` or `max_bytes`,
+        the oldest ones until it is back under PRUNE_TARGET of both.  Returns the number of records removed.
+        """
+        records = list()
+        for capsule_id in os.listdir(self.path):
+            capsule_dir = os.path.join(self.path, capsule_id)
+            try:
+                filenames = os.listdir(capsule_dir)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            for filename in filenames:
+                filepath = os.path.join(capsule_dir, filename)
+                try:
+                    stat = os.stat(filepath)
+                except FileNotFoundError:
+                    continue
+                records.append((stat.st_mtime, stat.st_size, filepath))
+        records.sort()  # Oldest first
+
+        total_size = sum(size for _mtime, size, _filepath in records)
+        max_records, max_bytes = self.max_records, self.max_bytes
+        if len(records) > max_records or total_size > max_bytes:
+            max_records = math.ceil(max_records * self.PRUNE_TARGET)
+            max_bytes = math.ceil(max_bytes * self.PRUNE_TARGET)
+
+        deadline = time.time() - self.ttl if self.ttl is not None else None
+        removed = 0
+        for mtime, size, filepath in records:
+            expired = deadline is not None and mtime < deadline
+            over_budget = len(records) - removed > max_records or total_size > max_bytes
+            if not (expired or over_budget):
+                break
+            try:
+                os.remove(filepath)
+            except FileNotFoundError:
+                pass
+            removed += 1
+            total_size -= size
+            try:
+                os.rmdir(os.path.dirname(filepath))  # Only once the Capsule has no records left
+            except OSError:
+                pass
+
+        self.__records = len(records) - removed
+        self.__size = total_size
+        return removed
+
+    def load(self, capsule: Capsule, bob: Bob, ursulas) -> Dict[str, 'WorkOrder']:
+        """
+        Rebuilds single-task WorkOrders for the retained CFrags of this Capsule,
+        for the Ursulas that can be found in `ursulas`.
+        """
+        capsule_dir = self.__capsule_dir(capsule)
+        try:
+            filenames = os.listdir(capsule_dir)
+        except FileNotFoundError:
+            return dict()
+
+        work_orders = dict()
+        for checksum_address in filenames:
+            filepath = os.path.join(capsule_dir, checksum_address)
+            if self.ttl is not None and time.time() - os.path.getmtime(filepath) > self.ttl:
+                os.remove(filepath)
+                continue
+            try:
+                ursula = ursulas[checksum_address]
+            except KeyError:
+                continue  # Not a finished record, or we don't know this Ursula (yet).
+            with open(filepath, 'rb') as file:
+                record = msgpack.loads(file.read())
+            (arrangement_id, alice_address, blockhash,
+             receipt_signature, task_signature, cfrag, cfrag_signature) = record
+            task = WorkOrder.PRETask(capsule=capsule,
+                                     signature=Signature.from_bytes(task_signature),
+                                     cfrag=CapsuleFrag.from_bytes(cfrag),
+                                     cfrag_signature=Signature.from_bytes(cfrag_signature))
+            work_order = WorkOrder(bob=bob,
+                                   arrangement_id=arrangement_id,
+                                   alice_address=alice_address,
+                                   tasks=OrderedDict([(capsule, task)]),
+                                   receipt_signature=Signature.from_bytes(receipt_signature),
+                                   ursula=ursula,
+                                   blockhash=blockhash)
+            work_order.completed = maya.MayaDT(os.path.getmtime(filepath))
+            work_orders[checksum_address] = work_order
+        return work_orders
+
+    def forget(self, capsule: Capsule) -> None:
+        shutil.rmtree(self.__capsule_dir(capsule), ignore_errors=True)
+
+
 class WorkOrderHistory:
+    """
+    Bob's completed WorkOrders, indexed both by Ursula and by Capsule.
+
+    Capsules are evicted least recently used first once there are more than `max_capsules` of them,
+    once the estimated memory held exceeds `max_bytes`, or after going unused for `ttl` seconds.
+    CFrags saved as replete are also written to `storage` if one is given, from where they are
+    reloaded when their Capsule is no longer in memory.
+    """
+
+    DEFAULT_MAX_CAPSULES = 10_000
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    ENTRY_OVERHEAD = 1024  # bytes; a rough size for a Capsule, its task signatures and bookkeeping
+
+    def __init__(self,
+                 max_capsules: int = DEFAULT_MAX_CAPSULES,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttl: Optional[float] = None,
+                 storage: Optional[RetainedCFragStorage] = None,
+                 bob: Optional[Bob] = None
+                 ) -> None:
+        if storage and not bob:
+            raise ValueError("A Bob is needed to rebuild WorkOrders from stored CFrags.")
+        self.max_capsules = max_capsules
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.storage = storage
+        self.bob = bob
 
-    def __init__(self) -> None:
         self.by_ursula = {}  # type: dict
         self._latest_replete = {}
 
+        # Capsule -> {checksum address: WorkOrder}, least recently used first.
+        self.__by_capsule = OrderedDict()  # type: OrderedDict
+        self.__last_used = dict()
+        self.__sizes = dict()
+        self.__total_size = 0
+        self.__lock = RLock()
+
     def __contains__(self, item):
         assert False
 
@@ -491,31 +694,105 @@ class WorkOrderHistory:
     def ursulas(self):
         return self.by_ursula.keys()
 
+    @property
+    def capsules(self):
+        return self.__by_capsule.keys()
+
+    @property
+    def estimated_size(self) -> int:
+        return self.__total_size
+
     def most_recent_replete(self, capsule):
         """
         Returns most recent WorkOrders for each Ursula which contain a complete task (with CFrag attached) for this Capsule.
         """
-        return self._latest_replete[capsule]
+        with self.__lock:
+            self.__expire()
+            if capsule in self._latest_replete:
+                self.__touch(capsule)
+                return self._latest_replete[capsule]
+            if self.storage:
+                work_orders = self.storage.load(capsule, bob=self.bob, ursulas=self.bob.known_nodes)
+                if work_orders:
+                    for work_order in work_orders.values():
+                        self.__save(work_order, as_replete=True)
+                    replete = self._latest_replete[capsule]
+                    self.__evict_to_fit()
+                    return replete
+            raise KeyError(capsule)
 
     def save_work_order(self, work_order, as_replete=False):
-        for task in work_order.tasks.values():
-            if as_replete:
-                work_orders_for_ursula = self._latest_replete.setdefault(task.capsule, {})
-                work_orders_for_ursula[work_order.ursula.checksum_address] = work_order
-
-            work_orders_for_ursula = self.by_ursula.setdefault(work_order.ursula.checksum_address, {})
-            work_orders_for_ursula[task.capsule] = work_order
+        with self.__lock:
+            self.__save(work_order, as_replete=as_replete)
+            if as_replete and self.storage:
+                for capsule in work_order.tasks:
+                    self.storage.save(capsule, work_order.ursula.checksum_address, work_order)
+            self.__expire()
+            self.__evict_to_fit()
 
     def by_checksum_address(self, checksum_address):
         return self.by_ursula.setdefault(checksum_address, {})
 
     def by_capsule(self, capsule: Capsule):
-        ursulas_by_capsules = {}  # type: dict
-        for ursula, capsules in self.by_ursula.items():
-            for saved_capsule, work_order in capsules.items():
-                if saved_capsule == capsule:
-                    ursulas_by_capsules[ursula] = work_order
-        return ursulas_by_capsules
+        with self.__lock:
+            return dict(self.__by_capsule.get(capsule, {}))
+
+    def forget(self, capsule: Capsule) -> None:
+        """Drops every WorkOrder saved for this Capsule, from memory and storage."""
+        with self.__lock:
+            self.__evict(capsule)
+            if self.storage:
+                self.storage.forget(capsule)
+
+    def __save(self, work_order, as_replete: bool) -> None:
+        checksum_address = work_order.ursula.checksum_address
+        for capsule, task in work_order.tasks.items():
+            if as_replete:
+                work_orders_for_ursula = self._latest_replete.setdefault(capsule, {})
+                work_orders_for_ursula[checksum_address] = work_order
+
+            work_orders_for_ursula = self.by_ursula.setdefault(checksum_address, {})
+            work_orders_for_ursula[capsule] = work_order
+
+            work_orders_for_capsule = self.__by_capsule.setdefault(capsule, {})
+            previous_size = self.__sizes.get((capsule, checksum_address), 0)
+            size = self.ENTRY_OVERHEAD
+            if isinstance(task.cfrag, CapsuleFrag):
+                size += len(bytes(task.cfrag))
+            self.__sizes[(capsule, checksum_address)] = size
+            self.__total_size += size - previous_size
+            work_orders_for_capsule[checksum_address] = work_order
+            self.__touch(capsule)
+
+    def __touch(self, capsule) -> None:
+        self.__by_capsule.move_to_end(capsule)
+        self.__last_used[capsule] = time.monotonic()
+
+    def __evict(self, capsule) -> None:
+        for checksum_address in self.__by_capsule.pop(capsule, {}):
+            work_orders_for_ursula = self.by_ursula.get(checksum_address, {})
+            work_orders_for_ursula.pop(capsule, None)
+            if not work_orders_for_ursula:
+                self.by_ursula.pop(checksum_address, None)
+            self.__total_size -= self.__sizes.pop((capsule, checksum_address), 0)
+        self._latest_replete.pop(capsule, None)
+        self.__last_used.pop(capsule, None)
+
+    def __expire(self) -> None:
+        if self.ttl is None:
+            return
+        # Least recently used first, so the expired ones are all at the front.
+        deadline = time.monotonic() - self.ttl
+        while self.__by_capsule:
+            oldest = next(iter(self.__by_capsule))
+            if self.__last_used[oldest] > deadline:
+                break
+            self.__evict(oldest)
+
+    def __evict_to_fit(self) -> None:
+        while len(self.__by_capsule) > 1 and (len(self.__by_capsule) > self.max_capsules
+                                              or self.__total_size > self.max_bytes):
+            self.__evict(next(iter(self.__by_capsule)))
 
 
 class Revocation:
@@ -17,6 +17,7 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 
 import random
 from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import maya
 from abc import ABC, abstractmethod
@@ -174,6 +175,8 @@ class Policy(ABC):
     """
 
     POLICY_ID_LENGTH = 16
+    TREASURE_MAP_REPLICATION_FACTOR = 10
+    MAX_CONCURRENT_ARRANGEMENTS = 16  # No more Ursulas than this are negotiated or enacted with at once.
     _arrangement_class = NotImplemented
 
     log = Logger("Policy")
@@ -254,7 +257,12 @@ class Policy(ABC):
         """
         return keccak_digest(bytes(self.alice.stamp) + bytes(self.bob.stamp) + self.label)
 
-    def publish_treasure_map(self, network_middleware: RestMiddleware) -> dict:
+    def publish_treasure_map(self, network_middleware: RestMiddleware, replication_factor: int = None) -> dict:
+        """
+        Pushes the TreasureMap to the replication_factor nodes that rank highest for its ID
+        (see FleetStateTracker.rendezvous_ranking), which are the same ones Bob asks first.
+        Pushes run concurrently; a node that seems to be down is replaced by the next one in the ranking.
+        """
         self.treasure_map.prepare_for_publication(self.bob.public_keys(DecryptingPower),
                                                   self.bob.public_keys(SigningPower),
                                                   self.alice.stamp,
@@ -263,33 +271,53 @@ class Policy(ABC):
             # TODO: Optionally, block.
             raise RuntimeError("Alice hasn't learned of any nodes.  Thus, she can't push the TreasureMap.")
 
-        responses = dict()
-        self.log.debug(f"Pushing {self.treasure_map} to all known nodes from {self.alice}")
-        for node in self.alice.known_nodes:
-            # TODO: # 342 - It's way overkill to push this to every node we know about.  Come up with a system.
+        replication_factor = replication_factor or self.TREASURE_MAP_REPLICATION_FACTOR
+        treasure_map_id = self.treasure_map.public_id()
+        map_payload = bytes(self.treasure_map)
+        candidates = iter(self.alice.known_nodes.rendezvous_ranking(bytes.fromhex(treasure_map_id)))
 
-            try:
-                treasure_map_id = self.treasure_map.public_id()
+        def push(node):
+            # TODO: Certificate filepath needs to be looked up and passed here
+            return network_middleware.put_treasure_map_on_node(node=node,
+                                                               map_id=treasure_map_id,
+                                                               map_payload=map_payload)
 
-                # TODO: Certificate filepath needs to be looked up and passed here
-                response = network_middleware.put_treasure_map_on_node(node=node,
-                                                                       map_id=treasure_map_id,
-                                                                       map_payload=bytes(self.treasure_map))
-            except NodeSeemsToBeDown:
-                # TODO: Introduce good failure mode here if too few nodes receive the map.
-                self.log.debug(f"Failed pushing {self.treasure_map} to unresponsive {node}")
-                continue
-
-            if response.status_code == 202:
-                # TODO: #341 - Handle response wherein node already had a copy of this TreasureMap.
-                responses[node] = response
-                self.log.debug(f"{self.treasure_map} successfully pushed to {node}")
-
-            else:
-                # TODO: Do something useful here.
-                message = f"Failed pushing {self.treasure_map} to {node}, with status {response.status_code}"
-                self.log.debug(message)
-                raise RuntimeError(message)
+        responses = dict()
+        pending = dict()
+        self.log.debug(f"Pushing {self.treasure_map} to {replication_factor} nodes from {self.alice}")
+        with ThreadPoolExecutor(max_workers=replication_factor) as executor:
+
+            def push_to_more_nodes():
+                while len(responses) + len(pending) < replication_factor:
+                    node = next(candidates, None)
+                    if node is None:
+                        # TODO: Introduce good failure mode here if too few nodes receive the map.
+                        break
+                    pending[executor.submit(push, node)] = node
+
+            push_to_more_nodes()
+            while pending:
+                done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = pending.pop(future)
+                    try:
+                        response = future.result()
+                    except NodeSeemsToBeDown:
+                        self.log.debug(f"Failed pushing {self.treasure_map} to unresponsive {node}")
+                        continue
+
+                    if response.status_code == 202:
+                        # TODO: #341 - Handle response wherein node already had a copy of this TreasureMap.
+                        responses[node] = response
+                        self.log.debug(f"{self.treasure_map} successfully pushed to {node}")
+
+                    else:
+                        # TODO: Do something useful here.
+                        message = f"Failed pushing {self.treasure_map} to {node}, with status {response.status_code}"
+                        self.log.debug(message)
+                        raise RuntimeError(message)
+
+                push_to_more_nodes()
 
         return responses
 
@@ -329,47 +357,90 @@ class Policy(ABC):
                 raise self.MoreKFragsThanArrangements("Not enough accepted arrangements to assign all KFrags.")
         return
 
-    def enact(self, network_middleware, publish=True) -> dict:
-        """
-        Assign kfrags to ursulas_on_network, and distribute them via REST,
-        populating enacted_arrangements
-        """
-        for arrangement in self.__assign_kfrags():
-            arrangement_message_kit = arrangement.encrypt_payload_for_ursula()
-
-            try:
-                response = network_middleware.enact_policy(arrangement.ursula,
-                                                           arrangement.id,
-                                                           arrangement_message_kit.to_bytes())
-            except network_middleware.UnexpectedResponse as e:
-                arrangement.status = e.status
-            else:
-                arrangement.status = response.status_code
-
-            # Assuming response is what we hope for.
-            self.treasure_map.add_arrangement(arrangement)
+    def _enact_arrangement(self, network_middleware, arrangement) -> None:
+        arrangement_message_kit = arrangement.encrypt_payload_for_ursula()
 
+        try:
+            response = network_middleware.enact_policy(arrangement.ursula,
+                                                       arrangement.id,
+                                                       arrangement_message_kit.to_bytes())
+        except network_middleware.UnexpectedResponse as e:
+            arrangement.status = e.status
         else:
-            # OK, let's check: if two or more Ursulas claimed we didn't pay,
-            # we need to re-evaulate our situation here.
-            arrangement_statuses = [a.status for a in self._accepted_arrangements]
-            number_of_claims_of_freeloading = sum(status==402 for status in arrangement_statuses)
+            arrangement.status = response.status_code
 
-            if number_of_claims_of_freeloading > 2:
-                raise self.alice.NotEnoughNodes  # TODO: Clean this up and enable re-tries.
+    def _replace_arrangement(self, network_middleware, failed_arrangement):
+        """
+        Moves the KFrag of an arrangement whose Ursula seems to be down to a spare candidate
+        who accepts a new arrangement.  Returns the new arrangement, or None if no spare would do.
+        """
+        kfrag = failed_arrangement.kfrag
+        self._accepted_arrangements.discard(failed_arrangement)
+        del self._enacted_arrangements[kfrag]
 
-            self.treasure_map.check_for_sufficient_destinations()
+        while self._spare_candidates:
+            ursula = self._spare_candidates.pop()
+            arrangement = self.make_arrangement(ursula=ursula)
+            try:
+                is_accepted = self.consider_arrangement(network_middleware=network_middleware,
+                                                        ursula=ursula,
+                                                        arrangement=arrangement)
+            except NodeSeemsToBeDown:
+                continue
+            if is_accepted:
+                arrangement.kfrag = kfrag
+                self._enacted_arrangements[kfrag] = arrangement
+                return arrangement
+        return None
 
-            # TODO: Leave a note to try any failures later.
-            pass
+    def enact(self, network_middleware, publish=True) -> dict:
+        """
+        Assign kfrags to ursulas_on_network, and distribute them via REST,
+        populating enacted_arrangements
+        """
+        # All the KFrags are pushed at once; if an Ursula seems to be down, hers goes to a spare candidate.
+        arrangements = list(self.__assign_kfrags())
+        max_workers = min(max(len(arrangements), 1), self.MAX_CONCURRENT_ARRANGEMENTS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(self._enact_arrangement, network_middleware, arrangement): arrangement
+                       for arrangement in arrangements}
+            while pending:
+                done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    arrangement = pending.pop(future)
+                    try:
+                        future.result()
+                    except NodeSeemsToBeDown:
+                        self.log.debug(f"{arrangement.ursula} seems to be down; looking for a spare to enact {arrangement} with.")
+                        replacement = self._replace_arrangement(network_middleware, arrangement)
+                        if replacement is None:
+                            raise
+                        pending[executor.submit(self._enact_arrangement, network_middleware, replacement)] = replacement
+                        continue
+
+                    # Assuming response is what we hope for.
+                    self.treasure_map.add_arrangement(arrangement)
+
+        # OK, let's check: if two or more Ursulas claimed we didn't pay,
+        # we need to re-evaulate our situation here.
+        arrangement_statuses = [a.status for a in self._accepted_arrangements]
+        number_of_claims_of_freeloading = sum(status==402 for status in arrangement_statuses)
+
+        if number_of_claims_of_freeloading > 2:
+            raise self.alice.NotEnoughNodes  # TODO: Clean this up and enable re-tries.
+
+        self.treasure_map.check_for_sufficient_destinations()
+
+        # TODO: Leave a note to try any failures later.
+        pass
 
-            # ...After *all* the arrangements are enacted
-            # Create Alice's revocation kit
-            self.revocation_kit = RevocationKit(self, self.alice.stamp)
-            self.alice.add_active_policy(self)
+        # ...After *all* the arrangements are enacted
+        # Create Alice's revocation kit
+        self.revocation_kit = RevocationKit(self, self.alice.stamp)
+        self.alice.add_active_policy(self)
 
-            if publish is True:
-                return self.publish_treasure_map(network_middleware=network_middleware)
+        if publish is True:
+            return self.publish_treasure_map(network_middleware=network_middleware)
 
     def consider_arrangement(self, network_middleware, ursula, arrangement) -> bool:
         negotiation_response = network_middleware.consider_arrangement(arrangement=arrangement)
@@ -397,7 +468,6 @@ class Policy(ABC):
                  know which nodes to use.  Either pass them here or when you make ' \
                  the Policy.".format(self.n))
 
-        # TODO: One of these layers needs to add concurrency.
         self._consider_arrangements(network_middleware=network_middleware,
                                     candidate_ursulas=sampled_ursulas,
                                     *args, **kwargs)
@@ -432,36 +502,59 @@ class Policy(ABC):
                                consider_everyone: bool = False,
                                *args,
                                **kwargs) -> None:
-
-        for index, selected_ursula in enumerate(candidate_ursulas):
-            arrangement = self.make_arrangement(ursula=selected_ursula, *args, **kwargs)
-            try:
-                is_accepted = self.consider_arrangement(ursula=selected_ursula,
-                                                        arrangement=arrangement,
-                                                        network_middleware=network_middleware)
-
-            except NodeSeemsToBeDown as e:  # TODO: #355 Also catch InvalidNode here?
-                # This arrangement won't be added to the accepted bucket.
-                # If too many nodes are down, it will fail in make_arrangements.
-                # Also TODO: Prolly log this or something at this stage.
-                continue
-
-            else:
-                # Bucket the arrangements
-                if is_accepted:
-                    self.log.debug(f"Arrangement accepted by {selected_ursula}")
-                    self._accepted_arrangements.add(arrangement)
-                    accepted = len(self._accepted_arrangements)
-                    if accepted == self.n and not consider_everyone:
-                        try:
-                            spares = set(list(candidate_ursulas)[index+1::])
-                            self._spare_candidates.update(spares)
-                        except IndexError:
-                            self._spare_candidates = set()
+        """
+        Offers arrangements to as many candidates at once as there are arrangements still to be accepted
+        (or to everyone, if consider_everyone), offering another one to the next candidate whenever one is
+        rejected or the Ursula seems to be down.  Candidates left over once n are accepted become spares.
+        """
+        candidate_ursulas = list(candidate_ursulas)
+        candidates = iter(candidate_ursulas)
+        pending = dict()
+
+        def arrangements_needed() -> int:
+            if consider_everyone:
+                return len(candidate_ursulas)
+            return self.n - len(self._accepted_arrangements)
+
+        max_workers = min(max(arrangements_needed(), 1), self.MAX_CONCURRENT_ARRANGEMENTS)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+
+            def offer_more_arrangements():
+                while len(pending) < arrangements_needed():
+                    selected_ursula = next(candidates, None)
+                    if selected_ursula is None:
                         break
-                else:
-                    self.log.debug(f"Arrangement failed with {selected_ursula}")
-                    self._rejected_arrangements.add(arrangement)
+                    arrangement = self.make_arrangement(ursula=selected_ursula, *args, **kwargs)
+                    future = executor.submit(self.consider_arrangement,
+                                             ursula=selected_ursula,
+                                             arrangement=arrangement,
+                                             network_middleware=network_middleware)
+                    pending[future] = selected_ursula, arrangement
+
+            offer_more_arrangements()
+            while pending:
+                done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    selected_ursula, arrangement = pending.pop(future)
+                    try:
+                        is_accepted = future.result()
+                    except NodeSeemsToBeDown as e:  # TODO: #355 Also catch InvalidNode here?
+                        # This arrangement won't be added to the accepted bucket.
+                        # If too many nodes are down, it will fail in make_arrangements.
+                        # Also TODO: Prolly log this or something at this stage.
+                        continue
+
+                    # Bucket the arrangements
+                    if is_accepted:
+                        self.log.debug(f"Arrangement accepted by {selected_ursula}")
+                        self._accepted_arrangements.add(arrangement)
+                    else:
+                        self.log.debug(f"Arrangement failed with {selected_ursula}")
+                        self._rejected_arrangements.add(arrangement)
+                offer_more_arrangements()
+
+        # Whoever we didn't need to ask is a spare.
+        self._spare_candidates.update(candidates)
 
 
 class FederatedPolicy(Policy):
@@ -657,6 +750,10 @@ class BlockchainPolicy(Policy):
                                        duration_periods=self.duration_periods,
                                        *args, **kwargs)
 
+    def _replace_arrangement(self, network_middleware, failed_arrangement):
+        # The arrangements are already fixed in the policy transaction; there's no swapping in a spare now.
+        return None
+
     def enact(self, network_middleware, publish=True) -> dict:
         """
         Assign kfrags to ursulas_on_network, and distribute them via REST,
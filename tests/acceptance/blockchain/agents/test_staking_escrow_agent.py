@@ -22,6 +22,7 @@ from eth_utils.address import is_address, to_checksum_address
 
 from nucypher.blockchain.eth.agents import ContractAgency, StakingEscrowAgent
 from nucypher.blockchain.eth.constants import NULL_ADDRESS
+from nucypher.blockchain.eth.events import EventIndex
 from nucypher.blockchain.eth.registry import BaseContractRegistry
 from nucypher.types import StakerInfo
 from tests.constants import INSECURE_DEVELOPMENT_PASSWORD
@@ -170,6 +171,29 @@ def test_sample_stakers(agency):
     staking_agent.blockchain.is_light = light
 
 
+@pytest.mark.slow()
+@pytest.mark.usefixtures("blockchain_ursulas")
+def test_sample_stakers_for_many_policies(agency):
+    _token_agent, staking_agent, _policy_agent = agency
+
+    samples = staking_agent.sample_many(quantities=(1, 2, 3), duration=5)
+    assert [len(stakers) for stakers in samples] == [1, 2, 3]
+    assert all(len(set(stakers)) == len(stakers) for stakers in samples)
+
+    # The stake distribution is only read once per period
+    distribution = staking_agent.get_stake_distribution(duration=5)
+    assert staking_agent.get_stake_distribution(duration=5) is distribution
+    assert len(distribution) == len(staking_agent.get_all_active_stakers(periods=5)[1])
+
+
+def test_locked_tokens_projection(agency):
+    _token_agent, staking_agent, _policy_agent = agency
+
+    projection = staking_agent.get_locked_tokens_projection(periods=10)
+    for periods in range(1, 11):
+        assert projection.locked_tokens(periods) == staking_agent.get_all_locked_tokens(periods)
+
+
 def test_get_current_period(agency, testerchain):
     _token_agent, staking_agent, _policy_agent = agency
     start_period = staking_agent.get_current_period()
@@ -191,6 +215,56 @@ def test_commit_to_next_period(agency, testerchain, mock_transacting_power_activ
     assert receipt['logs'][0]['address'] == staking_agent.contract_address
 
 
+def test_index_staking_events(agency, testerchain, tmpdir):
+    _token_agent, staking_agent, _policy_agent = agency
+    staker_account, worker_account, *other = testerchain.unassigned_accounts
+
+    event_index_filepath = str(tmpdir.join(EventIndex.DEFAULT_FILENAME))
+    event_index = EventIndex(filepath=event_index_filepath, confirmations=0)
+    assert event_index.checkpoint(staking_agent) is None
+    assert event_index.sync(agents=[staking_agent]) > 0
+    assert event_index.checkpoint(staking_agent) == testerchain.client.block_number
+
+    # The index has the same commitments as the chain
+    commitments = list(event_index.query(agent=staking_agent,
+                                         event_name='CommitmentMade',
+                                         staker=staker_account))
+    on_chain = list(staking_agent.events.CommitmentMade(staker=staker_account))
+    assert commitments
+    assert [event.block_number for event in commitments] == [event.block_number for event in on_chain]
+    assert [event.args for event in commitments] == [event.args for event in on_chain]
+
+    # Syncing again doesn't index anything twice
+    assert event_index.sync(agents=[staking_agent]) == 0
+    assert len(list(event_index.query(agent=staking_agent, event_name='CommitmentMade',
+                                      staker=staker_account))) == len(commitments)
+
+    # Block ranges
+    last_commitment = commitments[-1].block_number
+    assert not list(event_index.query(agent=staking_agent,
+                                      event_name='CommitmentMade',
+                                      from_block=last_commitment + 1))
+    event_index.close()
+
+    # By default, blocks near the head are left until they have enough confirmations
+    confirmed_index = EventIndex(confirmations=EventIndex.DEFAULT_CONFIRMATIONS)
+    confirmed_index.sync(agents=[staking_agent])
+    expected_checkpoint = testerchain.client.block_number - EventIndex.DEFAULT_CONFIRMATIONS
+    assert confirmed_index.checkpoint(staking_agent) == (expected_checkpoint if expected_checkpoint >= 0 else None)
+
+    # The same contract name at another address (eg, after a redeployment) is indexed on its own
+    class RedeployedAgent:
+        blockchain = staking_agent.blockchain
+        contract = staking_agent.contract
+        contract_name = staking_agent.contract_name
+        contract_address = NULL_ADDRESS
+
+    reopened_index = EventIndex(filepath=event_index_filepath, confirmations=0)
+    assert reopened_index.checkpoint(staking_agent) == testerchain.client.block_number
+    assert reopened_index.checkpoint(RedeployedAgent()) is None
+    assert not list(reopened_index.query(agent=RedeployedAgent(), event_name='CommitmentMade'))
+
+
 @pytest.mark.slow()
 def test_get_staker_info(agency, testerchain):
     _token_agent, staking_agent, _policy_agent = agency
@@ -68,6 +68,7 @@ from nucypher.crypto.powers import TransactingPower
 from nucypher.crypto.utils import canonical_address_from_umbral_key
 from nucypher.datastore import datastore
 from nucypher.datastore.db import Base
+from nucypher.network.nodes import StakingStatusSnapshot
 from nucypher.policy.collections import IndisputableEvidence, WorkOrder
 from nucypher.utilities.logging import GlobalLoggerSettings
 from tests.constants import (
@@ -877,6 +878,13 @@ def manual_worker(testerchain):
 #
 
 # TODO : Use a pytest Flag to enable/disable this functionality
+@pytest.fixture(autouse=True, scope='function')
+def reset_staking_status_snapshots():
+    """Staking snapshots are shared per registry, so none should outlive the test that made it."""
+    yield
+    StakingStatusSnapshot.reset()
+
+
 @pytest.fixture(autouse=True, scope='function')
 def log_in_and_out_of_test(request):
     test_name = request.node.name
@@ -249,6 +249,21 @@ def test_enrico_web_character_control_encrypt_message(enrico_web_controller_test
     assert response.status_code == 400
 
 
+def test_enrico_web_character_control_encrypt_messages(enrico_web_controller_test_client):
+    messages = [b64encode(b"Message number %d" % i).decode() for i in range(3)]
+    response = enrico_web_controller_test_client.post('/encrypt_messages', data=json.dumps({'messages': messages}))
+    assert response.status_code == 200
+
+    response_data = json.loads(response.data)
+    assert len(response_data['result']['message_kits']) == len(messages)
+    assert len(response_data['result']['signatures']) == len(messages)
+    for message_kit in response_data['result']['message_kits']:
+        assert UmbralMessageKit.from_bytes(b64decode(message_kit))
+
+    response = enrico_web_controller_test_client.post('/encrypt_messages', data=json.dumps({'bad': 'input'}))
+    assert response.status_code == 400
+
+
 def test_web_character_control_lifecycle(alice_web_controller_test_client,
                                          bob_web_controller_test_client,
                                          enrico_web_controller_from_alice,
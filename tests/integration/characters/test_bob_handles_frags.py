@@ -15,6 +15,9 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import os
+import time
+
 import pytest
 import pytest_twisted
 from twisted.internet import threads
@@ -25,6 +28,7 @@ from umbral.kfrags import KFrag
 from nucypher.crypto.kits import PolicyMessageKit
 from nucypher.crypto.powers import DecryptingPower
 from nucypher.config.constants import TEMPORARY_DOMAIN
+from nucypher.policy.collections import RetainedCFragStorage, WorkOrderHistory
 from tests.utils.middleware import MockRestMiddleware, NodeIsDownMiddleware
 
 
@@ -305,6 +309,63 @@ def test_bob_remembers_that_he_has_cfrags_for_a_particular_capsule(enacted_feder
     last_capsule_on_side_channel.attach_cfrag(new_cfrag)
 
 
+def test_bob_reloads_retained_cfrags_from_storage(federated_bob, capsule_side_channel, tmpdir):
+    last_capsule_on_side_channel = capsule_side_channel.messages[-1][0].capsule
+    replete_work_orders = federated_bob._completed_work_orders.most_recent_replete(last_capsule_on_side_channel)
+    assert len(replete_work_orders) == 2
+
+    storage = RetainedCFragStorage(path=str(tmpdir))
+    history = WorkOrderHistory(storage=storage, bob=federated_bob)
+    for work_order in replete_work_orders.values():
+        history.save_work_order(work_order, as_replete=True)
+
+    # A fresh history (e.g. after a restart) finds the same CFrags on disk, without asking any Ursula.
+    fresh_history = WorkOrderHistory(storage=storage, bob=federated_bob)
+    assert len(fresh_history) == 0
+    reloaded_work_orders = fresh_history.most_recent_replete(last_capsule_on_side_channel)
+    assert reloaded_work_orders.keys() == replete_work_orders.keys()
+    for checksum_address, work_order in reloaded_work_orders.items():
+        original_task = replete_work_orders[checksum_address].tasks[last_capsule_on_side_channel]
+        reloaded_task = work_order.tasks[last_capsule_on_side_channel]
+        assert bytes(reloaded_task.cfrag) == bytes(original_task.cfrag)
+        assert work_order.receipt_signature == replete_work_orders[checksum_address].receipt_signature
+    assert len(fresh_history.by_capsule(last_capsule_on_side_channel)) == 2
+
+    fresh_history.forget(last_capsule_on_side_channel)
+    with pytest.raises(KeyError):
+        fresh_history.most_recent_replete(last_capsule_on_side_channel)
+
+
+def test_retained_cfrag_storage_is_pruned(federated_bob, capsule_side_channel, tmpdir):
+    last_capsule_on_side_channel = capsule_side_channel.messages[-1][0].capsule
+    replete_work_orders = federated_bob._completed_work_orders.most_recent_replete(last_capsule_on_side_channel)
+    assert len(replete_work_orders) == 2
+
+    # Over budget, the oldest records go first.
+    storage = RetainedCFragStorage(path=str(tmpdir), max_records=1)
+    first, second = replete_work_orders.items()
+    storage.save(last_capsule_on_side_channel, *first)
+    storage.save(last_capsule_on_side_channel, *second)
+    stored = storage.load(last_capsule_on_side_channel, bob=federated_bob, ursulas=federated_bob.known_nodes)
+    assert len(stored) == 1
+
+    # Overwriting a record doesn't count it twice.
+    storage = RetainedCFragStorage(path=str(tmpdir), max_records=2)
+    storage.save(last_capsule_on_side_channel, *first)
+    storage.save(last_capsule_on_side_channel, *first)
+    storage.save(last_capsule_on_side_channel, *second)
+    stored = storage.load(last_capsule_on_side_channel, bob=federated_bob, ursulas=federated_bob.known_nodes)
+    assert len(stored) == 2
+
+    # Expired records are removed as soon as the storage is opened again.
+    for capsule_dir in os.listdir(str(tmpdir)):
+        for filename in os.listdir(os.path.join(str(tmpdir), capsule_dir)):
+            an_hour_ago = time.time() - 3600
+            os.utime(os.path.join(str(tmpdir), capsule_dir, filename), (an_hour_ago, an_hour_ago))
+    RetainedCFragStorage(path=str(tmpdir), ttl=60)
+    assert not os.listdir(str(tmpdir))
+
+
 def test_bob_gathers_and_combines(enacted_federated_policy, federated_bob, federated_alice, capsule_side_channel):
     # The side channel delivers all that Bob needs at this point:
     # - A single MessageKit, containing a Capsule
@@ -677,3 +738,55 @@ def test_bob_retrieves_multiple_messages_in_a_single_adventure(federated_bob,
     assert b"Welcome to flippering number 0." == delivered_cleartexts[0]
     assert b"Welcome to flippering number 0." == delivered_cleartexts[1]
     assert b"Welcome to flippering number 0." == delivered_cleartexts[2]
+
+
+def test_bob_gets_cfrags_for_several_work_orders_in_a_single_request(federated_bob,
+                                                                      federated_alice,
+                                                                      federated_ursulas,
+                                                                      capsule_side_channel,
+                                                                      enacted_federated_policy):
+    from nucypher.policy.collections import WorkOrder
+
+    treasure_map = enacted_federated_policy.treasure_map
+    federated_bob.follow_treasure_map(treasure_map=treasure_map, block=True, timeout=1)
+    alices_verifying_key = federated_alice.stamp.as_umbral_pubkey()
+
+    # Bob picks a single Ursula from the map, and makes two WorkOrders for her, for two different capsules...
+    ursula_address, arrangement_id = list(treasure_map)[0]
+    ursula = federated_bob.known_nodes[ursula_address]
+    capsules = []
+    for _ in range(2):
+        message, _enrico = capsule_side_channel.reset()
+        capsule = message.capsule
+        capsule.set_correctness_keys(delegating=enacted_federated_policy.public_key,
+                                     receiving=federated_bob.public_keys(DecryptingPower),
+                                     verifying=alices_verifying_key)
+        capsules.append(capsule)
+
+    work_orders = [WorkOrder.construct_by_bob(arrangement_id=arrangement_id,
+                                              alice_verifying=alices_verifying_key,
+                                              capsules=[capsule],
+                                              ursula=ursula,
+                                              bob=federated_bob)
+                   for capsule in capsules]
+
+    # ...and a third one for an arrangement that she's never heard of.
+    bogus_work_order = WorkOrder.construct_by_bob(arrangement_id=b'\x00' * len(arrangement_id),
+                                                  alice_verifying=alices_verifying_key,
+                                                  capsules=[capsules[0]],
+                                                  ursula=ursula,
+                                                  bob=federated_bob)
+
+    # All three go to Ursula in one request.
+    cfrags = federated_bob.get_reencrypted_cfrags_in_batch(work_orders + [bogus_work_order])
+    assert len(cfrags) == 3
+
+    # The two real WorkOrders are complete, each with a single, correct CFrag.
+    for work_order, capsule, work_order_cfrags in zip(work_orders, capsules, cfrags):
+        assert work_order.completed
+        assert len(work_order_cfrags) == 1
+        assert work_order_cfrags[0].verify_correctness(capsule)
+
+    # Ursula couldn't do anything with the bogus one.
+    assert cfrags[2] is None
+    assert not bogus_work_order.completed
@@ -23,7 +23,9 @@ import time
 from constant_sorrow.constants import NO_DECRYPTION_PERFORMED
 from twisted.internet.task import Clock
 
+from nucypher.characters.control.interfaces import BobInterface
 from nucypher.characters.lawful import Bob, Enrico, Ursula
+from nucypher.crypto.api import keccak_digest
 from nucypher.policy.collections import TreasureMap
 from tests.constants import (MOCK_POLICY_DEFAULT_M, NUMBER_OF_URSULAS_IN_DEVELOPMENT_NETWORK)
 from nucypher.config.constants import TEMPORARY_DOMAIN
@@ -158,6 +160,90 @@ def test_bob_joins_policy_and_retrieves(federated_alice,
                                    )
 
 
+def test_bob_keeps_treasure_maps_in_a_persistent_cache(federated_alice, federated_ursulas, tmpdir, mocker):
+    db_filepath = str(tmpdir.join('treasure_maps.db'))
+    bob_kwargs = dict(federated_only=True,
+                      domains={TEMPORARY_DOMAIN},
+                      start_learning_now=False,
+                      network_middleware=MockRestMiddleware(),
+                      abort_on_learning_error=True,
+                      known_nodes=federated_ursulas,
+                      treasure_map_db_filepath=db_filepath)
+    bob = Bob(**bob_kwargs)
+
+    label = b'label://' + os.urandom(32)
+    federated_alice.grant(bob=bob,
+                          label=label,
+                          m=3,
+                          n=NUMBER_OF_URSULAS_IN_DEVELOPMENT_NETWORK,
+                          expiration=maya.now() + datetime.timedelta(days=5))
+    alice_verifying_key = federated_alice.stamp.as_umbral_pubkey()
+
+    # The first lookup goes to the network; the next ones don't.
+    network_lookup = mocker.spy(bob, 'get_treasure_map_from_known_ursulas')
+    treasure_map = bob.get_treasure_map(alice_verifying_key=alice_verifying_key, label=label)
+    assert bob.get_treasure_map(alice_verifying_key=alice_verifying_key, label=label) is treasure_map
+    assert network_lookup.call_count == 1
+
+    # After a restart, Bob finds the map already decrypted in his cache.
+    restarted_bob = Bob(crypto_power=bob._crypto_power, **bob_kwargs)
+    assert treasure_map.public_id() in restarted_bob.treasure_maps
+    network_lookup = mocker.spy(restarted_bob, 'get_treasure_map_from_known_ursulas')
+    cached_map = restarted_bob.get_treasure_map(alice_verifying_key=alice_verifying_key, label=label)
+    assert cached_map == treasure_map
+    assert cached_map.destinations == treasure_map.destinations
+    assert network_lookup.call_count == 0
+
+    # Once forgotten, the map is fetched from the network again.
+    restarted_bob.forget_treasure_map(alice_verifying_key=alice_verifying_key, label=label)
+    restarted_bob.get_treasure_map(alice_verifying_key=alice_verifying_key, label=label)
+    assert network_lookup.call_count == 1
+
+    # A map stored under an ID other than its own is dropped on the next restart.
+    wrong_map_id = keccak_digest(b'not the ID of this TreasureMap')
+    restarted_bob._treasure_map_store[wrong_map_id] = treasure_map
+    Bob(crypto_power=bob._crypto_power, **bob_kwargs)
+    assert wrong_map_id not in restarted_bob._treasure_map_store
+    assert bytes.fromhex(treasure_map.public_id()) in restarted_bob._treasure_map_store
+
+
+def test_bob_interface_refetches_a_stale_cached_treasure_map(federated_alice, federated_ursulas, tmpdir):
+    bob = Bob(federated_only=True,
+              domains={TEMPORARY_DOMAIN},
+              start_learning_now=False,
+              network_middleware=MockRestMiddleware(),
+              abort_on_learning_error=True,
+              known_nodes=federated_ursulas,
+              treasure_map_db_filepath=str(tmpdir.join('treasure_maps.db')))
+    bob_interface = BobInterface(character=bob)
+
+    label = b'label://' + os.urandom(32)
+    grant_kwargs = dict(bob=bob,
+                        label=label,
+                        m=3,
+                        n=NUMBER_OF_URSULAS_IN_DEVELOPMENT_NETWORK,
+                        expiration=maya.now() + datetime.timedelta(days=5))
+    policy = federated_alice.grant(**grant_kwargs)
+    enrico = Enrico.from_alice(federated_alice, label)
+
+    def retrieve(message: bytes):
+        message_kit, _signature = enrico.encrypt_message(message)
+        response = bob_interface.retrieve(label=label,
+                                          policy_encrypting_key=bytes(enrico.policy_pubkey),
+                                          alice_verifying_key=bytes(federated_alice.stamp),
+                                          message_kit=message_kit.to_bytes())
+        return response['cleartexts']
+
+    assert retrieve(b'before the revocation') == [b'before the revocation']
+
+    # Alice revokes the policy and grants the same label again.  Bob's cached map now points at revoked KFrags...
+    federated_alice.revoke(policy)
+    federated_alice.grant(**grant_kwargs)
+
+    # ...so he drops it, and finds the new one on the network.
+    assert retrieve(b'after the new grant') == [b'after the new grant']
+
+
 def test_treasure_map_serialization(enacted_federated_policy, federated_bob):
     treasure_map = enacted_federated_policy.treasure_map
     assert treasure_map.m is not None
@@ -0,0 +1,49 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import pytest
+
+from nucypher.characters.lawful import Enrico
+
+
+@pytest.mark.parametrize('parallel_encryption', (False, True))
+def test_alice_can_decrypt_a_batch(federated_alice, parallel_encryption):
+    label = b"boring batch label"
+
+    policy_pubkey = federated_alice.get_policy_encrypting_key_from_label(label)
+
+    enrico = Enrico(policy_encrypting_key=policy_pubkey,
+                    parallel_encryption=parallel_encryption,
+                    encryption_processes=2)
+
+    messages = [b"boring test message #%d" % i for i in range(100)]
+    try:
+        encrypted = list(enrico.encrypt_messages(plaintexts=iter(messages)))
+    finally:
+        enrico.disconnect()
+    assert len(encrypted) == len(messages)
+
+    # The message kits come back in order
+    for message, (message_kit, signature) in zip(messages, encrypted):
+        assert message_kit.policy_pubkey == policy_pubkey
+        cleartext = federated_alice.verify_from(stranger=enrico,
+                                                message_kit=message_kit,
+                                                signature=signature,
+                                                decrypt=True,
+                                                label=label)
+        assert cleartext == message
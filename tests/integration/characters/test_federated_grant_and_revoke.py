@@ -23,6 +23,7 @@ from umbral.kfrags import KFrag
 from nucypher.characters.lawful import Enrico
 from nucypher.crypto.api import keccak_digest
 from nucypher.policy.collections import Revocation
+from tests.utils.middleware import MockRestMiddleware, NodeIsDownMiddleware
 
 
 @pytest.mark.usefixtures('federated_ursulas')
@@ -100,6 +101,68 @@ def test_federated_alice_can_decrypt(federated_alice, federated_bob):
     assert plaintext == decrypted_data
 
 
+def test_federated_grant_with_some_ursulas_down(federated_alice, federated_bob, federated_ursulas):
+    m, n = 2, 3
+    policy_end_datetime = maya.now() + datetime.timedelta(days=5)
+    label = b"granting while some ursulas are down"
+
+    # Alice offers arrangements to everyone at once, but a couple of Ursulas are down.
+    ursulas = list(federated_ursulas)
+    down_ursulas = set(ursulas[:2])
+    original_middleware = federated_alice.network_middleware
+    federated_alice.network_middleware = NodeIsDownMiddleware()
+    for ursula in down_ursulas:
+        federated_alice.network_middleware.node_is_down(ursula)
+
+    try:
+        policy = federated_alice.grant(federated_bob, label, m=m, n=n,
+                                       expiration=policy_end_datetime,
+                                       handpicked_ursulas=set(ursulas))
+    finally:
+        federated_alice.network_middleware = original_middleware
+
+    # She still got exactly n arrangements enacted, none with the Ursulas that are down...
+    assert len(policy._enacted_arrangements) == n
+    enacted_ursulas = {arrangement.ursula for arrangement in policy._enacted_arrangements.values()}
+    assert not enacted_ursulas & down_ursulas
+
+    # ...and kept whoever she didn't need to ask as spares.
+    assert len(policy._accepted_arrangements) == n
+    assert not policy._spare_candidates & enacted_ursulas
+
+
+def test_federated_enactment_moves_kfrag_to_a_spare_when_an_ursula_is_down(federated_alice, federated_bob,
+                                                                             federated_ursulas):
+    m, n = 2, 3
+    network_middleware = MockRestMiddleware()
+    policy = federated_alice.create_policy(federated_bob,
+                                           label=b"enacting while an ursula goes down",
+                                           m=m,
+                                           n=n,
+                                           expiration=maya.now() + datetime.timedelta(days=5))
+    policy.make_arrangements(network_middleware, handpicked_ursulas=set(federated_ursulas))
+    spares = set(policy._spare_candidates)
+    assert spares
+
+    # One of the Ursulas who accepted an arrangement goes down before she gets her KFrag.
+    ursula_who_goes_down = next(iter(policy._accepted_arrangements)).ursula
+
+    class EnactmentFailsMiddleware(MockRestMiddleware):
+        def enact_policy(self, ursula, *args, **kwargs):
+            if ursula == ursula_who_goes_down:
+                raise ConnectionRefusedError(f"{ursula} is down")
+            return super().enact_policy(ursula, *args, **kwargs)
+
+    policy.enact(EnactmentFailsMiddleware(), publish=False)
+
+    # Her KFrag went to one of the spares instead, and the TreasureMap says so.
+    assert len(policy._enacted_arrangements) == n
+    destinations = set(policy.treasure_map.destinations)
+    assert len(destinations) == n
+    assert ursula_who_goes_down.checksum_address not in destinations
+    assert len(destinations & {spare.checksum_address for spare in spares}) == 1
+
+
 @pytest.mark.usefixtures('federated_ursulas')
 def test_revocation(federated_alice, federated_bob):
     m, n = 2, 3
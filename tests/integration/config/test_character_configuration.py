@@ -174,6 +174,31 @@ def test_ursula_development_configuration(federated_only=True):
         ursulas.append(ursula)
 
 
+def test_learning_modes_are_configurable():
+    config = UrsulaConfiguration(dev_mode=True,
+                                 federated_only=True,
+                                 teachers_per_learning_round=3,
+                                 verification_workers=4)
+    assert config.static_payload()['teachers_per_learning_round'] == 3
+    assert config.static_payload()['verification_workers'] == 4
+
+    ursula = config()
+    assert ursula.teachers_per_learning_round == 3
+    assert ursula.verification_workers == 4
+
+    # Characters which aren't told otherwise learn from one teacher at a time, and verify nodes one by one.
+    default_ursula = UrsulaConfiguration(dev_mode=True, federated_only=True)()
+    assert default_ursula.teachers_per_learning_round == 1
+    assert default_ursula.verification_workers == 1
+
+
+def test_bob_treasure_map_ttl_is_configurable():
+    assert BobConfiguration(dev_mode=True, federated_only=True).static_payload()['treasure_map_ttl'] == \
+           BobConfiguration.DEFAULT_TREASURE_MAP_TTL
+    config = BobConfiguration(dev_mode=True, federated_only=True, treasure_map_ttl=60)
+    assert config.static_payload()['treasure_map_ttl'] == 60
+
+
 @pytest.mark.skip("See #2016")
 def test_destroy_configuration(config,
                                test_emitter,
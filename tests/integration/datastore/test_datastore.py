@@ -15,9 +15,12 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 import pytest
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 from nucypher.datastore import datastore, keypairs
+from nucypher.datastore.threading import ThreadedSession
 
 
 @pytest.mark.usefixtures('testerchain')
@@ -75,3 +78,74 @@ def test_workorder_sqlite_datastore(test_datastore):
     deleted = test_datastore.del_workorders(arrangement_id)
     assert deleted > 0
     assert len(test_datastore.get_workorders(arrangement_id)) == 0
+
+
+def test_treasure_map_sqlite_datastore(test_datastore):
+    map_id = b'test'
+    expiration = datetime.now() + timedelta(days=1)
+
+    # Test add TreasureMap
+    test_datastore.store_treasure_map(map_id, b'a treasure map', expiration=expiration)
+
+    # Test get TreasureMap
+    assert test_datastore.get_treasure_map(map_id) == b'a treasure map'
+
+    # Storing it again replaces it
+    test_datastore.store_treasure_map(map_id, b'another treasure map', expiration=expiration)
+    assert test_datastore.get_treasure_map(map_id) == b'another treasure map'
+
+    # Test del TreasureMap
+    assert test_datastore.del_treasure_map(map_id) == 1
+    with pytest.raises(datastore.NotFound):
+        test_datastore.get_treasure_map(map_id)
+
+
+def test_treasure_map_store_evicts_and_expires(test_datastore):
+    store = datastore.TreasureMapStore(datastore=test_datastore, max_bytes=25)
+    now = datetime.now()
+
+    store.store(b'soon', b'x' * 10, expiration=now + timedelta(days=1))
+    store.store(b'later', b'y' * 10, expiration=now + timedelta(days=3))
+    assert b'soon' in store and b'later' in store
+
+    # Replacing a map doesn't count it twice.
+    store.store(b'later', b'y' * 10, expiration=now + timedelta(days=3))
+    assert b'soon' in store and b'later' in store
+
+    # Over budget: the maps closest to expiration go first, until they are back under 90% of it.
+    store.store(b'latest', b'z' * 10, expiration=now + timedelta(days=2))
+    assert b'soon' not in store
+    assert store.get_bytes(b'later') == b'y' * 10
+    assert store.get_bytes(b'latest') == b'z' * 10
+
+    # Expired maps are not found when asking as of a given time, even before they are pruned.
+    with pytest.raises(KeyError):
+        store.get_bytes(b'latest', now=now + timedelta(days=2))
+    assert store.get_bytes(b'later', now=now + timedelta(days=2)) == b'y' * 10
+    assert store.unexpired(now=now + timedelta(days=2)) == {b'later': b'y' * 10}
+
+    # Pruning removes the maps that have expired by then.
+    assert store.prune(now=now + timedelta(days=2)) == 1
+    assert b'latest' not in store
+    assert b'later' in store
+
+
+def test_in_memory_datastore_sessions_take_turns():
+    in_memory_datastore = datastore.make_datastore()
+    sessions_open, most_sessions_open = [], []
+
+    def store_a_map(n):
+        with ThreadedSession(in_memory_datastore.engine) as session:
+            sessions_open.append(n)
+            most_sessions_open.append(len(sessions_open))
+            time.sleep(0.01)
+            in_memory_datastore.store_treasure_map(bytes([n]), b'map', expiration=datetime.now() + timedelta(days=1),
+                                                   session=session)
+            sessions_open.remove(n)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(store_a_map, range(8)))
+
+    # Every thread used the one shared connection, but never at the same time.
+    assert max(most_sessions_open) == 1
+    assert len(in_memory_datastore.get_all_treasure_maps()) == 8
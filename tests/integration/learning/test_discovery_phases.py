@@ -19,11 +19,14 @@ along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 import maya
 import pytest
 import time
+from bytestring_splitter import BytestringSplittingError, VariableLengthBytestring
+from eth_utils import to_checksum_address
 from flask import Response
 from umbral.keys import UmbralPublicKey
 from unittest.mock import patch
 
 from nucypher.characters.lawful import Ursula
+from nucypher.network.nodes import FleetStateTracker
 from tests.mock.performance_mocks import (
     NotAPublicKey,
     NotARestApp,
@@ -114,3 +117,51 @@ def test_alice_verifies_ursula_just_in_time(fleet_of_highperf_mocked_ursulas, hi
     # TODO: Make some assertions about policy.
     total_verified = sum(node.verified_node for node in highperf_mocked_alice.known_nodes)
     assert total_verified == 30
+
+
+def test_sprouts_are_parsed_lazily_from_teacher_payload(federated_ursulas):
+    teacher = list(federated_ursulas)[0]
+    _checksum, _updated, node_payload = FleetStateTracker.snapshot_splitter(teacher.bytestring_of_known_nodes(),
+                                                                            return_remainder=True)
+    sprouts = Ursula.batch_from_bytes(node_payload)
+
+    # Nothing beyond the splitting has been done yet.
+    assert not any(sprout._checksum_address or sprout._timestamp for sprout in sprouts)
+
+    # Each sprout holds a copy of its own node, rather than a view of the whole payload.
+    assert all(type(bytes(sprout)) is bytes for sprout in sprouts)
+    assert all(type(sprout._original_bytes) is bytes for sprout in sprouts)
+
+    assert {sprout.checksum_address for sprout in sprouts} == {u.checksum_address for u in federated_ursulas}
+    known_timestamps = {node.checksum_address: node.timestamp for node in teacher.known_nodes}
+    known_timestamps[teacher.checksum_address] = teacher.timestamp
+    assert all(sprout.timestamp == known_timestamps[sprout.checksum_address] for sprout in sprouts)
+    assert bytes(sprouts[0]) in (bytes(node) for node in list(federated_ursulas))
+
+
+def test_malformed_nodes_are_rejected_before_they_are_remembered(federated_ursulas):
+    ursula = list(federated_ursulas)[0]
+
+    # The header is intact, but the rest of the node has been cut short.
+    truncated_node = bytes(ursula)[:-10]
+    node_payload = bytes(VariableLengthBytestring(truncated_node))
+    with pytest.raises(BytestringSplittingError):
+        Ursula.batch_from_bytes(node_payload)
+
+
+def test_batch_parsing_skips_nodes_which_are_not_newer(federated_ursulas):
+    teacher = list(federated_ursulas)[0]
+    _checksum, _updated, node_payload = FleetStateTracker.snapshot_splitter(teacher.bytestring_of_known_nodes(),
+                                                                            return_remainder=True)
+
+    skipped = []
+
+    def already_known(canonical_address, timestamp_epoch):
+        if teacher.known_nodes.is_up_to_date(canonical_address, timestamp_epoch):
+            skipped.append(canonical_address)
+            return True
+        return False
+
+    # The teacher already knows every node in its own payload, at the same timestamps.
+    assert Ursula.batch_from_bytes(node_payload, skip=already_known) == []
+    assert {to_checksum_address(address) for address in skipped} == {u.checksum_address for u in federated_ursulas}
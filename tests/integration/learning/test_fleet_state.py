@@ -16,6 +16,8 @@
 """
 
 from constant_sorrow.constants import FLEET_STATES_MATCH, NO_KNOWN_NODES
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from hendrix.experience import crosstown_traffic
 from hendrix.utils.test_utils import crosstownTaskListDecoratorFactory
@@ -124,3 +126,116 @@ def test_state_is_recorded_after_learning(federated_ursulas, ursula_federated_te
 
     assert len(states[0].nodes) == 2  # This and one other.
     assert len(states[1].nodes) == len(federated_ursulas) + 1  # Again, accounting for this Learner.
+
+
+def test_teacher_sends_only_nodes_updated_since_learner_fleet_state(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_teacher = lonely_ursula_maker().pop()
+
+    some_ursula_in_the_fleet, another_ursula_in_the_fleet = list(federated_ursulas)[:2]
+    lonely_teacher.remember_node(some_ursula_in_the_fleet)
+    checksum_after_learning_one = lonely_teacher.known_nodes.checksum
+
+    lonely_teacher.remember_node(another_ursula_in_the_fleet)
+    delta = lonely_teacher.known_nodes.nodes_updated_since(checksum_after_learning_one)
+    assert delta == [another_ursula_in_the_fleet]
+
+    # A learner in an unknown fleet state gets everything.
+    assert lonely_teacher.known_nodes.nodes_updated_since(b"Not a fleet state we've seen".hex()) is None
+    everything = lonely_teacher.bytestring_of_known_nodes(since_fleet_state=b"Not a fleet state we've seen".hex())
+    assert everything == lonely_teacher.bytestring_of_known_nodes()
+
+    only_what_changed = lonely_teacher.bytestring_of_known_nodes(since_fleet_state=checksum_after_learning_one)
+    assert len(only_what_changed) < len(everything)
+
+
+def test_signed_known_nodes_payload_is_cached_until_fleet_state_changes(federated_ursulas,
+                                                                        ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_teacher = lonely_ursula_maker().pop()
+    some_ursula_in_the_fleet, another_ursula_in_the_fleet = list(federated_ursulas)[:2]
+    lonely_teacher.remember_node(some_ursula_in_the_fleet)
+
+    first_payload = lonely_teacher.signed_bytestring_of_known_nodes()
+    assert lonely_teacher.signed_bytestring_of_known_nodes() is first_payload
+
+    match_payload = lonely_teacher.signed_bytestring_of_known_nodes(lonely_teacher.known_nodes.checksum)
+    assert match_payload.endswith(bytes(FLEET_STATES_MATCH))
+    assert lonely_teacher.signed_bytestring_of_known_nodes(lonely_teacher.known_nodes.checksum) is match_payload
+
+    # Learning about a new node produces a new fleet state, which invalidates the cache.
+    lonely_teacher.remember_node(another_ursula_in_the_fleet)
+    second_payload = lonely_teacher.signed_bytestring_of_known_nodes()
+    assert second_payload != first_payload
+    assert len(second_payload) > len(first_payload)
+
+
+def test_signed_known_nodes_are_served_from_many_threads(federated_ursulas, ursula_federated_test_config):
+    lonely_teacher = make_federated_ursulas(ursula_config=ursula_federated_test_config,
+                                            quantity=1,
+                                            know_each_other=False).pop()
+    lonely_teacher.remember_node(list(federated_ursulas)[0])
+    lonely_teacher.known_nodes_payload_cache_size = 1  # So that requests keep evicting each other's payloads
+
+    def serve(n):
+        if n % 10 == 0:
+            lonely_teacher._known_nodes_payload_checksum = None  # As if the fleet state had just changed
+        since_fleet_state = lonely_teacher.known_nodes.checksum if n % 2 else None
+        return lonely_teacher.signed_bytestring_of_known_nodes(since_fleet_state)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        payloads = list(executor.map(serve, range(200)))
+    for n, payload in enumerate(payloads):
+        assert payload.endswith(bytes(FLEET_STATES_MATCH)) == bool(n % 2)
+
+
+def test_learning_from_several_teachers_records_one_state(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_learner = lonely_ursula_maker().pop()
+
+    some_ursula_in_the_fleet, another_ursula_in_the_fleet = list(federated_ursulas)[:2]
+    lonely_learner.remember_node(some_ursula_in_the_fleet, record_fleet_state=False)
+    lonely_learner.remember_node(another_ursula_in_the_fleet)
+    assert len(lonely_learner.known_nodes.states) == 1
+
+    sprouts = lonely_learner.learn_from_teacher_nodes(number_of_teachers=2)
+
+    # Both teachers know the whole fleet, but each node is only remembered once.
+    assert len(sprouts) == len({sprout.checksum_address for sprout in sprouts})
+    assert len(lonely_learner.known_nodes) == len(federated_ursulas)
+    assert len(lonely_learner.known_nodes.states) == 2
+
+
+def test_teacher_fleet_size_is_kept_when_only_updated_nodes_are_sent(federated_ursulas, ursula_federated_test_config):
+    lonely_ursula_maker = partial(make_federated_ursulas,
+                                  ursula_config=ursula_federated_test_config,
+                                  quantity=1,
+                                  know_each_other=False)
+    lonely_teacher = lonely_ursula_maker().pop()
+    lonely_learner = lonely_ursula_maker(known_nodes=[lonely_teacher]).pop()
+    TeacherResponse = namedtuple('TeacherResponse', ('status_code', 'content'))
+
+    some_ursula_in_the_fleet, another_ursula_in_the_fleet = list(federated_ursulas)[:2]
+    lonely_teacher.remember_node(some_ursula_in_the_fleet)
+    checksum_after_learning_one = lonely_teacher.known_nodes.checksum
+
+    everything = TeacherResponse(200, lonely_teacher.signed_bytestring_of_known_nodes())
+    lonely_learner._sprouts_from_teacher_response(lonely_teacher, everything)
+    assert lonely_teacher.fleet_state_population == 2  # The teacher, and the one it knows about.
+
+    lonely_teacher.remember_node(another_ursula_in_the_fleet)
+    payload = lonely_teacher.signed_bytestring_of_known_nodes(since_fleet_state=checksum_after_learning_one)
+    sprouts = lonely_learner._sprouts_from_teacher_response(lonely_teacher, TeacherResponse(200, payload))
+    assert [sprout.checksum_address for sprout in sprouts] == [another_ursula_in_the_fleet.checksum_address]
+
+    # Only one node was sent, but the teacher's fleet didn't shrink.
+    assert lonely_teacher.fleet_state_population == 2
@@ -15,11 +15,15 @@
  along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import maya
 import pytest
+from datetime import datetime, timedelta
 
 from nucypher.characters.lawful import Ursula
 from nucypher.crypto.api import keccak_digest
+from tests.constants import MOCK_POLICY_DEFAULT_M, NUMBER_OF_URSULAS_IN_DEVELOPMENT_NETWORK
 from tests.utils.middleware import MockRestMiddleware
+from tests.utils.policy import generate_random_label
 
 
 def test_alice_creates_policy_with_correct_hrac(idle_federated_policy):
@@ -119,3 +123,50 @@ def test_alice_does_not_update_with_old_ursula_info(federated_alice, federated_u
 
     new_metadata = bytes(federated_alice.known_nodes[ursula.checksum_address])
     assert new_metadata != old_metadata
+
+
+def test_treasure_map_is_published_to_the_top_ranked_nodes_only(federated_alice, federated_bob, federated_ursulas):
+    # A policy of its own, so that the maps of the shared policy fixtures are left alone.
+    network_middleware = MockRestMiddleware()
+    policy = federated_alice.create_policy(federated_bob,
+                                           label=generate_random_label(),
+                                           m=MOCK_POLICY_DEFAULT_M,
+                                           n=NUMBER_OF_URSULAS_IN_DEVELOPMENT_NETWORK,
+                                           expiration=maya.now() + timedelta(days=5))
+    policy.make_arrangements(network_middleware, handpicked_ursulas=federated_ursulas)
+    policy.enact(network_middleware, publish=False)
+
+    alice = policy.alice
+    treasure_map_index = bytes.fromhex(policy.treasure_map.public_id())
+    assert not any(treasure_map_index in ursula.treasure_maps for ursula in federated_ursulas)
+
+    responses = policy.publish_treasure_map(network_middleware=network_middleware, replication_factor=3)
+    assert len(responses) == 3
+
+    # The map went to the three nodes ranked highest for its ID, and to nobody else...
+    ranking = alice.known_nodes.rendezvous_ranking(treasure_map_index)
+    expected_holders = {node.checksum_address for node in ranking[:3]}
+    holders = {ursula.checksum_address for ursula in federated_ursulas if treasure_map_index in ursula.treasure_maps}
+    assert holders == expected_holders
+
+    # ...which are the first ones Bob asks, since he knows the same nodes.
+    bob = policy.bob
+    bobs_ranking = bob.known_nodes.rendezvous_ranking(treasure_map_index)
+    assert {node.checksum_address for node in bobs_ranking[:3]} == expected_holders
+
+    treasure_map_from_wire = bob.get_treasure_map(alice.stamp, policy.label)
+    assert policy.treasure_map == treasure_map_from_wire
+
+
+def test_ursula_does_not_serve_an_expired_treasure_map(federated_ursulas):
+    ursula = list(federated_ursulas)[0]
+    rest_app = ursula.rest_app
+    rest_app.testing = True
+
+    map_id = keccak_digest(b"a TreasureMap which has just expired")
+    ursula.treasure_maps.store(map_id, b"the map", expiration=datetime.now() - timedelta(seconds=1))
+
+    # It hasn't been pruned yet, but it's no longer served.
+    assert ursula.treasure_maps.get_bytes(map_id) == b"the map"
+    response = rest_app.test_client().get(f'/treasure_map/{map_id.hex()}')
+    assert response.status_code == 404
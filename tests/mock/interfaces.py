@@ -18,9 +18,14 @@
 import json
 from contextlib import contextmanager
 
+from eth_abi import encode_single
+from hexbytes import HexBytes
 from typing import Union
+from web3 import Web3
+from web3.exceptions import TransactionNotFound
 
 from nucypher.blockchain.eth.clients import EthereumClient
+from nucypher.blockchain.eth.interfaces import BlockchainInterface
 from nucypher.blockchain.eth.constants import PREALLOCATION_ESCROW_CONTRACT_NAME
 from nucypher.blockchain.eth.networks import NetworksInventory
 from nucypher.blockchain.eth.registry import (BaseContractRegistry, CanonicalRegistrySource,
@@ -84,3 +89,75 @@ class MockEthereumClient(EthereumClient):
 
     def __init__(self, w3):
         super().__init__(w3, None, None, None, None)
+
+
+class MockContractFunction:
+    """A contract function which only knows the value it returns."""
+
+    def __init__(self, value=None, fn_name: str = 'mockFunction', output_type: str = 'uint256'):
+        self.value = value
+        self.fn_name = fn_name
+        self.address = '0x' + '1' * 40
+        self.abi = {'name': fn_name, 'type': 'function', 'outputs': [{'name': '', 'type': output_type}]}
+        self.web3 = Web3()
+
+    def _encode_transaction_data(self):
+        return '0x' + encode_single('uint256', self.value).hex()
+
+    def call(self, block_identifier=None):
+        return self.value
+
+
+class MockEth:
+
+    def __init__(self, pending_count: int = 0):
+        self.pending_count = pending_count
+        self.receipts = dict()
+
+    def getTransactionCount(self, address, block_identifier):
+        return self.pending_count
+
+    def getTransactionReceipt(self, txhash):
+        try:
+            return self.receipts[txhash]
+        except KeyError:
+            raise TransactionNotFound(txhash)
+
+
+class MockClient:
+
+    def __init__(self, block_number: int = 0, gas_price: int = 10, pending_count: int = 0):
+        self.w3 = type('MockWeb3', (), {'eth': MockEth(pending_count=pending_count)})()
+        self.block_number = block_number
+        self.gas_price = gas_price
+
+
+class MockBlockchainInterface:
+    """
+    Stands in for a BlockchainInterface without any backend: transactions are "broadcast"
+    by recording them, and only get a receipt once they are mined with `mine`.
+    """
+
+    InterfaceError = BlockchainInterface.InterfaceError
+
+    def __init__(self, provider=None, **client_kwargs):
+        self.provider = provider
+        self.client = MockClient(**client_kwargs)
+        self.broadcasts = list()
+
+    def build_transaction(self, contract_function, sender_address, payload, transaction_gas_limit, nonce):
+        return {'nonce': nonce, 'gasPrice': self.client.gas_price, 'gas': 100_000, 'from': sender_address}
+
+    def broadcast_transaction(self, transaction_dict, transaction_name):
+        txhash = HexBytes(len(self.broadcasts).to_bytes(32, 'big'))
+        self.broadcasts.append((txhash, dict(transaction_dict)))
+        return txhash
+
+    def verify_receipt(self, txhash, receipt):
+        if receipt['status'] == 0:
+            raise self.InterfaceError(f"{txhash.hex()} failed")
+
+    def mine(self, txhash, status: int = 1):
+        self.client.w3.eth.receipts[txhash] = {'transactionHash': txhash,
+                                               'blockNumber': self.client.block_number,
+                                               'status': status}
@@ -0,0 +1,77 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+import pytest
+from web3 import HTTPProvider
+
+from nucypher.blockchain.eth.batch import BatchedContractReader
+from tests.mock.interfaces import MockBlockchainInterface, MockContractFunction
+
+
+@pytest.fixture()
+def batch_requests(mocker):
+    requests = list()
+
+    def answer_batch(endpoint_uri, json, **kwargs):
+        requests.append(json)
+        # Answers can come in any order; here they come backwards.
+        answers = [{'jsonrpc': '2.0', 'id': request['id'], 'result': request['params'][0]['data']}
+                   for request in reversed(json)]
+        response = mocker.Mock()
+        response.json.return_value = answers
+        return response
+
+    mocker.patch('requests.post', side_effect=answer_batch)
+    return requests
+
+
+def test_batched_reads_over_http(batch_requests):
+    blockchain = MockBlockchainInterface(provider=HTTPProvider('http://localhost:8545'), block_number=42)
+    reader = BatchedContractReader(blockchain=blockchain, chunk_size=10, concurrency=2)
+
+    results = reader.call(MockContractFunction(value) for value in range(25))
+    assert results == list(range(25))
+
+    assert [len(batch) for batch in batch_requests] == [10, 10, 5]
+    for batch in batch_requests:
+        assert all(request['method'] == 'eth_call' for request in batch)
+        assert all(request['params'][1] == hex(42) for request in batch)  # Everything is read at the same block
+
+
+def test_batched_read_errors_are_raised(mocker):
+    response = mocker.Mock()
+    response.json.return_value = [{'jsonrpc': '2.0', 'id': 0, 'error': {'code': -32000, 'message': 'execution reverted'}}]
+    mocker.patch('requests.post', return_value=response)
+
+    blockchain = MockBlockchainInterface(provider=HTTPProvider('http://localhost:8545'), block_number=42)
+    reader = BatchedContractReader(blockchain=blockchain)
+    with pytest.raises(ValueError):
+        reader.call([MockContractFunction(1)])
+
+    response.json.return_value = {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': 'batches unsupported'}}
+    with pytest.raises(BatchedContractReader.BatchRequestFailed):
+        reader.call([MockContractFunction(1)])
+
+
+def test_batched_reads_without_http(batch_requests):
+    blockchain = MockBlockchainInterface(provider=object())
+    reader = BatchedContractReader(blockchain=blockchain)
+    assert reader.call(MockContractFunction(value) for value in range(5)) == list(range(5))
+    assert not batch_requests
+    assert reader.call([]) == []
@@ -0,0 +1,128 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+import time
+
+import pytest
+from twisted.logger import Logger
+
+from nucypher.characters.lawful import Bob, Ursula
+from nucypher.network.middleware import RestMiddleware
+
+
+class FakeCapsule:
+
+    def __init__(self):
+        self.cfrags = 0
+
+    def __len__(self):
+        return self.cfrags
+
+
+class FakeWorkOrder:
+
+    def __init__(self, ursula, capsules, delay=0.0, down=False):
+        self.ursula = ursula
+        self.tasks = capsules
+        self.delay = delay
+        self.down = down
+
+
+class FakeMiddleware:
+    NotFound = RestMiddleware.NotFound
+
+    def __init__(self):
+        self.requested = []
+
+    def reencrypt(self, work_order):
+        self.requested.append(work_order.ursula)
+        time.sleep(work_order.delay)
+        if work_order.down:
+            raise ConnectionRefusedError(f"{work_order.ursula} is down")
+        return work_order.ursula
+
+
+class FakeBob:
+    """
+    Just enough of Bob to drive the concurrent WorkOrder dispatch without a network.
+    """
+
+    log = Logger("fake-bob")
+
+    def __init__(self):
+        self.network_middleware = FakeMiddleware()
+        self.completed = []
+
+    def _complete_work_order(self, work_order, cfrags_and_signatures, retain_cfrags=False):
+        self.completed.append(cfrags_and_signatures)
+
+    def _attach_cfrags_from_work_order(self, work_order, capsules_to_activate, m):
+        for capsule in work_order.tasks:
+            capsule.cfrags += 1
+            if len(capsule) >= m:
+                capsules_to_activate.discard(capsule)
+        return []
+
+
+def retrieve_concurrently(bob, work_orders, capsules, m, hedge=0):
+    return Bob._get_reencrypted_cfrags_concurrently(bob,
+                                                    work_orders=work_orders,
+                                                    capsules_to_activate=set(capsules),
+                                                    m=m,
+                                                    hedge=hedge)
+
+
+def test_concurrent_retrieval_waits_only_for_the_fastest_ursulas():
+    bob = FakeBob()
+    capsules = [FakeCapsule(), FakeCapsule()]
+    work_orders = [FakeWorkOrder('slow', capsules, delay=2),
+                   FakeWorkOrder('fast-1', capsules, delay=0.1),
+                   FakeWorkOrder('fast-2', capsules, delay=0.1),
+                   FakeWorkOrder('never-asked', capsules)]
+
+    started = time.time()
+    grievances = retrieve_concurrently(bob, work_orders, capsules, m=2, hedge=1)
+
+    # Three WorkOrders were in flight at once; the two fast ones were enough, so we didn't wait for the slow one.
+    assert time.time() - started < 1
+    assert not grievances
+    assert sorted(bob.completed) == ['fast-1', 'fast-2']
+    assert 'never-asked' not in bob.network_middleware.requested
+    assert all(len(capsule) == 2 for capsule in capsules)
+
+
+def test_concurrent_retrieval_replaces_ursulas_that_are_down():
+    bob = FakeBob()
+    capsules = [FakeCapsule()]
+    work_orders = [FakeWorkOrder('down', capsules, down=True),
+                   FakeWorkOrder('up-1', capsules),
+                   FakeWorkOrder('up-2', capsules)]
+
+    retrieve_concurrently(bob, work_orders, capsules, m=2)
+    assert sorted(bob.completed) == ['up-1', 'up-2']
+    assert len(bob.network_middleware.requested) == 3
+
+
+def test_concurrent_retrieval_with_not_enough_ursulas():
+    bob = FakeBob()
+    capsules = [FakeCapsule()]
+    work_orders = [FakeWorkOrder('down', capsules, down=True),
+                   FakeWorkOrder('up', capsules)]
+
+    with pytest.raises(Ursula.NotEnoughUrsulas):
+        retrieve_concurrently(bob, work_orders, capsules, m=2)
@@ -0,0 +1,101 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+import pytest
+from constant_sorrow.constants import CONTRACT_CALL, TRANSACTION
+
+from nucypher.blockchain.eth.cache import ContractReadCache
+from nucypher.blockchain.eth.decorators import contract_api
+from tests.mock.interfaces import MockBlockchainInterface
+
+
+class FakeAgent:
+    contract_address = '0x' + '1' * 40
+
+    def __init__(self):
+        self.read_cache = None
+        self.calls = 0
+
+    @contract_api(CONTRACT_CALL)
+    def get_value(self, periods: int = 0):
+        self.calls += 1
+        return self.calls
+
+    @contract_api(CONTRACT_CALL, cacheable=False)
+    def get_random_value(self):
+        self.calls += 1
+        return self.calls
+
+    @contract_api(CONTRACT_CALL)
+    def get_values(self):
+        self.calls += 1
+        yield self.calls
+
+    @contract_api(TRANSACTION)
+    def transact(self):
+        return 'receipt'
+
+
+@pytest.fixture()
+def agent():
+    agent = FakeAgent()
+    agent.read_cache = ContractReadCache(blockchain=MockBlockchainInterface(block_number=1), block_poll_interval=0)
+    return agent
+
+
+def test_contract_calls_are_not_cached_by_default():
+    agent = FakeAgent()
+    assert agent.get_value() == 1
+    assert agent.get_value() == 2
+
+
+def test_contract_calls_are_cached_within_a_block(agent):
+    assert agent.get_value() == 1
+    assert agent.get_value() == 1
+    assert agent.get_value(periods=1) == 2
+    assert agent.get_value(periods=1) == 2
+    assert (agent.read_cache.hits, agent.read_cache.misses) == (2, 2)
+
+    agent.read_cache.blockchain.client.block_number += 1
+    assert agent.get_value() == 3
+
+
+def test_uncacheable_contract_calls(agent):
+    assert agent.get_random_value() == 1
+    assert agent.get_random_value() == 2
+    assert list(agent.get_values()) == [3]
+    assert list(agent.get_values()) == [4]
+
+
+def test_transactions_clear_contract_read_cache(agent):
+    assert agent.get_value() == 1
+    assert agent.transact() == 'receipt'
+    assert len(agent.read_cache) == 0
+    assert agent.get_value() == 2
+
+
+def test_contract_read_cache_bounds(agent):
+    agent.read_cache.max_entries = 2
+    for periods in range(3):
+        agent.get_value(periods=periods)
+    assert len(agent.read_cache) == 2
+    assert agent.get_value(periods=0) == 4  # Evicted, least recently used
+
+    agent.read_cache.ttl = 0
+    assert agent.get_value(periods=0) == 5  # Expired
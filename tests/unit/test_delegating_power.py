@@ -0,0 +1,52 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+from umbral.keys import UmbralKeyingMaterial
+
+from nucypher.crypto.powers import DecryptingPower, DelegatingPower
+
+
+def test_delegating_power_caches_label_keys(mocker):
+    keying_material = UmbralKeyingMaterial().to_bytes()
+    delegating_power = DelegatingPower(keying_material=keying_material, label_cache_size=2)
+    derive = mocker.spy(UmbralKeyingMaterial, 'derive_privkey_by_label')
+
+    decrypting_power = delegating_power.get_decrypting_power_from_label(b'label')
+    assert isinstance(decrypting_power, DecryptingPower)
+    assert delegating_power.get_pubkey_from_label(b'label') == decrypting_power.public_key()
+    assert delegating_power.get_decrypting_power_from_label(b'label') is decrypting_power
+    assert derive.call_count == 1
+
+    # The cached keys are the same as freshly derived ones
+    uncached_power = DelegatingPower(keying_material=keying_material, label_cache_size=0)
+    assert uncached_power.get_pubkey_from_label(b'label') == decrypting_power.public_key()
+
+    # The least recently used label is evicted
+    derive.reset_mock()
+    delegating_power.get_pubkey_from_label(b'another label')
+    delegating_power.get_pubkey_from_label(b'label')
+    delegating_power.get_pubkey_from_label(b'yet another label')
+    assert derive.call_count == 2
+    delegating_power.get_pubkey_from_label(b'label')
+    assert derive.call_count == 2
+    delegating_power.get_pubkey_from_label(b'another label')
+    assert derive.call_count == 3
+
+    delegating_power.forget_label_keys()
+    assert delegating_power.get_decrypting_power_from_label(b'label') is not decrypting_power
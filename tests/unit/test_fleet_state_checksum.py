@@ -0,0 +1,70 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import os
+
+from eth_utils import to_checksum_address
+
+from nucypher.network.nodes import FleetStateChecksum
+
+
+class FakeNode:
+
+    def __init__(self, payload: bytes = None):
+        self.checksum_address = to_checksum_address(os.urandom(20))
+        self.payload = payload or os.urandom(64)
+
+    def __bytes__(self):
+        return self.payload
+
+
+def test_fleet_checksum_does_not_depend_on_insertion_order():
+    nodes = [FakeNode() for _ in range(50)]
+
+    forwards = FleetStateChecksum()
+    for node in nodes:
+        forwards.add(node)
+
+    backwards = FleetStateChecksum()
+    for node in reversed(nodes):
+        backwards.add(node)
+
+    assert forwards.hexdigest() == backwards.hexdigest()
+
+
+def test_fleet_checksum_tracks_replacement_and_removal():
+    nodes = [FakeNode() for _ in range(10)]
+    fleet_checksum = FleetStateChecksum()
+    for node in nodes:
+        fleet_checksum.add(node)
+    original = fleet_checksum.hexdigest()
+
+    # A newer representation of a known node changes the checksum...
+    updated_node = FakeNode()
+    updated_node.checksum_address = nodes[0].checksum_address
+    fleet_checksum.add(updated_node)
+    assert fleet_checksum.hexdigest() != original
+
+    # ...and putting the old one back restores it.
+    fleet_checksum.add(nodes[0])
+    assert fleet_checksum.hexdigest() == original
+
+    new_node = FakeNode()
+    fleet_checksum.add(new_node)
+    assert fleet_checksum.hexdigest() != original
+    fleet_checksum.remove(new_node.checksum_address)
+    assert fleet_checksum.hexdigest() == original
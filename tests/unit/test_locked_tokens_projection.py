@@ -0,0 +1,50 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+import pytest
+
+from nucypher.blockchain.eth.agents import LockedTokensProjection
+from nucypher.types import SubStakeInfo
+
+
+def test_locked_tokens_projection_adds_up_substake_intervals():
+    current_period = 100
+    substakes = [SubStakeInfo(first_period=90, last_period=102, locked_value=5),   # Started in the past
+                 SubStakeInfo(first_period=101, last_period=103, locked_value=7),
+                 SubStakeInfo(first_period=103, last_period=65535, locked_value=11),  # Never unlocks
+                 SubStakeInfo(first_period=50, last_period=60, locked_value=13)]     # Already expired
+    projection = LockedTokensProjection(current_period=current_period, substakes=substakes, horizon=5)
+
+    assert projection.time_series() == {1: 12, 2: 12, 3: 18, 4: 11, 5: 11}
+    assert projection.locked_tokens(0) == 5
+
+    # Same as a brute-force sum over the substakes
+    for periods in range(projection.horizon + 1):
+        period = current_period + periods
+        expected = sum(value for first, last, value in substakes if first <= period <= last)
+        assert projection.locked_tokens(periods) == expected
+
+
+def test_locked_tokens_projection_range():
+    projection = LockedTokensProjection(current_period=1, substakes=[], horizon=3)
+    assert projection.time_series(start=2) == {2: 0, 3: 0}
+    with pytest.raises(ValueError):
+        projection.locked_tokens(4)
+    with pytest.raises(ValueError):
+        LockedTokensProjection(current_period=1, substakes=[], horizon=-1)
@@ -0,0 +1,60 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+import threading
+import time
+
+import pytest
+
+from nucypher.network.nodes import NodeVerificationPipeline
+
+
+def test_verification_pipeline_verifies_concurrently_with_bounded_queue():
+    lock = threading.Lock()
+    in_flight = []
+    most_in_flight = []
+
+    def slow_verifier(node):
+        with lock:
+            in_flight.append(node)
+            most_in_flight.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(node)
+        return node * 2
+
+    pipeline = NodeVerificationPipeline(verifier=slow_verifier, max_workers=4, max_pending=4)
+    results = {node: future.result() for node, future in pipeline.verify(range(20))}
+
+    assert results == {node: node * 2 for node in range(20)}
+    assert 1 < max(most_in_flight) <= 4
+
+
+def test_verification_pipeline_reports_failures_as_they_complete():
+
+    def picky_verifier(node):
+        if node % 2:
+            raise ValueError(f"{node} is odd")
+        return True
+
+    pipeline = NodeVerificationPipeline(verifier=picky_verifier, max_workers=2)
+    for node, future in pipeline.verify(range(6)):
+        if node % 2:
+            with pytest.raises(ValueError):
+                future.result()
+        else:
+            assert future.result() is True
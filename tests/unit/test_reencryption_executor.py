@@ -0,0 +1,61 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+from umbral import pre
+from umbral.keys import UmbralPrivateKey
+from umbral.signing import Signer
+
+from nucypher.crypto.reencryption import ReencryptionExecutor
+
+
+def test_reencryption_executor_matches_in_process_reencryption():
+    delegating_privkey = UmbralPrivateKey.gen_key()
+    receiving_privkey = UmbralPrivateKey.gen_key()
+    signing_privkey = UmbralPrivateKey.gen_key()
+    alice_verifying_key = signing_privkey.get_pubkey()
+
+    kfrags = pre.generate_kfrags(delegating_privkey=delegating_privkey,
+                                 receiving_pubkey=receiving_privkey.get_pubkey(),
+                                 threshold=1,
+                                 N=1,
+                                 signer=Signer(signing_privkey),
+                                 sign_delegating_key=False,
+                                 sign_receiving_key=False)
+    kfrag = kfrags[0]
+
+    capsules_and_metadata = list()
+    for i in range(3):
+        _ciphertext, capsule = pre.encrypt(delegating_privkey.get_pubkey(), b"peace at dawn")
+        capsule.set_correctness_keys(delegating=delegating_privkey.get_pubkey(),
+                                     receiving=receiving_privkey.get_pubkey(),
+                                     verifying=alice_verifying_key)
+        capsules_and_metadata.append((capsule, b"metadata %d" % i))
+
+    executor = ReencryptionExecutor(max_workers=2)
+    try:
+        cfrags = executor.reencrypt(kfrag=kfrag,
+                                    capsules_and_metadata=capsules_and_metadata,
+                                    alice_verifying_key=alice_verifying_key)
+    finally:
+        executor.shutdown()
+
+    # One CFrag per capsule, in order, each one correct and carrying its own metadata.
+    assert len(cfrags) == len(capsules_and_metadata)
+    for cfrag, (capsule, metadata) in zip(cfrags, capsules_and_metadata):
+        assert cfrag.verify_correctness(capsule)
+        assert cfrag.proof.metadata == metadata
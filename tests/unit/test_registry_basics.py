@@ -15,6 +15,8 @@ You should have received a copy of the GNU Affero General Public License
 along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+import json
+
 import pytest
 
 from nucypher.blockchain.eth.interfaces import BaseContractRegistry
@@ -79,3 +81,32 @@ def test_contract_registry(tempfile_path):
     # Check that searching for an unknown contract raises
     with pytest.raises(BaseContractRegistry.InvalidRegistry):
         test_registry.search(contract_address=test_addr)
+
+
+def test_contract_registry_is_parsed_once(tempfile_path, mocker):
+    test_registry = LocalContractRegistry(filepath=tempfile_path)
+    test_registry.enroll(contract_name='TestContract',
+                         contract_address='0xDEADBEEF',
+                         contract_abi=['fake', 'data'],
+                         contract_version='v1.0.0')
+
+    json_loads = mocker.spy(json, 'loads')
+    registry_id = test_registry.id
+    for _ in range(3):
+        assert test_registry.id == registry_id
+        assert list(test_registry.enrolled_names) == ['TestContract']
+        assert test_registry.search(contract_name='TestContract', contract_version='v1.0.0')
+        assert test_registry.search(contract_address='0xDEADBEEF')
+    assert json_loads.call_count == 1
+
+    # Copies are handed out, so the cached contents can't be modified...
+    registry_data = test_registry.read()
+    registry_data.append(['AnotherContract', 'v1.0.0', '0xCAFEBABE', ['more', 'fake', 'data']])
+    assert list(test_registry.enrolled_names) == ['TestContract']
+
+    # ...but changes to the file are picked up
+    with open(tempfile_path, 'w') as registry_file:
+        registry_file.write(json.dumps(registry_data))
+    assert list(test_registry.enrolled_names) == ['TestContract', 'AnotherContract']
+    assert test_registry.search(contract_address='0xCAFEBABE')[0] == 'AnotherContract'
+    assert test_registry.id != registry_id
@@ -0,0 +1,53 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+import random
+from collections import Counter
+
+from nucypher.blockchain.eth.agents import StakeDistribution
+
+
+def test_stake_distribution_resolves_points_to_stakers():
+    distribution = StakeDistribution({'A': 3, 'B': 0, 'C': 2, 'D': 5})
+    assert len(distribution) == 4
+    assert distribution.total_stake == 10
+
+    stakers = [distribution.staker_at(point) for point in range(distribution.total_stake)]
+    assert stakers == ['A'] * 3 + ['C'] * 2 + ['D'] * 5  # Stakers with nothing locked are never selected
+
+
+def test_stake_distribution_draws_proportionally_to_stake():
+    distribution = StakeDistribution({'A': 1, 'B': 2, 'C': 7})
+    rng = random.Random(1234)
+
+    counter = Counter()
+    for _ in range(10000):
+        counter[distribution.staker_at(rng.randrange(distribution.total_stake))] += 1
+
+    assert abs(counter['A'] / 10000 - 0.1) < 0.02
+    assert abs(counter['B'] / 10000 - 0.2) < 0.02
+    assert abs(counter['C'] / 10000 - 0.7) < 0.02
+
+    assert distribution.draw(quantity=100, rng=rng) == {'A', 'B', 'C'}
+
+
+def test_empty_stake_distribution():
+    distribution = StakeDistribution(dict())
+    assert len(distribution) == 0
+    assert distribution.total_stake == 0
@@ -0,0 +1,114 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+import pytest
+
+from nucypher.blockchain.eth.agents import ContractAgency
+from nucypher.blockchain.eth.constants import NULL_ADDRESS
+from nucypher.network.nodes import StakingStatusSnapshot
+
+STAKER = '0x' + 'a' * 40
+POOR_STAKER = '0x' + 'b' * 40
+WORKER = '0x' + 'c' * 40
+
+
+class FakeRegistry:
+
+    def __init__(self, registry_id):
+        self.id = registry_id
+
+
+class FakeStakingAgent:
+
+    def __init__(self):
+        self.period = 1
+        self.bonds = {WORKER: STAKER}
+        self.calls = []
+
+    def get_current_period(self):
+        return self.period
+
+    def get_all_active_stakers(self, periods):
+        self.calls.append('get_all_active_stakers')
+        return 15, {STAKER: 10, POOR_STAKER: 5}
+
+    def get_staker_from_worker(self, worker_address):
+        self.calls.append('get_staker_from_worker')
+        return self.bonds.get(worker_address, NULL_ADDRESS)
+
+
+@pytest.fixture()
+def staking_agent(mocker):
+    agent = FakeStakingAgent()
+    mocker.patch.object(ContractAgency, 'get_agent', return_value=agent)
+    return agent
+
+
+def test_staking_status_snapshot_is_shared_per_registry(staking_agent):
+    registry = FakeRegistry('snapshot-sharing')
+    snapshot = StakingStatusSnapshot.for_registry(registry=registry)
+    assert StakingStatusSnapshot.for_registry(registry=FakeRegistry('snapshot-sharing')) is snapshot
+    assert StakingStatusSnapshot.for_registry(registry=FakeRegistry('another-registry')) is not snapshot
+
+
+def test_staking_status_snapshot_is_refreshed_once_per_period(staking_agent):
+    snapshot = StakingStatusSnapshot.for_registry(registry=FakeRegistry('snapshot-refresh'))
+
+    assert snapshot.is_staking(staker_address=STAKER, min_stake=10)
+    assert not snapshot.is_staking(staker_address=POOR_STAKER, min_stake=10)
+    assert not snapshot.is_staking(staker_address=WORKER, min_stake=10)  # Not in the snapshot
+    assert staking_agent.calls == ['get_all_active_stakers']
+
+    for _ in range(3):
+        assert snapshot.get_staker_from_worker(worker_address=WORKER) == STAKER
+    assert staking_agent.calls == ['get_all_active_stakers', 'get_staker_from_worker']
+
+    # A new period brings a new snapshot, and bonds are looked up again.
+    staking_agent.period += 1
+    staking_agent.bonds[WORKER] = POOR_STAKER
+    assert snapshot.get_staker_from_worker(worker_address=WORKER) == POOR_STAKER
+    assert staking_agent.calls == ['get_all_active_stakers', 'get_staker_from_worker'] * 2
+
+
+def test_staking_status_snapshot_does_not_remember_unbonded_workers(staking_agent):
+    snapshot = StakingStatusSnapshot.for_registry(registry=FakeRegistry('snapshot-unbonded'))
+    unbonded_worker = '0x' + 'd' * 40
+
+    assert snapshot.get_staker_from_worker(worker_address=unbonded_worker) == NULL_ADDRESS
+    staking_agent.bonds[unbonded_worker] = STAKER
+    assert snapshot.get_staker_from_worker(worker_address=unbonded_worker) == STAKER
+
+
+def test_staking_status_snapshot_follows_the_chain_period(staking_agent):
+    snapshot = StakingStatusSnapshot.for_registry(registry=FakeRegistry('snapshot-chain-period'))
+    assert snapshot.is_staking(staker_address=STAKER, min_stake=10)
+    assert snapshot.period == 1
+
+    # However far the chain's clock jumps ahead of ours, the snapshot is refreshed as soon as its period changes.
+    staking_agent.period += 30
+    assert snapshot.is_staking(staker_address=STAKER, min_stake=10)
+    assert snapshot.period == 31
+    assert staking_agent.calls == ['get_all_active_stakers'] * 2
+
+
+def test_staking_status_snapshots_can_be_reset(staking_agent):
+    registry = FakeRegistry('snapshot-reset')
+    snapshot = StakingStatusSnapshot.for_registry(registry=registry)
+    StakingStatusSnapshot.reset()
+    assert StakingStatusSnapshot.for_registry(registry=registry) is not snapshot
@@ -0,0 +1,126 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+import pytest
+
+from nucypher.blockchain.eth.transactions import TransactionPipeline
+from tests.mock.interfaces import MockBlockchainInterface, MockContractFunction
+
+
+@pytest.fixture()
+def blockchain():
+    return MockBlockchainInterface(block_number=100, pending_count=7)
+
+
+def test_pipeline_assigns_consecutive_nonces_without_waiting(blockchain):
+    pipeline = TransactionPipeline(blockchain=blockchain, sender_address='0xdeadbeef', poll_interval=0)
+    submitted = [pipeline.submit(MockContractFunction()) for _ in range(5)]
+
+    assert [transaction.nonce for transaction in submitted] == [7, 8, 9, 10, 11]
+    assert len(pipeline.pending) == 5
+
+    # Receipts come back in submission order, regardless of mining order
+    for txhash, _ in reversed(blockchain.broadcasts):
+        blockchain.mine(txhash)
+    receipts = pipeline.wait()
+    assert [receipt['transactionHash'] for receipt in receipts] == [txhash for txhash, _ in blockchain.broadcasts]
+    assert not pipeline.pending
+
+
+def test_pipeline_waits_for_confirmations(blockchain):
+    pipeline = TransactionPipeline(blockchain=blockchain, sender_address='0xdeadbeef', confirmations=2)
+    transaction = pipeline.submit(MockContractFunction())
+    blockchain.mine(transaction.txhash)
+
+    pipeline.poll()
+    assert not transaction.done
+
+    blockchain.client.block_number += 2
+    pipeline.poll()
+    assert transaction.receipt['transactionHash'] == transaction.txhash
+
+
+def test_pipeline_bounds_transactions_in_flight(blockchain, mocker):
+    pipeline = TransactionPipeline(blockchain=blockchain, sender_address='0xdeadbeef', max_pending=2)
+    first = pipeline.submit(MockContractFunction())
+    pipeline.submit(MockContractFunction())
+
+    # The third submission can only go out once the first one is mined
+    sleep = mocker.patch('nucypher.blockchain.eth.transactions.time.sleep',
+                         side_effect=lambda _: blockchain.mine(first.txhash))
+    third = pipeline.submit(MockContractFunction())
+    assert sleep.call_count == 1
+    assert first.done
+    assert third.nonce == 9
+
+
+def test_pipeline_replaces_stuck_transactions(blockchain):
+    pipeline = TransactionPipeline(blockchain=blockchain,
+                                   sender_address='0xdeadbeef',
+                                   replacement_timeout=0,
+                                   max_replacements=1)
+    transaction = pipeline.submit(MockContractFunction())
+    original_hash = transaction.txhash
+
+    pipeline.poll()
+    assert transaction.replacements == 1
+    assert len(transaction.txhashes) == 2
+    replacement_hash, replacement = blockchain.broadcasts[-1]
+    assert replacement['nonce'] == transaction.nonce
+    assert replacement['gasPrice'] > blockchain.broadcasts[0][1]['gasPrice']
+
+    # No more replacements than allowed
+    pipeline.poll()
+    assert transaction.replacements == 1
+
+    # Whichever of the broadcasts gets mined settles the transaction
+    blockchain.mine(original_hash)
+    receipts = pipeline.wait()
+    assert receipts[0]['transactionHash'] == original_hash
+
+
+def test_pipeline_reports_failed_transactions(blockchain):
+    pipeline = TransactionPipeline(blockchain=blockchain, sender_address='0xdeadbeef', poll_interval=0)
+    good = pipeline.submit(MockContractFunction())
+    bad = pipeline.submit(MockContractFunction())
+    blockchain.mine(good.txhash)
+    blockchain.mine(bad.txhash, status=0)
+
+    with pytest.raises(TransactionPipeline.TransactionsFailed) as error:
+        pipeline.wait()
+    assert error.value.failed == [bad]
+    assert good.receipt is not None
+
+
+def test_pipeline_stops_submitting_after_a_timeout(blockchain):
+    pipeline = TransactionPipeline(blockchain=blockchain, sender_address='0xdeadbeef', timeout=0, poll_interval=0)
+    stuck = pipeline.submit(MockContractFunction())
+    behind = pipeline.submit(MockContractFunction())
+
+    pipeline.poll()
+    assert stuck.error is not None and behind.error is not None
+
+    # Every later nonce would wait behind the gap, so no more are issued
+    with pytest.raises(TransactionPipeline.PipelineStalled):
+        pipeline.submit(MockContractFunction())
+    assert len(blockchain.broadcasts) == 2
+
+    with pytest.raises(TransactionPipeline.TransactionsFailed) as error:
+        pipeline.wait()
+    assert error.value.failed == [stuck, behind]
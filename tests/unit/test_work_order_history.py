@@ -0,0 +1,93 @@
+"""
+This file is part of nucypher.
+
+nucypher is free software: you can redistribute it and/or modify
+it under the terms of the GNU Affero General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+nucypher is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License
+along with nucypher.  If not, see <https://www.gnu.org/licenses/>.
+"""
+
+
+
+from collections import OrderedDict
+
+import pytest
+
+from nucypher.policy.collections import WorkOrderHistory
+
+
+class FakeUrsula:
+
+    def __init__(self, checksum_address):
+        self.checksum_address = checksum_address
+
+
+class FakeTask:
+    cfrag = None
+
+
+class FakeWorkOrder:
+
+    def __init__(self, ursula, *capsules):
+        self.ursula = FakeUrsula(ursula)
+        self.tasks = OrderedDict((capsule, FakeTask()) for capsule in capsules)
+
+
+def test_work_order_history_indexes_by_capsule_and_ursula():
+    history = WorkOrderHistory()
+    first = FakeWorkOrder('ursula-1', 'capsule-a', 'capsule-b')
+    second = FakeWorkOrder('ursula-2', 'capsule-a')
+    history.save_work_order(first, as_replete=True)
+    history.save_work_order(second)
+
+    assert len(history) == 3
+    assert history.by_capsule('capsule-a') == {'ursula-1': first, 'ursula-2': second}
+    assert history.by_capsule('capsule-b') == {'ursula-1': first}
+    assert history['ursula-1'] == {'capsule-a': first, 'capsule-b': first}
+    assert history.most_recent_replete('capsule-a') == {'ursula-1': first}
+    with pytest.raises(KeyError):
+        history.most_recent_replete('capsule-c')
+
+
+def test_work_order_history_evicts_least_recently_used_capsules():
+    history = WorkOrderHistory(max_capsules=2)
+    for capsule in ('capsule-a', 'capsule-b'):
+        history.save_work_order(FakeWorkOrder('ursula-1', capsule), as_replete=True)
+
+    history.most_recent_replete('capsule-a')  # Now capsule-b is the least recently used
+    history.save_work_order(FakeWorkOrder('ursula-2', 'capsule-c'), as_replete=True)
+
+    assert set(history.capsules) == {'capsule-a', 'capsule-c'}
+    assert history.by_capsule('capsule-b') == {}
+    with pytest.raises(KeyError):
+        history.most_recent_replete('capsule-b')
+    assert set(history.ursulas) == {'ursula-1', 'ursula-2'}
+    assert len(history) == 2
+
+
+def test_work_order_history_memory_budget_and_ttl(mocker):
+    history = WorkOrderHistory(max_bytes=3 * WorkOrderHistory.ENTRY_OVERHEAD)
+    for capsule in ('capsule-a', 'capsule-b', 'capsule-c', 'capsule-d'):
+        history.save_work_order(FakeWorkOrder('ursula-1', capsule))
+    assert list(history.capsules) == ['capsule-b', 'capsule-c', 'capsule-d']
+    assert history.estimated_size == 3 * WorkOrderHistory.ENTRY_OVERHEAD
+
+    now = mocker.patch('nucypher.policy.collections.time.monotonic', return_value=1000)
+    history = WorkOrderHistory(ttl=60)
+    history.save_work_order(FakeWorkOrder('ursula-1', 'capsule-a'), as_replete=True)
+    now.return_value = 1030
+    history.save_work_order(FakeWorkOrder('ursula-1', 'capsule-b'), as_replete=True)
+    now.return_value = 1070
+    with pytest.raises(KeyError):
+        history.most_recent_replete('capsule-a')
+    assert history.most_recent_replete('capsule-b')
+    assert list(history.capsules) == ['capsule-b']
+    assert history.estimated_size == WorkOrderHistory.ENTRY_OVERHEAD